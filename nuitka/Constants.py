@@ -292,6 +292,25 @@ def isHashable(constant):
         assert False, constant_type
 
 
+def isHashSearchableConstant(constant):
+    """Can a containment test in a constant tuple or list use a set of it
+
+    That is the case for non-empty containers of values, whose type makes
+    equality only by value and in agreement with their hash, so that looking
+    up values of such types in a frozenset gives the same result.
+    """
+
+    return bool(constant) and all(
+        type(value) in _hash_searchable_types for value in constant
+    )
+
+
+if python_version < 0x300:
+    _hash_searchable_types = (str, int, long, bool, float, NoneType)
+else:
+    _hash_searchable_types = (str, int, bytes, bool, float, NoneType)
+
+
 def getUnhashableConstant(constant):
     # Too many cases and all return, that is how we do it here,
     # pylint: disable=too-many-return-statements
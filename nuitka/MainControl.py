@@ -24,8 +24,10 @@ a distribution folder.
 
 """
 
+import gc
 import os
 import sys
+import weakref
 
 from nuitka.build.DataComposerInterface import runDataComposer
 from nuitka.constants.Serialization import ConstantAccessor
@@ -37,7 +39,7 @@ from nuitka.freezer.IncludedEntryPoints import (
     setMainEntryPoint,
 )
 from nuitka.freezer.Standalone import copyDataFiles
-from nuitka.importing import Importing, Recursion
+from nuitka.importing import DirectoryIndex, Importing, Recursion
 from nuitka.Options import getPythonFlags
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PostProcessing import executePostProcessing
@@ -47,7 +49,7 @@ from nuitka.PythonVersions import (
     python_version,
     python_version_str,
 )
-from nuitka.Tracing import general, inclusion_logger
+from nuitka.Tracing import general, inclusion_logger, memory_logger
 from nuitka.tree import SyntaxErrors
 from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.FileOperations import (
@@ -59,6 +61,12 @@ from nuitka.utils.FileOperations import (
 )
 from nuitka.utils.Importing import getSharedLibrarySuffix
 from nuitka.utils.ModuleNames import ModuleName
+from nuitka.utils.PerformanceReport import (
+    enablePerformanceReport,
+    timePhase,
+    writePerformanceReport,
+)
+from nuitka.Version import getNuitkaVersion
 
 from . import ModuleRegistry, Options, OutputDirectories, TreeXML
 from .build import SconsInterface
@@ -153,6 +161,9 @@ def _createNodeTree(filename):
     # Then optimize the tree and potentially recursed modules.
     Optimization.optimize(main_module.getOutputFilename())
 
+    # Module search is done now, allow the next run to reuse directory listings.
+    DirectoryIndex.saveDirectoryIndex()
+
     if Options.isExperimental("check_xml_persistence"):
         for module in ModuleRegistry.getRootModules():
             if module.isMainModule():
@@ -244,6 +255,83 @@ def pickSourceFilenames(source_dir, modules):
 standalone_entry_points = []
 
 
+def _getTreeNodeReferences(module):
+    """Weak references to the nodes below a module that allow for them."""
+
+    result = []
+    pending = list(module.getVisitableNodes())
+
+    while pending:
+        node = pending.pop()
+
+        # Nodes with slots only do not have weak references.
+        try:
+            result.append(weakref.ref(node))
+        except TypeError:
+            pass
+
+        pending.extend(node.getVisitableNodes())
+
+    return result
+
+
+def _releaseModuleTree(module):
+    """Release the node tree of a module after generating its code.
+
+    With "--show-memory" it is verified, that this actually freed the nodes
+    and their traces, and not something still holds on to them.
+    """
+
+    if Options.isShowMemory():
+        alive_before = InstanceCounters.getAliveCount()
+        node_references = _getTreeNodeReferences(module)
+
+    module.releaseTree()
+
+    if Options.isShowMemory():
+        gc.collect()
+
+        memory_logger.info(
+            "Released tree of '%s', freeing %d of %d counted instances, "
+            "%d of %d checked nodes still alive."
+            % (
+                module.getFullName(),
+                alive_before - InstanceCounters.getAliveCount(),
+                alive_before,
+                sum(
+                    1
+                    for node_reference in node_references
+                    if node_reference() is not None
+                ),
+                len(node_references),
+            )
+        )
+
+
+def _writeUnitySourceFiles(source_dir, unity_entries, unit_count):
+    """Combine module C files into translation units of about equal size."""
+
+    units = [[] for _count in range(min(unit_count, len(unity_entries)))]
+    unit_sizes = [0] * len(units)
+
+    # Largest modules first, each to the currently smallest unit.
+    for module_name, module_identifier, filename, code_size in sorted(
+        unity_entries, key=lambda unity_entry: (-unity_entry[3], unity_entry[2])
+    ):
+        unit_index = unit_sizes.index(min(unit_sizes))
+
+        units[unit_index].append((module_name, module_identifier, filename))
+        unit_sizes[unit_index] += code_size
+
+    for unit_index, module_entries in enumerate(units):
+        writeSourceCode(
+            filename=os.path.join(source_dir, "__unity_%d.c" % (unit_index + 1)),
+            source_code=CodeGeneration.generateUnityCode(
+                sorted(module_entries, key=lambda module_entry: module_entry[2])
+            ),
+        )
+
+
 def makeSourceDirectory():
     """Get the full list of modules imported, create code for all of them."""
     # We deal with a lot of details here, but rather one by one, and split makes
@@ -292,7 +380,8 @@ def makeSourceDirectory():
     # Prepare code generation, i.e. execute finalization for it.
     for module in ModuleRegistry.getDoneModules():
         if module.isCompiledPythonModule():
-            Finalization.prepareCodeGeneration(module)
+            with timePhase("Finalization", module_name=module.getFullName()):
+                Finalization.prepareCodeGeneration(module)
 
     # Pick filenames.
     source_dir = OutputDirectories.getSourceDirectoryPath()
@@ -301,17 +390,44 @@ def makeSourceDirectory():
         source_dir=source_dir, modules=ModuleRegistry.getDoneModules()
     )
 
+    # Modules providing functions to other modules need to keep their trees
+    # until the end, all others can be released when in low memory mode.
+    if Options.isLowMemory():
+        kept_modules = set(
+            function_body.getParentModule()
+            for module in ModuleRegistry.getDoneModules()
+            if module.isCompiledPythonModule()
+            for function_body in module.getCrossUsedFunctions()
+        )
+
+    # Module name, code name, filename, and code size of module C files, to
+    # combine for unity builds.
+    unity_entries = []
+
     # Generate code for modules.
     for module in ModuleRegistry.getDoneModules():
         if module.isCompiledPythonModule():
             c_filename = module_filenames[module]
 
-            source_code = CodeGeneration.generateModuleCode(
-                module=module,
-                data_filename=os.path.basename(c_filename + "onst"),  # Really .const
+            with timePhase("Code generation", module_name=module.getFullName()):
+                source_code = CodeGeneration.generateModuleCode(
+                    module=module,
+                    data_filename=os.path.basename(c_filename + "onst"),  # Really .const
+                )
+
+                writeSourceCode(filename=c_filename, source_code=source_code)
+
+            unity_entries.append(
+                (
+                    module.getFullName(),
+                    module.getCodeName(),
+                    os.path.basename(c_filename),
+                    len(source_code),
+                )
             )
 
-            writeSourceCode(filename=c_filename, source_code=source_code)
+            if Options.isLowMemory() and module not in kept_modules:
+                _releaseModuleTree(module)
 
             if Options.isShowInclusion():
                 inclusion_logger.info(
@@ -332,12 +448,20 @@ def makeSourceDirectory():
         else:
             assert False, module
 
-    (
-        helper_decl_code,
-        helper_impl_code,
-        constants_header_code,
-        constants_body_code,
-    ) = CodeGeneration.generateHelpersCode()
+    if Options.getUnityBuildUnits():
+        _writeUnitySourceFiles(
+            source_dir=source_dir,
+            unity_entries=unity_entries,
+            unit_count=Options.getUnityBuildUnits(),
+        )
+
+    with timePhase("Code generation"):
+        (
+            helper_decl_code,
+            helper_impl_code,
+            constants_header_code,
+            constants_body_code,
+        ) = CodeGeneration.generateHelpersCode()
 
     writeSourceCode(
         filename=os.path.join(source_dir, "__helpers.h"), source_code=helper_decl_code
@@ -408,6 +532,9 @@ def runSconsBackend(quiet):
     if Options.isLto():
         options["lto_mode"] = asBoolStr(True)
 
+    if Options.getUnityBuildUnits():
+        options["unity_mode"] = asBoolStr(True)
+
     if Options.shallUseStaticLibPython():
         options["static_libpython"] = asBoolStr(True)
 
@@ -631,16 +758,35 @@ def compileTree():
 
     # TODO: On Windows, we could run this in parallel to Scons, on Linux we need it
     # for linking.
-    runDataComposer(source_dir)
+    with timePhase("Data composer"):
+        runDataComposer(source_dir)
 
     general.info("Running C level backend compilation via Scons.")
 
     # Run the Scons to build things.
-    result, options = runSconsBackend(quiet=not Options.isShowScons())
+    with timePhase("Scons compile and link"):
+        result, options = runSconsBackend(quiet=not Options.isShowScons())
 
     return result, options
 
 
+def _writePerformanceReport():
+    report_filename = Options.getPerformanceReportFilename()
+
+    writePerformanceReport(
+        filename=report_filename,
+        top_count=Options.getPerformanceReportModuleCount(),
+        extra_values=(
+            ("nuitka_version", getNuitkaVersion()),
+            ("python_version", python_version_str),
+            ("main_filename", Options.getPositionalArgs()[0]),
+            ("module_count", ModuleRegistry.getDoneModulesCount()),
+        ),
+    )
+
+    general.info("Wrote performance report to %r." % report_filename)
+
+
 def handleSyntaxError(e):
     # Syntax or indentation errors, output them to the user and abort. If
     # we are not in full compat, and user has not specified the Python
@@ -667,23 +813,11 @@ of the precise Python interpreter binary and '-m nuitka', e.g. use this
     sys.exit(error_message)
 
 
-def main():
-    """Main program flow of Nuitka
-
-    At this point, options will be parsed already, Nuitka will be executing
-    in the desired version of Python with desired flags, and we just get
-    to execute the task assigned.
-
-    We might be asked to only re-compile generated C, dump only an XML
-    representation of the internal node tree after optimization, etc.
-    """
+def _compileMain(filename):
+    """Compile the main program, returns its module, or None for XML dumps."""
 
     # Main has to fulfill many options, leading to many branches and statements
     # to deal with them.  pylint: disable=too-many-branches,too-many-statements
-    if not Options.shallDumpBuiltTreeXML():
-        general.info("Starting Python compilation.")
-
-    filename = Options.getPositionalArgs()[0]
 
     # Inform the importing layer about the main script directory, so it can use
     # it when attempting to follow imports.
@@ -759,11 +893,12 @@ __name__ = ...
             for module in ModuleRegistry.getDoneModules():
                 addIncludedEntryPoints(Plugins.considerExtraDlls(dist_dir, module))
 
-            copyUsedDLLs(
-                source_dir=OutputDirectories.getSourceDirectoryPath(),
-                dist_dir=dist_dir,
-                standalone_entry_points=getStandaloneEntryPoints(),
-            )
+            with timePhase("Standalone DLL scanning"):
+                copyUsedDLLs(
+                    source_dir=OutputDirectories.getSourceDirectoryPath(),
+                    dist_dir=dist_dir,
+                    standalone_entry_points=getStandaloneEntryPoints(),
+                )
 
             copyDataFiles(dist_dir=dist_dir)
 
@@ -798,17 +933,49 @@ __name__ = ...
             % OutputDirectories.getResultFullpath(onefile=Options.isOnefileMode())
         )
 
-        # Execute the module immediately if option was given.
-        if Options.shallExecuteImmediately():
-            if Options.shallMakeModule():
-                executeModule(
-                    tree=main_module,
-                    clean_path=Options.shallClearPythonPathEnvironment(),
-                )
-            else:
-                executeMain(
-                    binary_filename=OutputDirectories.getResultFullpath(
-                        onefile=Options.isOnefileMode()
-                    ),
-                    clean_path=Options.shallClearPythonPathEnvironment(),
-                )
+        return main_module
+
+    return None
+
+
+def main():
+    """Main program flow of Nuitka
+
+    At this point, options will be parsed already, Nuitka will be executing
+    in the desired version of Python with desired flags, and we just get
+    to execute the task assigned.
+
+    We might be asked to only re-compile generated C, dump only an XML
+    representation of the internal node tree after optimization, etc.
+    """
+
+    if not Options.shallDumpBuiltTreeXML():
+        general.info("Starting Python compilation.")
+
+    filename = Options.getPositionalArgs()[0]
+
+    if Options.getPerformanceReportFilename():
+        enablePerformanceReport()
+
+    # The report is also written for failed compilations, to show where they
+    # spent their time.
+    try:
+        main_module = _compileMain(filename)
+    finally:
+        if Options.getPerformanceReportFilename():
+            _writePerformanceReport()
+
+    # Execute the module immediately if option was given.
+    if main_module is not None and Options.shallExecuteImmediately():
+        if Options.shallMakeModule():
+            executeModule(
+                tree=main_module,
+                clean_path=Options.shallClearPythonPathEnvironment(),
+            )
+        else:
+            executeMain(
+                binary_filename=OutputDirectories.getResultFullpath(
+                    onefile=Options.isOnefileMode()
+                ),
+                clean_path=Options.shallClearPythonPathEnvironment(),
+            )
@@ -415,6 +415,58 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is.""",
 )
 
+codegen_group.add_option(
+    "--lazy-import-package",
+    action="append",
+    dest="lazy_import_packages",
+    metavar="PACKAGE",
+    default=[],
+    help="""\
+Defer the execution of compiled modules of a package until first use. Give
+as a Python namespace, e.g. ``some_package.sub_package``. Importing such a
+module only creates it, and its body runs when one of its attributes is used
+first. This reduces the startup time of programs, that use only a fraction
+of their dependencies, but module body side effects then happen late. Can
+be given multiple times. Default empty.""",
+)
+
+codegen_group.add_option(
+    "--startup-import-report",
+    action="store",
+    dest="startup_import_report",
+    metavar="FILENAME",
+    default=None,
+    help="""\
+Make the compiled program write the names of the embedded modules it imports
+to this file when it exits, in the order they were loaded. Use it with the
+"--startup-imports-from" option for later builds. Default empty.""",
+)
+
+codegen_group.add_option(
+    "--startup-imports-from",
+    action="store",
+    dest="startup_imports_from",
+    metavar="FILENAME",
+    default=None,
+    help="""\
+Use a report made with "--startup-import-report" to place the modules that
+were imported during startup first in the module table and the constants
+data, in the order they are needed, making their loading faster. Default
+empty.""",
+)
+
+codegen_group.add_option(
+    "--low-memory",
+    action="store_true",
+    dest="low_memory",
+    default=False,
+    help="""\
+Attempt to use less memory, by releasing the node tree of each module as
+soon as its C code was generated, rather than keeping all of them until the
+end. Peak memory usage then depends on the largest module rather than the
+whole program. Defaults to off.""",
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(parser, "Output choices")
@@ -500,7 +552,12 @@ debug_group.add_option(
     dest="profile",
     default=False,
     help="""\
-Enable vmprof based profiling of time spent. Not working currently. Defaults to off.""",
+Enable the built-in sampling profiler of the compiled program. At run time it
+writes folded stacks for flame graph tools to "nuitka-profile-<pid>.folded",
+or the file named by "NUITKA_PROFILE_OUTPUT". The binary is not stripped, so
+e.g. "perf" can name compiled functions. Sampling interval is set in micro
+seconds with "NUITKA_PROFILE_INTERVAL". Not supported on Windows. Defaults to
+off.""",
 )
 
 debug_group.add_option(
@@ -590,6 +647,19 @@ to cause errors or known to need an update.
 """,
     )
 
+debug_group.add_option(
+    "--force-stdlib-scan-cache-update",
+    action="store_true",
+    dest="update_stdlib_scan_cache",
+    default=False,
+    help="""\
+Force an update of the cached standard library import detection of standalone
+mode. The result is cached per Python installation and only updated when its
+standard library directories change, but might be used in case the cache is
+suspect to cause errors.
+""",
+)
+
 # This is for testing framework, "coverage.py" hates to loose the process. And
 # we can use it to make sure it's not done unknowingly.
 parser.add_option(
@@ -661,6 +731,19 @@ Use link time optimizations if available and usable (MSVC or gcc 4.6 and higher)
 Defaults to off.""",
 )
 
+c_compiler_group.add_option(
+    "--unity-build-units",
+    action="store",
+    dest="unity_build_units",
+    metavar="N",
+    default="0",
+    help="""\
+Combine the generated C files of compiled modules into N translation units,
+balanced by their code size. This avoids parsing the Nuitka headers again
+for every module, while the N units can still be compiled in parallel.
+Default is 0, which compiles every module on its own.""",
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(parser, "Tracing features")
@@ -703,6 +786,31 @@ tracing_group.add_option(
 Defaults to off.""",
 )
 
+tracing_group.add_option(
+    "--performance-report",
+    action="store",
+    dest="performance_report",
+    metavar="FILENAME",
+    default=None,
+    help="""\
+Write wall time and memory growth of each compilation phase, and the
+slowest modules in them, to the given file. Memory of child processes, e.g.
+the C compiler, is not included. Use a ".csv" suffix for CSV, otherwise JSON
+is written. Default empty.""",
+)
+
+tracing_group.add_option(
+    "--performance-report-modules",
+    action="store",
+    dest="performance_report_modules",
+    metavar="N",
+    type="int",
+    default=10,
+    help="""\
+How many of the slowest modules to list for each phase in the performance
+report. Defaults to %default.""",
+)
+
 
 tracing_group.add_option(
     "--show-modules",
@@ -148,6 +148,20 @@ sane default used inside the dist folder."""
                 "Error, can only use icons from template executable or from icon files, but not both."
             )
 
+    startup_imports_filename = getStartupImportsFilename()
+    if startup_imports_filename is not None and not os.path.isfile(
+        startup_imports_filename
+    ):
+        Tracing.general.sysexit(
+            "Error, startup import report %r does not exist."
+            % startup_imports_filename
+        )
+
+    if not options.unity_build_units.isdigit():
+        Tracing.general.sysexit(
+            "Error, '--unity-build-units' needs a non-negative integer value."
+        )
+
     icon_exe_path = getWindowsIconExecutablePath()
     if icon_exe_path is not None and not os.path.exists(icon_exe_path):
         Tracing.general.sysexit("Error, icon path %r does not exist." % icon_exe_path)
@@ -398,6 +412,11 @@ def getMustIncludePackages():
     return sum([_splitShellPattern(x) for x in options.include_packages], [])
 
 
+def getLazyImportPackages():
+    """*list*, items of "--lazy-import-package=" """
+    return sum([_splitShellPattern(x) for x in options.lazy_import_packages], [])
+
+
 def getShallIncludePackageData():
     """*list*, items of "--include-package-data=" """
     return sum([_splitShellPattern(x) for x in options.package_data], [])
@@ -544,6 +563,11 @@ def isLto():
     return options.lto
 
 
+def getUnityBuildUnits():
+    """*int* = "--unity-build-units", 0 if not unity building"""
+    return int(options.unity_build_units)
+
+
 def isClang():
     """*bool* = "--clang" """
     return options.clang
@@ -584,6 +608,31 @@ def isShowMemory():
     return options is not None and options.show_memory
 
 
+def getStartupImportReportFilename():
+    """*str* = "--startup-import-report" """
+    return options.startup_import_report
+
+
+def getStartupImportsFilename():
+    """*str* = "--startup-imports-from" """
+    return options.startup_imports_from
+
+
+def isLowMemory():
+    """*bool* = "--low-memory" """
+    return options is not None and options.low_memory
+
+
+def getPerformanceReportFilename():
+    """*str* = "--performance-report" """
+    return options.performance_report
+
+
+def getPerformanceReportModuleCount():
+    """*int* = "--performance-report-modules" """
+    return options.performance_report_modules
+
+
 def isShowInclusion():
     """*bool* = "--show-modules" """
     return options.show_inclusion
@@ -798,6 +847,11 @@ def shallNotStoreDependsExeCachedResults():
     return getattr(options, "no_dependency_cache", False)
 
 
+def shallUpdateImportDetectionsCache():
+    """*bool* = "--force-stdlib-scan-cache-update" """
+    return options.update_stdlib_scan_cache
+
+
 def getPluginsEnabled():
     """*tuple*, user enabled (standard) plugins (not including user plugins)
 
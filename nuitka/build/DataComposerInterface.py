@@ -22,8 +22,9 @@ import os
 import subprocess
 import sys
 
-from nuitka.Options import isExperimental
+from nuitka.Options import getStartupImportsFilename, isExperimental
 from nuitka.utils.Execution import withEnvironmentVarsOverriden
+from nuitka.utils.FileOperations import getFileContentByLine
 
 
 def runDataComposer(source_dir):
@@ -40,6 +41,11 @@ def runDataComposer(source_dir):
     if isExperimental("debug-constants"):
         mapping["NUITKA_DATACOMPOSER_VERBOSE"] = "1"
 
+    if getStartupImportsFilename() is not None:
+        mapping["NUITKA_DATACOMPOSER_STARTUP_IMPORTS"] = os.path.abspath(
+            getStartupImportsFilename()
+        )
+
     with withEnvironmentVarsOverriden(mapping):
         subprocess.check_call(
             [
@@ -70,3 +76,26 @@ def deriveModuleConstantsBlobName(filename):
         basename = basename[7:]
 
         return basename
+
+
+def readStartupImports(filename):
+    """Read the module names from a startup import report.
+
+    Args:
+        filename: report written by a program compiled with
+            "--startup-import-report"
+
+    Returns:
+        Tuple of module names in the order they were imported.
+    """
+    result = []
+    seen = set()
+
+    for line in getFileContentByLine(filename):
+        line = line.strip()
+
+        if line and line not in seen:
+            result.append(line)
+            seen.add(line)
+
+    return tuple(result)
@@ -19,9 +19,13 @@
 
 """
 
+import hashlib
 import os
 import re
+import shutil
+import subprocess
 import sys
+import threading
 from collections import defaultdict
 
 from nuitka.Tracing import scons_details_logger, scons_logger
@@ -30,8 +34,11 @@ from nuitka.utils.Download import getCachedDownload
 from nuitka.utils.FileOperations import (
     getExternalUsePath,
     getFileContents,
+    getFileSize,
     getLinkTarget,
     makePath,
+    putTextFileContents,
+    replaceFileAtomic,
 )
 from nuitka.utils.Importing import importFromInlineCopy
 from nuitka.utils.Utils import getOS, isWin32Windows
@@ -225,6 +232,55 @@ def enableClcache(the_compiler, env, source_dir):
     return True
 
 
+def enableObjectCache(the_compiler, env, source_dir):
+    """Cache object files with our own compiler wrapper, for use without ccache.
+
+    The compiler is called through "<objcache>" which the spawn function then
+    handles with "runObjectCache", keyed by the preprocessed source, the
+    compiler identity, and the flags used.
+
+    This is only done if asked for with "NUITKA_OBJECT_CACHE_DIR", ccache
+    remains the recommendation.
+    """
+
+    object_cache_dir = os.environ.get("NUITKA_OBJECT_CACHE_DIR")
+
+    if not object_cache_dir:
+        return False
+
+    cc_path = getExecutablePath(the_compiler, env=env)
+
+    if cc_path is None:
+        return False
+
+    makePath(object_cache_dir)
+    object_cache_dir = os.path.abspath(object_cache_dir)
+
+    setEnvironmentVariable(env, "NUITKA_OBJECT_CACHE_DIR", object_cache_dir)
+    env["NUITKA_OBJECT_CACHE_DIR"] = object_cache_dir
+
+    # The log filename needs absolute path, compilation can change directory.
+    object_cache_logfile = os.path.abspath(
+        os.path.join(source_dir, "objcache-%d.txt" % os.getpid())
+    )
+
+    setEnvironmentVariable(env, "NUITKA_OBJECT_CACHE_LOGFILE", object_cache_logfile)
+    env["NUITKA_OBJECT_CACHE_LOGFILE"] = object_cache_logfile
+
+    env["CXX"] = env["CC"] = "<objcache> %s" % cc_path
+
+    # Linking is not cached, no need to go through the wrapper.
+    env["LINK"] = cc_path
+
+    scons_details_logger.info(
+        "No ccache found, using object cache '%s' for %r compiler."
+        % (object_cache_dir, cc_path)
+    )
+
+    # Do not consider scons cache anymore.
+    return True
+
+
 def _getCcacheStatistics(ccache_logfile):
     data = {}
 
@@ -287,14 +343,112 @@ def _getCcacheStatistics(ccache_logfile):
     return data
 
 
+def _getObjectCacheMaxSize():
+    # In megabytes, defaulting to something sane for a few Nuitka projects.
+    return int(os.environ.get("NUITKA_OBJECT_CACHE_MAXSIZE", "2048")) * 1024 * 1024
+
+
+# Size of the object cache as of its last trimming plus what was added since,
+# so not every compilation has to walk the cache to know it.
+_object_cache_size_filename = "cache-size.txt"
+
+
+def _getObjectCacheRecordedSize(object_cache_dir):
+    try:
+        return int(
+            getFileContents(
+                os.path.join(object_cache_dir, _object_cache_size_filename)
+            )
+        )
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _setObjectCacheRecordedSize(object_cache_dir, size):
+    size_filename = os.path.join(object_cache_dir, _object_cache_size_filename)
+    temp_filename = "%s.%d.tmp" % (size_filename, os.getpid())
+
+    try:
+        putTextFileContents(temp_filename, str(size))
+        replaceFileAtomic(temp_filename, size_filename)
+    except (IOError, OSError):
+        pass
+
+
+def _trimObjectCache(object_cache_dir, added_size):
+    """Remove least recently used object files until under the size limit.
+
+    Hits touch the cache entries, so the modification time tells the use.
+    Only misses add to the cache, so unless the recorded size plus what they
+    added exceeds the limit, the cache is not looked at.
+    """
+
+    max_size = _getObjectCacheMaxSize()
+
+    recorded_size = _getObjectCacheRecordedSize(object_cache_dir)
+
+    if recorded_size is not None and recorded_size + added_size <= max_size:
+        if added_size:
+            _setObjectCacheRecordedSize(object_cache_dir, recorded_size + added_size)
+
+        return
+
+    entries = []
+    total_size = 0
+
+    for dirpath, _dirnames, filenames in os.walk(object_cache_dir):
+        for filename in filenames:
+            if filename == _object_cache_size_filename:
+                continue
+
+            path = os.path.join(dirpath, filename)
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+    if total_size <= max_size:
+        _setObjectCacheRecordedSize(object_cache_dir, total_size)
+        return
+
+    # Trim a bit deeper than necessary, so not every compilation has to do it.
+    target_size = max_size * 9 // 10
+
+    for _mtime, size, path in sorted(entries):
+        if total_size <= target_size:
+            break
+
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+
+        total_size -= size
+
+    _setObjectCacheRecordedSize(object_cache_dir, total_size)
+
+    scons_details_logger.info(
+        "Trimmed object cache '%s' to %d bytes." % (object_cache_dir, total_size)
+    )
+
+
 def checkCachingSuccess(source_dir):
     ccache_logfile = getSconsReportValue(source_dir, "CCACHE_LOGFILE")
+    object_cache_logfile = getSconsReportValue(
+        source_dir, "NUITKA_OBJECT_CACHE_LOGFILE"
+    )
 
     if ccache_logfile is not None:
         stats = _getCcacheStatistics(ccache_logfile)
 
         if not stats:
-            scons_logger.warning("You are not using ccache.")
+            # Our object cache replaces ccache, no need to complain then.
+            if object_cache_logfile is None:
+                scons_logger.warning("You are not using ccache.")
         else:
             counts = defaultdict(int)
 
@@ -312,6 +466,33 @@ def checkCachingSuccess(source_dir):
                     % (result, count)
                 )
 
+    if object_cache_logfile is not None:
+        counts = defaultdict(int)
+        added_size = 0
+
+        if os.path.exists(object_cache_logfile):
+            with open(object_cache_logfile) as log_file:
+                for line in log_file:
+                    result, value = line.split(":", 1)
+                    counts[result] += 1
+
+                    # Misses give the size of the files they stored.
+                    if result == "miss":
+                        added_size += int(value.split(":", 1)[0])
+
+        scons_logger.info(
+            "Compiled %d C files using object cache with %d cache hits and %d cache misses."
+            % (
+                counts["hit"] + counts["miss"],
+                counts["hit"],
+                counts["miss"],
+            )
+        )
+
+        _trimObjectCache(
+            getSconsReportValue(source_dir, "NUITKA_OBJECT_CACHE_DIR"), added_size
+        )
+
     if os.name == "nt":
         clcache_stats_filename = getSconsReportValue(source_dir, "CLCACHE_STATS")
 
@@ -343,3 +524,199 @@ def runClCache(args, env):
     return runClCache(
         os.environ["CLCACHE_CL"], [arg.strip('"') for arg in args[1:]], env
     )
+
+
+_object_cache_log_lock = threading.Lock()
+
+# Compiler path to identity, avoids repeated checks.
+_compiler_identities = {}
+
+# Only these can be preprocessed to get the full input.
+_object_cache_source_extensions = (".c", ".cpp", ".cc", ".cxx")
+
+
+def _getCompilerIdentity(cc_path):
+    if cc_path not in _compiler_identities:
+        real_path = os.path.realpath(cc_path)
+        stat = os.stat(real_path)
+
+        # Like ccache does by default, size and modification time identify
+        # the compiler, without running it.
+        _compiler_identities[cc_path] = "%s:%d:%d" % (
+            real_path,
+            stat.st_size,
+            stat.st_mtime,
+        )
+
+    return _compiler_identities[cc_path]
+
+
+def _logObjectCacheResult(env, result, source_filename):
+    with _object_cache_log_lock:
+        with open(env["NUITKA_OBJECT_CACHE_LOGFILE"], "a") as log_file:
+            log_file.write("%s:%s\n" % (result, source_filename))
+
+
+def _getObjectCacheKey(cc_path, args, output_index, env):
+    """Hash of the compilation, None if it cannot be cached."""
+
+    preprocess_args = [cc_path]
+
+    for count, arg in enumerate(args):
+        if count in (output_index - 1, output_index):
+            continue
+
+        preprocess_args.append("-E" if arg == "-c" else arg)
+
+    process = subprocess.Popen(
+        preprocess_args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    preprocessed, _err = process.communicate()
+
+    if process.returncode != 0:
+        return None
+
+    key = hashlib.sha256()
+    key.update(_getCompilerIdentity(cc_path).encode("utf8"))
+
+    build_dir = os.getcwd()
+
+    # Like ccache does, the directory is part of the key only with debug
+    # information, which refers to it.
+    if any(arg.startswith("-g") for arg in args):
+        key.update(build_dir.encode("utf8"))
+
+    for count, arg in enumerate(args):
+        if count != output_index:
+            key.update(b"\0" + arg.encode("utf8"))
+
+    # Line markers may refer to the build directory, which differs for every
+    # program, but files compiled for all of them are the same otherwise.
+    preprocessed = preprocessed.replace(
+        build_dir.encode(sys.getfilesystemencoding() or "utf8"), b"."
+    )
+
+    key.update(b"\0" + preprocessed)
+
+    return key.hexdigest()
+
+
+def _runCompiler(cmdline, env):
+    process = subprocess.Popen(
+        cmdline, stdin=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+    )
+    _data, err = process.communicate()
+
+    return err, process.returncode
+
+
+def _writeStderr(err):
+    if err:
+        if str is bytes:
+            sys.stderr.write(err)
+        else:
+            sys.stderr.buffer.write(err)
+
+        sys.stderr.flush()
+
+
+def _storeObjectCacheFile(source_filename, cache_filename):
+    temp_filename = "%s.%d.%d.tmp" % (
+        cache_filename,
+        os.getpid(),
+        threading.current_thread().ident,
+    )
+
+    shutil.copyfile(source_filename, temp_filename)
+    replaceFileAtomic(temp_filename, cache_filename)
+
+
+def runObjectCache(args, env):
+    """Run a compilation through the object cache.
+
+    Args:
+        args: unescaped command line, "<objcache>" followed by the compiler
+        env: environment to run with, as provided to the spawn function
+    Returns:
+        exit code of the compilation
+    """
+
+    cc_path = args[1]
+    args = args[2:]
+    cmdline = [cc_path] + args
+
+    # Disabled explicitly, e.g. for the constants blob that pulls in binary
+    # data the preprocessor does not see.
+    if env.get("CCACHE_DISABLE") == "1":
+        err, exit_code = _runCompiler(cmdline, env)
+        _writeStderr(err)
+        return exit_code
+
+    source_filenames = [
+        arg for arg in args if arg.endswith(_object_cache_source_extensions)
+    ]
+
+    if "-c" not in args or "-o" not in args or len(source_filenames) != 1:
+        err, exit_code = _runCompiler(cmdline, env)
+        _writeStderr(err)
+        return exit_code
+
+    output_index = args.index("-o") + 1
+    output_filename = args[output_index]
+
+    key = _getObjectCacheKey(cc_path, args, output_index, env)
+
+    if key is None:
+        err, exit_code = _runCompiler(cmdline, env)
+        _writeStderr(err)
+        return exit_code
+
+    cache_dir = os.path.join(env["NUITKA_OBJECT_CACHE_DIR"], key[:2])
+    cache_filename = os.path.join(cache_dir, key[2:] + ".o")
+    cache_stderr_filename = os.path.join(cache_dir, key[2:] + ".stderr")
+
+    if os.path.exists(cache_filename):
+        try:
+            shutil.copyfile(cache_filename, output_filename)
+
+            # Mark as recently used for trimming.
+            os.utime(cache_filename, None)
+
+            if os.path.exists(cache_stderr_filename):
+                _writeStderr(getFileContents(cache_stderr_filename, mode="rb"))
+        except (IOError, OSError):
+            pass
+        else:
+            _logObjectCacheResult(env, "hit", source_filenames[0])
+            return 0
+
+    err, exit_code = _runCompiler(cmdline, env)
+    _writeStderr(err)
+
+    if exit_code == 0:
+        stored_size = 0
+
+        try:
+            makePath(cache_dir)
+
+            if err:
+                with open(cache_stderr_filename, "wb") as stderr_file:
+                    stderr_file.write(err)
+
+                stored_size += len(err)
+
+            _storeObjectCacheFile(output_filename, cache_filename)
+            stored_size += getFileSize(cache_filename)
+        except (IOError, OSError):
+            pass
+
+        # The size added to the cache is recorded for its trimming.
+        _logObjectCacheResult(
+            env, "miss", "%d:%s" % (stored_size, source_filenames[0])
+        )
+
+    return exit_code
@@ -28,7 +28,7 @@ import threading
 from nuitka.Tracing import my_print, scons_logger
 from nuitka.utils.Timing import TimerReport
 
-from .SconsCaching import runClCache
+from .SconsCaching import runClCache, runObjectCache
 from .SconsUtils import decodeData
 
 
@@ -233,14 +233,22 @@ def runSpawnMonitored(spawn, sh, escape, cmd, args, env):
     return thread.getSpawnResult()
 
 
+def _spawnObjectCache(sh, escape, cmd, args, env):  # pylint: disable=unused-argument
+    return runObjectCache([_unescape(arg) for arg in args], env)
+
+
 def getWrappedSpawnFunction(spawn):
     def spawnCommand(sh, escape, cmd, args, env):
-        # Avoid using ccache on binary constants blob, not useful and not working
-        # with old ccache.
+        # Avoid using ccache or object cache on binary constants blob, not
+        # useful and not working with old ccache.
         if '"__constants_data.o"' in args or '"__constants_data.os"' in args:
             env = dict(env)
             env["CCACHE_DISABLE"] = "1"
 
+        # Special hook for our object cache, used when there is no ccache.
+        if cmd == "<objcache>":
+            return runSpawnMonitored(_spawnObjectCache, sh, escape, cmd, args, env)
+
         return runSpawnMonitored(spawn, sh, escape, cmd, args, env)
 
     return spawnCommand
@@ -59,6 +59,49 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, P
     }
 }
 
+// Check the result of calling a C function, as done in "CALL_FUNCTION".
+NUITKA_MAY_BE_UNUSED static PyObject *Nuitka_CheckFunctionResult(PyObject *result) {
+    if (result == NULL) {
+        // Other buggy C functions do this, return NULL, but with no error set,
+        // not allowed.
+        if (unlikely(!ERROR_OCCURRED())) {
+            SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_SystemError, "NULL result without error in PyObject_Call");
+        }
+
+        return NULL;
+    } else {
+        // Some buggy C functions do set an error, but do not indicate it and
+        // Nuitka inner workings can get upset/confused from it.
+        DROP_ERROR_OCCURRED();
+
+        return result;
+    }
+}
+
+#if PYTHON_VERSION >= 0x380
+// Call objects that support vectorcall, e.g. built-in functions and types, with
+// the arguments array directly, returns false if that is not supported.
+NUITKA_MAY_BE_UNUSED static bool CALL_FUNCTION_VECTORCALL(PyObject *called, PyObject *const *args, Py_ssize_t nargs,
+                                                          PyObject **result) {
+    vectorcallfunc func = _PyVectorcall_Function(called);
+
+    if (func == NULL) {
+        return false;
+    }
+
+    if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+        *result = NULL;
+        return true;
+    }
+
+    *result = Nuitka_CheckFunctionResult(func(called, args, nargs, NULL));
+
+    Py_LeaveRecursiveCall();
+
+    return true;
+}
+#endif
+
 // Function call variant with no arguments provided at all.
 extern PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called);
 
@@ -54,6 +54,10 @@ struct Nuitka_FrameObject {
 
     // Our own extra stuff, attached variables.
     char const *m_type_description;
+
+    // Referenced by the frame cache of a function, which then reuses it.
+    bool m_is_cached;
+
     char m_locals_storage[1];
 };
 
@@ -192,6 +196,9 @@ NUITKA_MAY_BE_UNUSED inline static void popFrameStack(void) {
 // Attach locals to a frame object. TODO: Upper case, this is for generated code only.
 extern void Nuitka_Frame_AttachLocals(struct Nuitka_FrameObject *frame, char const *type_description, ...);
 
+// Release attached locals of a frame, e.g. when it is reused from a frame cache.
+extern void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame);
+
 // Codes used for type_description.
 #define NUITKA_TYPE_DESCRIPTION_NULL 'N'
 #define NUITKA_TYPE_DESCRIPTION_CELL 'c'
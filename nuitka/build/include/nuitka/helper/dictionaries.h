@@ -233,9 +233,35 @@ extern PyObject *DICT_GET_ITEM_WITH_ERROR(PyObject *dict, PyObject *key);
 extern PyObject *DICT_GET_ITEM1(PyObject *dict, PyObject *key);
 extern PyObject *DICT_GET_ITEM0(PyObject *dict, PyObject *key);
 
+// Get the case index of an if/elif chain dispatch dictionary, or -1 if the key
+// is not in it. The key must have the exact type of the constant keys.
+NUITKA_MAY_BE_UNUSED static long DICT_GET_SWITCH_INDEX(PyObject *dict, PyObject *key) {
+    PyObject *index = DICT_GET_ITEM0(dict, key);
+
+    if (index == NULL) {
+        return -1;
+    }
+
+#if PYTHON_VERSION < 0x300
+    return PyInt_AS_LONG(index);
+#else
+    return PyLong_AsLong(index);
+#endif
+}
+
 // Get dict lookup for a key, similar to PyDict_Contains
 extern int DICT_HAS_ITEM(PyObject *dict, PyObject *key);
 
+// Empty dictionary, with room for "size" items to be set without growing it.
+extern PyObject *MAKE_DICT_EMPTY_PRESIZED(Py_ssize_t size);
+
+#if PYTHON_VERSION >= 0x360
+// Create a dictionary with the constant keys of a template dictionary, and the
+// given values in the order of these keys. This cannot fail, running out of
+// memory is fatal.
+extern PyObject *DICT_MAKE_FROM_TEMPLATE(PyObject *dict_template, PyObject **values);
+#endif
+
 // Convert to dictionary, helper for built-in "dict" mainly.
 NUITKA_MAY_BE_UNUSED static PyObject *TO_DICT(PyObject *seq_obj, PyObject *dict_obj) {
     PyObject *result = PyDict_New();
@@ -58,6 +58,47 @@ typedef struct {
     PyObject *it_seq;
 } seqiterobject;
 
+#if PYTHON_VERSION >= 0x340
+// Taken from CPython implementation, so we can access it, needs to match
+// their definition exactly.
+typedef struct {
+    PyObject_HEAD long index;
+    long start;
+    long step;
+    long len;
+} rangeiterobject;
+
+// The number of values an iterator will still produce, for the built-in
+// iterators that know it, and zero otherwise. This has no side effects and
+// cannot fail, it is only used to allocate result containers in advance.
+NUITKA_MAY_BE_UNUSED static Py_ssize_t ITERATOR_LENGTH_HINT(PyObject *iterator) {
+    CHECK_OBJECT(iterator);
+
+    PyTypeObject *type = Py_TYPE(iterator);
+    Py_ssize_t result = 0;
+
+    if (type == &PyListIter_Type) {
+        seqiterobject *list_iterator = (seqiterobject *)iterator;
+
+        if (list_iterator->it_seq != NULL) {
+            result = PyList_GET_SIZE(list_iterator->it_seq) - list_iterator->it_index;
+        }
+    } else if (type == &PyTupleIter_Type) {
+        seqiterobject *tuple_iterator = (seqiterobject *)iterator;
+
+        if (tuple_iterator->it_seq != NULL) {
+            result = PyTuple_GET_SIZE(tuple_iterator->it_seq) - tuple_iterator->it_index;
+        }
+    } else if (type == &PyRangeIter_Type) {
+        rangeiterobject *range_iterator = (rangeiterobject *)iterator;
+
+        result = range_iterator->len - range_iterator->index;
+    }
+
+    return result > 0 ? result : 0;
+}
+#endif
+
 NUITKA_MAY_BE_UNUSED static PyObject *MAKE_ITERATOR_INFALLIBLE(PyObject *iterated) {
     CHECK_OBJECT(iterated);
 
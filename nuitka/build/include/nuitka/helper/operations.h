@@ -21,6 +21,10 @@
 #if PYTHON_VERSION >= 0x300
 extern PyObject *UNICODE_CONCAT(PyObject *left, PyObject *right);
 extern bool UNICODE_APPEND(PyObject **p_left, PyObject *right);
+
+// Build a string from parts, which are strings or exact int values that are
+// formatted as decimal numbers, used for f-strings.
+extern PyObject *UNICODE_BUILD_STRING(PyObject **parts, Py_ssize_t count);
 #else
 // TODO: Specialize for Python2 too.
 NUITKA_MAY_BE_UNUSED static PyObject *UNICODE_CONCAT(PyObject *left, PyObject *right) {
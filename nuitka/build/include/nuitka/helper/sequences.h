@@ -53,4 +53,25 @@ NUITKA_MAY_BE_UNUSED static bool SEQUENCE_SETITEM(PyObject *sequence, Py_ssize_t
     }
 }
 
+// Containment test in a constant sequence, given also as a set of its values,
+// which can be used for element types that have hash and value equality agree.
+NUITKA_MAY_BE_UNUSED static int SEQUENCE_CONTAINS_HASH_SEARCHABLE(PyObject *sequence, PyObject *value_set,
+                                                                  PyObject *element) {
+    CHECK_OBJECT(sequence);
+    CHECK_OBJECT(value_set);
+    CHECK_OBJECT(element);
+
+    assert(PyFrozenSet_CheckExact(value_set));
+
+#if PYTHON_VERSION < 0x300
+    if (PyString_CheckExact(element) || PyInt_CheckExact(element)) {
+#else
+    if (PyUnicode_CheckExact(element) || PyLong_CheckExact(element) || PyBytes_CheckExact(element)) {
+#endif
+        return PySet_Contains(value_set, element);
+    }
+
+    return PySequence_Contains(sequence, element);
+}
+
 #endif
@@ -280,6 +280,21 @@ extern PyObject *BUILTIN_ALL(PyObject *value);
 // The patched isinstance() functionality used for the built-in.
 extern int Nuitka_IsInstance(PyObject *inst, PyObject *cls);
 
+// Per call site cache of the last isinstance() answers for types of instances.
+struct Nuitka_IsInstanceCacheEntry {
+    PyTypeObject *type;
+    unsigned int type_version_tag;
+    int result;
+};
+
+struct Nuitka_IsInstanceCache {
+    PyObject *cls;
+    struct Nuitka_IsInstanceCacheEntry entries[4];
+};
+
+// The isinstance() functionality, using the call site cache where possible.
+extern int Nuitka_IsInstanceCached(struct Nuitka_IsInstanceCache *cache, PyObject *inst, PyObject *cls);
+
 // For built-in getattr() functionality.
 extern PyObject *BUILTIN_GETATTR(PyObject *object, PyObject *attribute, PyObject *default_value);
 
@@ -381,6 +396,12 @@ extern void _initSlotCompare(void);
 #if PYTHON_VERSION >= 0x300
 // Select the metaclass from specified one and given bases.
 extern PyObject *SELECT_METACLASS(PyObject *metaclass, PyObject *bases);
+
+// Prepare the namespace of a class via "__prepare__" of its metaclass.
+extern PyObject *PREPARE_CLASS_NAMESPACE(PyObject *metaclass, PyObject *class_name, PyObject *bases);
+
+// Create a class with its metaclass from the prepared namespace.
+extern PyObject *BUILD_CLASS(PyObject *metaclass, PyObject *class_name, PyObject *bases, PyObject *class_dict);
 #endif
 
 NUITKA_MAY_BE_UNUSED static PyObject *MODULE_NAME1(PyObject *module) {
@@ -25,6 +25,12 @@
 #define NUITKA_PACKAGE_FLAG 2
 #define NUITKA_BYTECODE_FLAG 4
 
+/* Compiled modules, whose body is executed only on first attribute use. */
+#define NUITKA_LAZY_FLAG 8
+
+/* Set at run time, for modules already in the startup import report. */
+#define NUITKA_STARTUP_IMPORT_RECORDED_FLAG 16
+
 struct Nuitka_MetaPathBasedLoaderEntry;
 
 typedef PyObject *(*module_initfunc)(PyObject *module, struct Nuitka_MetaPathBasedLoaderEntry const *module_entry);
@@ -45,10 +51,11 @@ struct Nuitka_MetaPathBasedLoaderEntry {
 };
 
 /* For embedded modules, register the meta path based loader. Used by main
- * program/package only.
+ * program/package only. With a report filename given, the names of the
+ * modules loaded are written to it at exit.
  */
 extern void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *loader_entries,
-                                           unsigned char **bytecode_data);
+                                           unsigned char **bytecode_data, char const *startup_import_report_filename);
 
 /* Create a loader object responsible for a package. */
 extern PyObject *Nuitka_Loader_New(struct Nuitka_MetaPathBasedLoaderEntry const *entry);
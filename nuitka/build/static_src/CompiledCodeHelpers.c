@@ -1320,6 +1320,88 @@ int Nuitka_IsInstance(PyObject *inst, PyObject *cls) {
     }
 }
 
+// Only for classes without a metaclass, there can be no "__instancecheck__" that
+// gives answers not determined by the type of the instance alone.
+static bool _Nuitka_IsInstanceCacheable(PyObject *cls) {
+    if (PyTuple_CheckExact(cls)) {
+        for (Py_ssize_t i = 0, size = PyTuple_GET_SIZE(cls); i < size; i++) {
+            if (Py_TYPE(PyTuple_GET_ITEM(cls, i)) != &PyType_Type) {
+                return false;
+            }
+        }
+
+        return true;
+    }
+
+    return Py_TYPE(cls) == &PyType_Type;
+}
+
+// The answer also depends on "inst.__class__" which for most types is the type
+// itself, unless they override it, or the attribute lookup, e.g. proxies, that
+// give a different one per instance.
+static bool _Nuitka_HasDefaultClassAttribute(PyTypeObject *type) {
+    if (type->tp_getattro != PyObject_GenericGetAttr) {
+        return false;
+    }
+
+    return _PyType_Lookup(type, const_str_plain___class__) ==
+           _PyType_Lookup(&PyBaseObject_Type, const_str_plain___class__);
+}
+
+int Nuitka_IsInstanceCached(struct Nuitka_IsInstanceCache *cache, PyObject *inst, PyObject *cls) {
+    CHECK_OBJECT(inst);
+    CHECK_OBJECT(cls);
+
+    PyTypeObject *type = Py_TYPE(inst);
+
+    if (type == (PyTypeObject *)cls) {
+        return true;
+    }
+
+    // Few types are usually checked at one place, spread them by address.
+    struct Nuitka_IsInstanceCacheEntry *entry =
+        &cache->entries[((uintptr_t)type >> 4) % (sizeof(cache->entries) / sizeof(cache->entries[0]))];
+
+    // The version tag changes when the type or its bases are modified, and
+    // they are not reused, so a type that was released cannot match either.
+    if (cache->cls == cls && entry->type == type && PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG) &&
+        entry->type_version_tag == type->tp_version_tag && _Nuitka_IsInstanceCacheable(cls)) {
+        return entry->result;
+    }
+
+    int res = Nuitka_IsInstance(inst, cls);
+
+    if (res == -1 || !_Nuitka_IsInstanceCacheable(cls)) {
+        return res;
+    }
+
+    // This lookup also makes sure the type has a version tag.
+    bool default_class = _Nuitka_HasDefaultClassAttribute(type);
+
+    if (default_class && PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+        PyObject *old = NULL;
+
+        if (cache->cls != cls) {
+            old = cache->cls;
+
+            memset(cache->entries, 0, sizeof(cache->entries));
+
+            // Keep the classes alive, so their identity cannot be reused.
+            Py_INCREF(cls);
+            cache->cls = cls;
+        }
+
+        entry->type = type;
+        entry->type_version_tag = type->tp_version_tag;
+        entry->result = res;
+
+        // Only now, releasing the old classes can run arbitrary code.
+        Py_XDECREF(old);
+    }
+
+    return res;
+}
+
 #define ITERATOR_GENERIC 0
 #define ITERATOR_COMPILED_GENERATOR 1
 #define ITERATOR_TUPLE 2
@@ -331,6 +331,12 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
     }
 }
 
+void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame) {
+    CHECK_OBJECT(frame);
+
+    Nuitka_Frame_tp_clear(frame);
+}
+
 #define MAX_FRAME_FREE_LIST_COUNT 100
 static struct Nuitka_FrameObject *free_list_frames = NULL;
 static int free_list_frames_count = 0;
@@ -569,6 +575,7 @@ static struct Nuitka_FrameObject *MAKE_FRAME(PyCodeObject *code, PyObject *modul
     allocateFromFreeList(free_list_frames, struct Nuitka_FrameObject, Nuitka_Frame_Type, locals_size);
 
     result->m_type_description = NULL;
+    result->m_is_cached = false;
 
     PyFrameObject *frame = &result->m_frame;
 
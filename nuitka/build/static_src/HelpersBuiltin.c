@@ -572,9 +572,16 @@ PyObject *BUILTIN_ITER2(PyObject *callable, PyObject *sentinel) {
  *
  **/
 
+// Deferred modules pose as normal modules.
+extern PyTypeObject Nuitka_LazyModule_Type;
+
 PyObject *BUILTIN_TYPE1(PyObject *arg) {
     PyObject *result = (PyObject *)Py_TYPE(arg);
 
+    if (unlikely(result == (PyObject *)&Nuitka_LazyModule_Type)) {
+        result = (PyObject *)&PyModule_Type;
+    }
+
     Py_INCREF(result);
     return result;
 }
@@ -233,10 +233,90 @@ PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
 
             return result;
         }
+    } else if (PyCFunction_Check(called)) {
+        // Try to be fast about wrapping the arguments.
+        int flags = PyCFunction_GET_FLAGS(called) & ~(METH_CLASS | METH_STATIC | METH_COEXIST);
+
+        if (flags & METH_NOARGS) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+            PyObject *result = (*method)(self, NULL);
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
+#if PYTHON_VERSION >= 0x360
+        } else if (flags == METH_FASTCALL) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+#if PYTHON_VERSION < 0x370
+            PyObject *result = (*(_PyCFunctionFast)method)(self, NULL, 0, NULL);
+#else
+            PyObject *result = (*(_PyCFunctionFast)method)(self, NULL, 0);
+#endif
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
+#endif
+#if PYTHON_VERSION >= 0x370
+        } else if (flags == (METH_FASTCALL | METH_KEYWORDS)) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+            PyObject *result = (*(_PyCFunctionFastWithKeywords)method)(self, NULL, 0, NULL);
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
+#endif
+        }
     } else if (PyFunction_Check(called)) {
         return _fast_function_noargs(called);
     }
 
+#if PYTHON_VERSION >= 0x380
+    {
+        PyObject *result;
+
+        if (CALL_FUNCTION_VECTORCALL(called, NULL, 0, &result)) {
+            return result;
+        }
+    }
+#endif
+
     return CALL_FUNCTION(called, const_tuple_empty, NULL);
 }
 
@@ -441,6 +521,52 @@ PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg) {
             PyErr_Format(PyExc_TypeError, "%s() takes exactly one argument (1 given)",
                          ((PyCFunctionObject *)called)->m_ml->ml_name);
             return NULL;
+#endif
+#if PYTHON_VERSION >= 0x360
+        } else if (flags == METH_FASTCALL) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+#if PYTHON_VERSION < 0x370
+            PyObject *result = (*(_PyCFunctionFast)method)(self, &arg, 1, NULL);
+#else
+            PyObject *result = (*(_PyCFunctionFast)method)(self, &arg, 1);
+#endif
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
+#endif
+#if PYTHON_VERSION >= 0x370
+        } else if (flags == (METH_FASTCALL | METH_KEYWORDS)) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+            PyObject *result = (*(_PyCFunctionFastWithKeywords)method)(self, &arg, 1, NULL);
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
 #endif
         } else if (flags & METH_VARARGS) {
             PyCFunction method = PyCFunction_GET_FUNCTION(called);
@@ -468,14 +594,6 @@ PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg) {
 #else
             if (flags == (METH_VARARGS | METH_KEYWORDS)) {
                 result = (*(PyCFunctionWithKeywords)method)(self, pos_args, NULL);
-            } else if (flags == METH_FASTCALL) {
-#if PYTHON_VERSION < 0x370
-                result = (*(_PyCFunctionFast)method)(self, &PyTuple_GET_ITEM(pos_args, 0), 1, NULL);
-                ;
-#else
-                result = (*(_PyCFunctionFast)method)(self, &pos_args, 1);
-                ;
-#endif
             } else {
                 result = (*method)(self, pos_args);
             }
@@ -508,6 +626,16 @@ PyObject *CALL_FUNCTION_WITH_SINGLE_ARG(PyObject *called, PyObject *arg) {
         return callPythonFunction(called, args, 1);
     }
 
+#if PYTHON_VERSION >= 0x380
+    {
+        PyObject *result;
+
+        if (CALL_FUNCTION_VECTORCALL(called, &arg, 1, &result)) {
+            return result;
+        }
+    }
+#endif
+
     PyObject *args[1] = {arg};
     PyObject *pos_args = MAKE_TUPLE(args, 1);
 
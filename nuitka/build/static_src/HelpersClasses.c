@@ -17,8 +17,9 @@
 //
 /** For creating classes.
  *
- * Currently only the Python3 meta class selection is here, but more will be
- * added later, should be choose to have our own "__slots__" special metaclass.
+ * Currently only the Python3 meta class selection, namespace preparation and
+ * class creation is here, but more will be added later, should be choose to
+ * have our own "__slots__" special metaclass.
  *
  **/
 
@@ -82,4 +83,72 @@ PyObject *SELECT_METACLASS(PyObject *metaclass, PyObject *bases) {
         return metaclass;
     }
 }
+
+extern PyObject *CALL_FUNCTION_WITH_ARGS2(PyObject *called, PyObject **args);
+extern PyObject *CALL_FUNCTION_WITH_ARGS3(PyObject *called, PyObject **args);
+
+PyObject *PREPARE_CLASS_NAMESPACE(PyObject *metaclass, PyObject *class_name, PyObject *bases) {
+    CHECK_OBJECT(metaclass);
+    CHECK_OBJECT(class_name);
+    CHECK_OBJECT(bases);
+
+    // The "__prepare__" of "type" gives a new dictionary, no need to look it up
+    // and call it.
+    if (metaclass == (PyObject *)&PyType_Type) {
+        return PyDict_New();
+    }
+
+    PyObject *prepare = PyObject_GetAttr(metaclass, const_str_plain___prepare__);
+
+    if (prepare == NULL) {
+        if (unlikely(!EXCEPTION_MATCH_BOOL_SINGLE(GET_ERROR_OCCURRED(), PyExc_AttributeError))) {
+            return NULL;
+        }
+
+        CLEAR_ERROR_OCCURRED();
+
+        return PyDict_New();
+    }
+
+    PyObject *args[2] = {class_name, bases};
+    PyObject *result = CALL_FUNCTION_WITH_ARGS2(prepare, args);
+
+    Py_DECREF(prepare);
+
+#if PYTHON_VERSION >= 0x364
+    if (result != NULL && unlikely(!PyMapping_Check(result))) {
+        PyErr_Format(PyExc_TypeError, "%s.__prepare__() must return a mapping, not %s",
+                     PyType_Check(metaclass) ? ((PyTypeObject *)metaclass)->tp_name : "<metaclass>",
+                     Py_TYPE(result)->tp_name);
+
+        Py_DECREF(result);
+        return NULL;
+    }
+#endif
+
+    return result;
+}
+
+PyObject *BUILD_CLASS(PyObject *metaclass, PyObject *class_name, PyObject *bases, PyObject *class_dict) {
+    CHECK_OBJECT(metaclass);
+    CHECK_OBJECT(class_name);
+    CHECK_OBJECT(bases);
+    CHECK_OBJECT(class_dict);
+
+    PyObject *args[3] = {class_name, bases, class_dict};
+
+    if (metaclass != (PyObject *)&PyType_Type) {
+        return CALL_FUNCTION_WITH_ARGS3(metaclass, args);
+    }
+
+    // For "type" itself, the "tp_init" has nothing to do, and the metaclass
+    // was already selected, so create the type directly.
+    PyObject *pos_args = MAKE_TUPLE(args, 3);
+
+    PyObject *result = PyType_Type.tp_new(&PyType_Type, pos_args, NULL);
+
+    Py_DECREF(pos_args);
+
+    return result;
+}
 #endif
@@ -365,3 +365,105 @@ int DICT_HAS_ITEM(PyObject *dict, PyObject *key) {
     return 1;
 #endif
 }
+
+// Before Python3.6, CPython does not limit the presizing of dictionaries, so
+// we use the limit it has since then.
+#define MAX_DICT_PRESIZE (128 * 1024)
+
+PyObject *MAKE_DICT_EMPTY_PRESIZED(Py_ssize_t size) {
+    if (size > MAX_DICT_PRESIZE) {
+        size = MAX_DICT_PRESIZE;
+    }
+
+    PyObject *result = _PyDict_NewPresized(size);
+
+    // Not getting the memory is no error, the dictionary will then grow as usual.
+    if (unlikely(result == NULL)) {
+        CLEAR_ERROR_OCCURRED();
+
+        result = PyDict_New();
+    }
+
+    CHECK_OBJECT(result);
+    return result;
+}
+
+#if PYTHON_VERSION >= 0x360
+PyObject *DICT_MAKE_FROM_TEMPLATE(PyObject *dict_template, PyObject **values) {
+    CHECK_OBJECT(dict_template);
+
+    PyDictObject *template_object = (PyDictObject *)dict_template;
+
+    assert(PyDict_CheckExact(dict_template));
+    assert(!_PyDict_HasSplitTable(template_object));
+
+    PyDictKeysObject *template_keys = template_object->ma_keys;
+
+    // The template was built by insertion only, so entries are in key order.
+    assert(template_keys->dk_nentries == template_object->ma_used);
+
+    // Size of the key table, up to the end of its entries.
+    Py_ssize_t keys_size =
+        (char *)(DK_ENTRIES(template_keys) + DK_USABLE_FRACTION(DK_SIZE(template_keys))) - (char *)template_keys;
+
+    PyDictKeysObject *keys = (PyDictKeysObject *)PyObject_MALLOC(keys_size);
+
+    // Compiled code does not check the result for errors, as other ways to
+    // create dictionaries do not fail either, running out of memory is fatal.
+    if (unlikely(keys == NULL)) {
+        Py_FatalError("Nuitka: Out of memory creating dictionary from template.");
+    }
+
+    // Cloning the key table avoids hashing and probing of the keys entirely.
+    memcpy(keys, template_keys, keys_size);
+    keys->dk_refcnt = 1;
+
+    PyDictObject *result = (PyDictObject *)PyDict_New();
+
+    if (unlikely(result == NULL)) {
+        Py_FatalError("Nuitka: Out of memory creating dictionary from template.");
+    }
+
+    // Release the shared empty key table of the new dictionary, it is static,
+    // and it is using empty split table values, while ours is combined.
+    assert(result->ma_keys->dk_refcnt > 1);
+    result->ma_keys->dk_refcnt -= 1;
+
+    result->ma_keys = keys;
+    result->ma_values = NULL;
+    result->ma_used = template_object->ma_used;
+
+    PyDictKeyEntry *entries = DK_ENTRIES(keys);
+    bool needs_tracking = false;
+
+    for (Py_ssize_t i = 0; i < result->ma_used; i++) {
+        PyObject *value = values[i];
+        CHECK_OBJECT(value);
+
+        Py_INCREF(entries[i].me_key);
+
+        Py_INCREF(value);
+        entries[i].me_value = value;
+
+        // Same as CPython, dictionaries with only atomic values are not tracked,
+        // and tuples that are not tracked count as atomic.
+        if (needs_tracking == false && PyObject_IS_GC(value)) {
+#if PYTHON_VERSION >= 0x390
+            needs_tracking = !PyTuple_CheckExact(value) || PyObject_GC_IsTracked(value);
+#else
+            needs_tracking = !PyTuple_CheckExact(value) || _PyObject_GC_IS_TRACKED(value);
+#endif
+        }
+    }
+
+#if PYTHON_VERSION >= 0x390
+    if (needs_tracking && !PyObject_GC_IsTracked((PyObject *)result)) {
+#else
+    if (needs_tracking && !_PyObject_GC_IS_TRACKED(result)) {
+#endif
+        Nuitka_GC_Track(result);
+    }
+
+    return (PyObject *)result;
+}
+#endif
@@ -196,6 +196,32 @@ bool LIST_EXTEND_FOR_UNPACK(PyObject *list, PyObject *other) {
 }
 #endif
 
+// Length hints may be far beyond what gets used, e.g. with conditions, and
+// for large sizes the growth of the list is cheap in comparison, so do not
+// reserve more than this, the same as CPython does for dictionaries.
+#define MAX_LIST_PRESIZE (128 * 1024)
+
+PyObject *MAKE_LIST_EMPTY_PRESIZED(Py_ssize_t size) {
+    PyListObject *result = (PyListObject *)PyList_New(0);
+    CHECK_OBJECT(result);
+
+    if (size > MAX_LIST_PRESIZE) {
+        size = MAX_LIST_PRESIZE;
+    }
+
+    if (size > 0) {
+        PyObject **items = (PyObject **)PyMem_Malloc(size * sizeof(PyObject *));
+
+        // Not getting the memory is no error, the list will then grow as usual.
+        if (likely(items != NULL)) {
+            result->ob_item = items;
+            result->allocated = size;
+        }
+    }
+
+    return (PyObject *)result;
+}
+
 bool LIST_APPEND1(PyObject *target, PyObject *item) {
     CHECK_OBJECT(target);
     assert(PyList_Check(target));
@@ -209,7 +235,11 @@ bool LIST_APPEND1(PyObject *target, PyObject *item) {
     // Overflow is not really realistic, so we only assert against it.
     assert(cur_size <= PY_SSIZE_T_MAX);
 
-    if (LIST_RESIZE(list, cur_size + 1) == false) {
+    // Room may be left from presizing, then there is no need to resize, which
+    // would also shrink the list to a fitting size.
+    if (likely(cur_size < list->allocated)) {
+        Py_SET_SIZE(list, cur_size + 1);
+    } else if (LIST_RESIZE(list, cur_size + 1) == false) {
         return false;
     }
 
@@ -231,7 +261,11 @@ bool LIST_APPEND0(PyObject *target, PyObject *item) {
     // Overflow is not really realistic, so we only assert against it.
     assert(cur_size <= PY_SSIZE_T_MAX);
 
-    if (LIST_RESIZE(list, cur_size + 1) == false) {
+    // Room may be left from presizing, then there is no need to resize, which
+    // would also shrink the list to a fitting size.
+    if (likely(cur_size < list->allocated)) {
+        Py_SET_SIZE(list, cur_size + 1);
+    } else if (LIST_RESIZE(list, cur_size + 1) == false) {
         return false;
     }
 
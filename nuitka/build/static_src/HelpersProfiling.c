@@ -16,83 +16,262 @@
 //     limitations under the License.
 //
 /**
- * This is responsible for profiling Nuitka using "vmprof".
+ * This is responsible for profiling compiled programs with a built-in sampling
+ * profiler.
+ *
+ * A profiling timer signal samples the compiled frames currently linked into
+ * the frame stack of the thread holding the GIL, and aggregates identical
+ * stacks in a fixed size table, so no allocation happens in the signal
+ * handler. At program end, the stacks are written in the "folded" format that
+ * flame graph tools consume. Profiled binaries are not stripped, so e.g. "perf"
+ * names the C functions of compiled functions from their symbols.
+ *
+ * Compiled frames only ever reference code objects that are created once at
+ * module initialization and never released, which is what allows to resolve
+ * their names only after sampling stopped.
+ *
+ * Environment variables controlling it at run time:
+ *
+ * NUITKA_PROFILE_OUTPUT   - Filename for the folded stacks, defaults to
+ *                           "nuitka-profile-<pid>.folded".
+ * NUITKA_PROFILE_INTERVAL - Sampling interval in micro seconds of CPU time,
+ *                           defaults to 1000.
  */
 
 #if _NUITKA_PROFILE
 
-timespec diff(timespec start, timespec end);
+#if !defined(_WIN32)
 
-static timespec getTimespecDiff(timespec start, timespec end) {
-    timespec temp;
+#include <signal.h>
+#include <sys/time.h>
+#include <unistd.h>
 
-    if ((end.tv_nsec - start.tv_nsec) < 0) {
-        temp.tv_sec = end.tv_sec - start.tv_sec - 1;
-        temp.tv_nsec = 1000000000 + end.tv_nsec - start.tv_nsec;
-    } else {
-        temp.tv_sec = end.tv_sec - start.tv_sec;
-        temp.tv_nsec = end.tv_nsec - start.tv_nsec;
-    }
+#include "pythread.h"
+
+// Deepest stack to record, the outer most frames are cut off beyond that.
+#define NUITKA_PROFILE_MAX_DEPTH 64
+
+// Distinct stacks to record, must be a power of 2.
+#define NUITKA_PROFILE_STACKS_SIZE 4096
+
+// How many slots to try before giving up on a sample.
+#define NUITKA_PROFILE_MAX_PROBES 32
+
+struct Nuitka_ProfileStack {
+    unsigned long m_hash;
+    unsigned long m_count;
+    int m_depth;
+
+    // From the inner most frame outwards, NULL for uncompiled frames.
+    PyCodeObject *m_codes[NUITKA_PROFILE_MAX_DEPTH];
+};
+
+static struct Nuitka_ProfileStack *profile_stacks = NULL;
+
+static volatile sig_atomic_t profile_active = 0;
+
+static unsigned long profile_samples = 0;
+static unsigned long profile_dropped_samples = 0;
 
-    return temp;
+static inline PyThreadState *Nuitka_Profile_getThreadStateUnchecked(void) {
+#if PYTHON_VERSION < 0x300
+    return _PyThreadState_Current;
+#elif PYTHON_VERSION < 0x352
+    return (PyThreadState *)_Py_atomic_load_relaxed(&_PyThreadState_Current);
+#else
+    return _PyThreadState_UncheckedGet();
+#endif
 }
 
-static FILE *tempfile_profile;
-static PyObject *vmprof_module;
+static void Nuitka_Profile_onSignal(int signum) {
+    if (profile_active == 0) {
+        return;
+    }
 
-static timespec time1, time2;
+    PyThreadState *tstate = Nuitka_Profile_getThreadStateUnchecked();
 
-void startProfiling(void) {
-    tempfile_profile = fopen("nuitka-performance.dat", "wb");
-
-    // Might be necessary to import "site" module to find "vmprof", lets just
-    // hope we don't suffer too much from that. If we do, what might be done
-    // is to try and just have the "PYTHONPATH" from it from out user.
-    PyImport_ImportModule("site");
-    vmprof_module = PyImport_ImportModule("vmprof");
-
-    // Abort if it's not there.
-    if (vmprof_module == NULL) {
-        PyErr_Print();
-        abort();
+    // Only the thread holding the GIL is allowed to look at its frame stack,
+    // others might be changing it while we look.
+    if (tstate == NULL || tstate->thread_id != PyThread_get_thread_ident()) {
+        profile_dropped_samples += 1;
+        return;
     }
 
-    PyObject *result = CALL_FUNCTION_WITH_SINGLE_ARG(PyObject_GetAttrString(vmprof_module, "enable"),
-                                                     PyInt_FromLong(fileno(tempfile_profile)));
+    PyCodeObject *codes[NUITKA_PROFILE_MAX_DEPTH];
+    int depth = 0;
+    unsigned long hash = 5381;
+
+    PyFrameObject *frame = tstate->frame;
+
+    while (frame != NULL && depth < NUITKA_PROFILE_MAX_DEPTH) {
+        PyCodeObject *code = NULL;
+
+        if (Nuitka_Frame_Check((PyObject *)frame)) {
+            code = frame->f_code;
+        } else if (depth > 0 && codes[depth - 1] == NULL) {
+            // Collapse runs of uncompiled frames into one entry.
+            frame = frame->f_back;
+            continue;
+        }
+
+        codes[depth++] = code;
+        hash = (hash * 33) ^ (unsigned long)(size_t)code;
+
+        frame = frame->f_back;
+    }
+
+    if (depth == 0) {
+        return;
+    }
+
+    unsigned long slot = hash;
+
+    for (int probe = 0; probe < NUITKA_PROFILE_MAX_PROBES; probe++) {
+        struct Nuitka_ProfileStack *entry = &profile_stacks[slot & (NUITKA_PROFILE_STACKS_SIZE - 1)];
+
+        if (entry->m_depth == 0) {
+            entry->m_hash = hash;
+            entry->m_depth = depth;
+            memcpy(entry->m_codes, codes, depth * sizeof(PyCodeObject *));
+        }
+
+        if (entry->m_hash == hash && entry->m_depth == depth &&
+            memcmp(entry->m_codes, codes, depth * sizeof(PyCodeObject *)) == 0) {
+            entry->m_count += 1;
+            profile_samples += 1;
+            return;
+        }
+
+        slot += 1;
+    }
+
+    profile_dropped_samples += 1;
+}
+
+static char const *Nuitka_Profile_getCodeName(PyCodeObject *code) {
+    char const *result = Nuitka_String_AsString(code->co_name);
+
+    if (result == NULL) {
+        CLEAR_ERROR_OCCURRED();
+        result = "<unknown>";
+    }
+
+    return result;
+}
+
+static char const *Nuitka_Profile_getCodeFilename(PyCodeObject *code) {
+    char const *result = Nuitka_String_AsString(code->co_filename);
 
     if (result == NULL) {
-        PyErr_Print();
-        abort();
+        CLEAR_ERROR_OCCURRED();
+        result = "<unknown>";
+    }
+
+    return result;
+}
+
+static void Nuitka_Profile_writeFoldedStacks(char const *filename) {
+    FILE *output = fopen(filename, "w");
+
+    if (output == NULL) {
+        fprintf(stderr, "Nuitka: Failed to open profile output '%s'.\n", filename);
+        return;
+    }
+
+    for (int i = 0; i < NUITKA_PROFILE_STACKS_SIZE; i++) {
+        struct Nuitka_ProfileStack *entry = &profile_stacks[i];
+
+        if (entry->m_depth == 0) {
+            continue;
+        }
+
+        // Folded stacks list the outer most frame first.
+        for (int j = entry->m_depth - 1; j >= 0; j--) {
+            PyCodeObject *code = entry->m_codes[j];
+
+            if (code == NULL) {
+                fputs("[uncompiled]", output);
+            } else {
+                fprintf(output, "%s (%s:%d)", Nuitka_Profile_getCodeName(code), Nuitka_Profile_getCodeFilename(code),
+                        code->co_firstlineno);
+            }
+
+            if (j > 0) {
+                fputc(';', output);
+            }
+        }
+
+        fprintf(output, " %lu\n", entry->m_count);
     }
 
-    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time1);
+    fclose(output);
+}
+
+void startProfiling(void) {
+    profile_stacks =
+        (struct Nuitka_ProfileStack *)calloc(NUITKA_PROFILE_STACKS_SIZE, sizeof(struct Nuitka_ProfileStack));
+
+    long interval = 1000;
+
+    char const *interval_env = getenv("NUITKA_PROFILE_INTERVAL");
+    if (interval_env != NULL && atol(interval_env) > 0) {
+        interval = atol(interval_env);
+    }
+
+    struct sigaction action;
+    memset(&action, 0, sizeof(action));
+    action.sa_handler = Nuitka_Profile_onSignal;
+    action.sa_flags = SA_RESTART;
+    sigemptyset(&action.sa_mask);
+
+    sigaction(SIGPROF, &action, NULL);
+
+    struct itimerval timer;
+    timer.it_interval.tv_sec = interval / 1000000;
+    timer.it_interval.tv_usec = interval % 1000000;
+    timer.it_value = timer.it_interval;
+
+    profile_active = 1;
+
+    setitimer(ITIMER_PROF, &timer, NULL);
 }
 
 void stopProfiling(void) {
-    clock_gettime(CLOCK_PROCESS_CPUTIME_ID, &time2);
+    struct itimerval timer;
+    memset(&timer, 0, sizeof(timer));
+    setitimer(ITIMER_PROF, &timer, NULL);
+
+    profile_active = 0;
 
     // Save the current exception, if any, we must preserve it.
     PyObject *save_exception_type, *save_exception_value;
     PyTracebackObject *save_exception_tb;
     FETCH_ERROR_OCCURRED(&save_exception_type, &save_exception_value, &save_exception_tb);
 
-    PyObject *result = CALL_FUNCTION_NO_ARGS(PyObject_GetAttrString(vmprof_module, "disable"));
+    char const *filename = getenv("NUITKA_PROFILE_OUTPUT");
+    char default_filename[64];
 
-    if (result == NULL)
-        CLEAR_ERROR_OCCURRED();
+    if (filename == NULL) {
+        snprintf(default_filename, sizeof(default_filename), "nuitka-profile-%ld.folded", (long)getpid());
+        filename = default_filename;
+    }
+
+    Nuitka_Profile_writeFoldedStacks(filename);
 
-    fclose(tempfile_profile);
+    if (profile_dropped_samples > 0) {
+        fprintf(stderr, "Nuitka: Profiling dropped %lu of %lu samples.\n", profile_dropped_samples,
+                profile_samples + profile_dropped_samples);
+    }
 
-    FILE *tempfile_times = fopen("nuitka-times.dat", "wb");
+    RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
+}
 
-    timespec diff = getTimespecDiff(time1, time2);
+#else
 
-    long delta_ns = diff.tv_sec * 1000000000 + diff.tv_nsec;
-    fprintf(tempfile_times, "%ld\n", delta_ns);
+void startProfiling(void) { fprintf(stderr, "Nuitka: Sampling profiler is not supported on this platform.\n"); }
 
-    fclose(tempfile_times);
+void stopProfiling(void) {}
 
-    RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
-}
+#endif
 
 #endif
@@ -576,4 +576,152 @@ bool UNICODE_APPEND(PyObject **p_left, PyObject *right) {
 
     return true;
 }
+
+// Decimal digits of the value, which fits into a C long.
+static Py_ssize_t _NuitkaLong_DecimalLength(long value) {
+    unsigned long magnitude = value < 0 ? 0UL - (unsigned long)value : (unsigned long)value;
+
+    Py_ssize_t result = value < 0 ? 2 : 1;
+
+    while (magnitude >= 10) {
+        magnitude /= 10;
+        result += 1;
+    }
+
+    return result;
+}
+
+static void _NuitkaLong_WriteDecimal(int kind, void *data, Py_ssize_t end, long value) {
+    unsigned long magnitude = value < 0 ? 0UL - (unsigned long)value : (unsigned long)value;
+
+    // Digits are written backwards from the end position.
+    do {
+        end -= 1;
+        PyUnicode_WRITE(kind, data, end, (Py_UCS4)('0' + magnitude % 10));
+        magnitude /= 10;
+    } while (magnitude != 0);
+
+    if (value < 0) {
+        PyUnicode_WRITE(kind, data, end - 1, (Py_UCS4)'-');
+    }
+}
+
+static PyObject *_UNICODE_BUILD_STRING_GENERIC(PyObject **parts, Py_ssize_t count) {
+    PyObject *values = PyTuple_New(count);
+
+    if (unlikely(values == NULL)) {
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *value = parts[i];
+
+        if (PyLong_CheckExact(value)) {
+            value = PyObject_Str(value);
+
+            if (unlikely(value == NULL)) {
+                Py_DECREF(values);
+                return NULL;
+            }
+        } else {
+            Py_INCREF(value);
+        }
+
+        PyTuple_SET_ITEM(values, i, value);
+    }
+
+    PyObject *result = PyUnicode_Join(const_str_empty, values);
+    Py_DECREF(values);
+
+    return result;
+}
+
+PyObject *UNICODE_BUILD_STRING(PyObject **parts, Py_ssize_t count) {
+    Py_ssize_t length = 0;
+    Py_UCS4 maxchar = 127;
+
+    // First pass, determine the size and the character width of the result.
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *part = parts[i];
+        CHECK_OBJECT(part);
+
+        Py_ssize_t part_length;
+
+        if (PyLong_CheckExact(part)) {
+            int overflow;
+            long value = PyLong_AsLongAndOverflow(part, &overflow);
+
+            // Large values take their own string object anyway.
+            if (unlikely(overflow != 0)) {
+                return _UNICODE_BUILD_STRING_GENERIC(parts, count);
+            }
+
+            part_length = _NuitkaLong_DecimalLength(value);
+        } else {
+            if (unlikely(!PyUnicode_Check(part))) {
+                return _UNICODE_BUILD_STRING_GENERIC(parts, count);
+            }
+
+            if (unlikely(PyUnicode_READY(part) == -1)) {
+                return NULL;
+            }
+
+            part_length = PyUnicode_GET_LENGTH(part);
+
+            Py_UCS4 part_maxchar = PyUnicode_MAX_CHAR_VALUE(part);
+            maxchar = Py_MAX(maxchar, part_maxchar);
+        }
+
+        if (unlikely(length > PY_SSIZE_T_MAX - part_length)) {
+            SET_CURRENT_EXCEPTION_TYPE0_STR(PyExc_OverflowError, "join() result is too long for a Python string");
+            return NULL;
+        }
+
+        length += part_length;
+    }
+
+    if (length == 0) {
+        Py_INCREF(const_str_empty);
+        return const_str_empty;
+    }
+
+    if (count == 1 && PyUnicode_CheckExact(parts[0])) {
+        Py_INCREF(parts[0]);
+        return parts[0];
+    }
+
+    PyObject *result = PyUnicode_New(length, maxchar);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    int kind = PyUnicode_KIND(result);
+    void *data = PyUnicode_DATA(result);
+
+    // Second pass, copy strings and write integers into the result.
+    Py_ssize_t position = 0;
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *part = parts[i];
+
+        if (PyLong_CheckExact(part)) {
+            long value = PyLong_AsLong(part);
+
+            position += _NuitkaLong_DecimalLength(value);
+            _NuitkaLong_WriteDecimal(kind, data, position, value);
+        } else {
+            Py_ssize_t part_length = PyUnicode_GET_LENGTH(part);
+
+            if (part_length != 0) {
+                _NuitkaUnicode_FastCopyCharacters(result, position, part, 0, part_length);
+                position += part_length;
+            }
+        }
+    }
+
+    assert(position == length);
+
+    return result;
+}
 #endif
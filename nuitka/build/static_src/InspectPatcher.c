@@ -366,7 +366,18 @@ static void Nuitka_tb_dealloc(PyTracebackObject *tb) {
 #endif
 
     Py_XDECREF(tb->tb_next);
-    Py_XDECREF(tb->tb_frame);
+
+    // When only the frame cache of its function keeps the frame alive after
+    // this, its attached locals are no longer observable. Release them now,
+    // as CPython would when releasing the frame, and not only on reuse.
+    PyFrameObject *frame = tb->tb_frame;
+
+    if (frame != NULL && Nuitka_Frame_Check((PyObject *)frame) && Py_REFCNT(frame) == 2 &&
+        ((struct Nuitka_FrameObject *)frame)->m_is_cached) {
+        Nuitka_Frame_ReleaseLocals((struct Nuitka_FrameObject *)frame);
+    }
+
+    Py_XDECREF(frame);
 
     releaseToFreeList(free_list_tracebacks, tb, MAX_TRACEBACK_FREE_LIST_COUNT);
 
@@ -41,6 +41,7 @@
 #undef Py_BUILD_CORE
 #endif
 #include "nuitka/unfreezing.h"
+#include "pythread.h"
 
 #ifdef _WIN32
 #include <windows.h>
@@ -820,8 +821,333 @@ static void _fixupSpecAttribute(PyObject *module) {
 // Pointers to bytecode data.
 static char **_bytecode_data = NULL;
 
+// For the startup import report, the names of the modules loaded so far, in
+// the order of loading, and the file to write them to.
+static char const *_startup_import_report_filename = NULL;
+static char const **_startup_imports = NULL;
+static int _startup_imports_count = 0;
+static int _startup_imports_size = 0;
+
+static void recordStartupImport(struct Nuitka_MetaPathBasedLoaderEntry *entry) {
+    if (_startup_import_report_filename == NULL) {
+        return;
+    }
+
+    // Modules whose body failed may be imported again, report them once only.
+    if ((entry->flags & NUITKA_STARTUP_IMPORT_RECORDED_FLAG) != 0) {
+        return;
+    }
+
+    if (_startup_imports_count == _startup_imports_size) {
+        int new_size = _startup_imports_size * 2 + 64;
+        char const **new_startup_imports =
+            (char const **)realloc((void *)_startup_imports, new_size * sizeof(char *));
+
+        // Not worth failing the program for.
+        if (unlikely(new_startup_imports == NULL)) {
+            free((void *)_startup_imports);
+            _startup_imports = NULL;
+            _startup_imports_count = 0;
+            _startup_imports_size = 0;
+
+            _startup_import_report_filename = NULL;
+            return;
+        }
+
+        _startup_imports = new_startup_imports;
+        _startup_imports_size = new_size;
+    }
+
+    entry->flags |= NUITKA_STARTUP_IMPORT_RECORDED_FLAG;
+
+    // Entry names are static, no need to copy them.
+    _startup_imports[_startup_imports_count] = entry->name;
+    _startup_imports_count += 1;
+}
+
+static void writeStartupImportReport(void) {
+    if (_startup_import_report_filename == NULL) {
+        return;
+    }
+
+    FILE *report_file = fopen(_startup_import_report_filename, "w");
+
+    if (report_file == NULL) {
+        return;
+    }
+
+    for (int i = 0; i < _startup_imports_count; i++) {
+        fprintf(report_file, "%s\n", _startup_imports[i]);
+    }
+
+    fclose(report_file);
+}
+
+// Type for compiled modules, whose body was not yet executed. It differs from
+// the module type only in the attribute lookup, which executes the module body
+// first, and then turns it into a normal module. It poses as the module type,
+// for "__class__" and the compiled "type" built-in.
+PyTypeObject Nuitka_LazyModule_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "module", // tp_name
+    sizeof(PyModuleObject),                  // tp_size
+};
+
+// The deferred modules whose body is executing. Other threads wait for them
+// on the module lock, and the executing thread, e.g. through circular
+// imports, sees them half executed, as with normal imports.
+static PyObject *_lazy_modules_executing = NULL;
+
+#if PYTHON_VERSION >= 0x300
+// The module locks of "importlib" are used, so its deadlock detection covers
+// imports waiting for deferred module bodies, and the other way around.
+static PyObject *_get_module_lock = NULL;
+static PyObject *_deadlock_error = NULL;
+
+// Returns the lock to release, Py_None if acquiring it would deadlock, or NULL
+// for an error.
+static PyObject *acquireLazyModuleLock(PyObject *module_name) {
+    if (_get_module_lock == NULL) {
+        PyObject *bootstrap = PyImport_ImportModule("_frozen_importlib");
+
+        if (unlikely(bootstrap == NULL)) {
+            return NULL;
+        }
+
+        _get_module_lock = PyObject_GetAttrString(bootstrap, "_get_module_lock");
+        _deadlock_error = PyObject_GetAttrString(bootstrap, "_DeadlockError");
+
+        Py_DECREF(bootstrap);
+
+        if (unlikely(_get_module_lock == NULL || _deadlock_error == NULL)) {
+            Py_XDECREF(_get_module_lock);
+            _get_module_lock = NULL;
+            Py_XDECREF(_deadlock_error);
+            _deadlock_error = NULL;
+
+            return NULL;
+        }
+    }
+
+    PyObject *lock = CALL_FUNCTION_WITH_SINGLE_ARG(_get_module_lock, module_name);
+
+    if (unlikely(lock == NULL)) {
+        return NULL;
+    }
+
+    PyObject *res = PyObject_CallMethod(lock, (char *)"acquire", NULL);
+
+    if (unlikely(res == NULL)) {
+        Py_DECREF(lock);
+
+        // Same as for concurrent circular imports, the module is then given
+        // half executed.
+        if (EXCEPTION_MATCH_BOOL_SINGLE(GET_ERROR_OCCURRED(), _deadlock_error)) {
+            CLEAR_ERROR_OCCURRED();
+
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+
+        return NULL;
+    }
+
+    Py_DECREF(res);
+
+    return lock;
+}
+
+static void releaseLazyModuleLock(PyObject *lock) {
+    if (lock != Py_None) {
+        PyObject *save_exception_type, *save_exception_value;
+        PyTracebackObject *save_exception_tb;
+        FETCH_ERROR_OCCURRED(&save_exception_type, &save_exception_value, &save_exception_tb);
+
+        PyObject *res = PyObject_CallMethod(lock, (char *)"release", NULL);
+        assert(res != NULL);
+        Py_DECREF(res);
+
+        RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
+    }
+
+    Py_DECREF(lock);
+}
+#else
+// The import lock of Python2 is global and re-entrant, and module bodies are
+// executed holding it for normal imports as well.
+static PyObject *acquireLazyModuleLock(PyObject *module_name) {
+    _PyImport_AcquireLock();
+
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+
+static void releaseLazyModuleLock(PyObject *lock) {
+    int res = _PyImport_ReleaseLock();
+    assert(res == 1);
+
+    Py_DECREF(lock);
+}
+#endif
+
+static void removeFailedLazyModule(PyObject *module, PyObject *module_name) {
+    // Like CPython does for failed imports, the module is removed, so a new
+    // import executes it again, rather than giving the half executed one.
+    PyObject *sys_modules = PyImport_GetModuleDict();
+
+    if (PyDict_GetItem(sys_modules, module_name) == module) {
+        PyObject *save_exception_type, *save_exception_value;
+        PyTracebackObject *save_exception_tb;
+        FETCH_ERROR_OCCURRED(&save_exception_type, &save_exception_value, &save_exception_tb);
+
+        int res = PyDict_DelItem(sys_modules, module_name);
+        assert(res == 0);
+
+        RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
+    }
+}
+
+static bool executeLazyModule(PyObject *module) {
+    if (_lazy_modules_executing == NULL) {
+        _lazy_modules_executing = PySet_New(NULL);
+        CHECK_OBJECT(_lazy_modules_executing);
+    }
+
+    PyObject *module_name = MODULE_NAME1(module);
+
+    PyObject *lock = acquireLazyModuleLock(module_name);
+
+    if (unlikely(lock == NULL)) {
+        Py_DECREF(module_name);
+        return false;
+    }
+
+    // Another thread may have executed it while we waited for the lock. The
+    // module locks are re-entrant, and it may be executing in this thread,
+    // or by a thread that waits for us, if a deadlock was avoided.
+    if (Py_TYPE(module) != &Nuitka_LazyModule_Type || PySet_Contains(_lazy_modules_executing, module) == 1) {
+        releaseLazyModuleLock(lock);
+
+        Py_DECREF(module_name);
+        return true;
+    }
+
+    char const *name = Nuitka_String_AsString(module_name);
+
+    struct Nuitka_MetaPathBasedLoaderEntry *entry = findEntry(name);
+    assert(entry != NULL);
+
+    if (isVerbose()) {
+        PySys_WriteStderr("Executing deferred %s\n", name);
+    }
+
+    recordStartupImport(entry);
+
+    int res = PySet_Add(_lazy_modules_executing, module);
+    assert(res == 0);
+
+    PyObject *result = entry->python_initfunc(module, entry);
+    CHECK_OBJECT_X(result);
+
+    res = PySet_Discard(_lazy_modules_executing, module);
+    assert(res == 1);
+
+    // It is a normal module from now on, complete or not.
+    ((PyObject *)module)->ob_type = &PyModule_Type;
+
+    if (unlikely(result == NULL)) {
+        removeFailedLazyModule(module, module_name);
+
+        releaseLazyModuleLock(lock);
+
+        Py_DECREF(module_name);
+        return false;
+    }
+
+    releaseLazyModuleLock(lock);
+
+#if PYTHON_VERSION >= 0x340
+    _fixupSpecAttribute(result);
+#endif
+
+    loadTriggeredModule(name, "-postLoad");
+
+    Py_DECREF(module_name);
+
+    return !ERROR_OCCURRED();
+}
+
+// The import machinery looks at these for modules already imported, which is
+// not yet a use of the module.
+static bool isLazyModuleNeutralAttribute(PyObject *attr_name) {
+    if (PyObject_RichCompareBool(attr_name, const_str_plain___name__, Py_EQ) == 1) {
+        return true;
+    }
+#if PYTHON_VERSION >= 0x300
+    if (PyObject_RichCompareBool(attr_name, const_str_plain___loader__, Py_EQ) == 1) {
+        return true;
+    }
+#endif
+#if PYTHON_VERSION >= 0x340
+    if (PyObject_RichCompareBool(attr_name, const_str_plain___spec__, Py_EQ) == 1) {
+        return true;
+    }
+#endif
+
+    return false;
+}
+
+static PyObject *Nuitka_LazyModule_tp_getattro(PyObject *module, PyObject *attr_name) {
+    if (PyObject_RichCompareBool(attr_name, const_str_plain___class__, Py_EQ) == 1) {
+        Py_INCREF(&PyModule_Type);
+        return (PyObject *)&PyModule_Type;
+    }
+
+    if (!isLazyModuleNeutralAttribute(attr_name)) {
+        if (unlikely(!executeLazyModule(module))) {
+            return NULL;
+        }
+    }
+
+    return PyModule_Type.tp_getattro(module, attr_name);
+}
+
+static void _initLazyModuleType(void) {
+    static bool init_done = false;
+
+    if (init_done) {
+        return;
+    }
+
+    // Same as for the builtin module type, PyType_Ready won't copy all members
+    // from the base type, so we copy them from PyModule_Type manually.
+    Nuitka_LazyModule_Type.tp_dealloc = PyModule_Type.tp_dealloc;
+    Nuitka_LazyModule_Type.tp_repr = PyModule_Type.tp_repr;
+    Nuitka_LazyModule_Type.tp_setattro = PyModule_Type.tp_setattro;
+    Nuitka_LazyModule_Type.tp_getattro = Nuitka_LazyModule_tp_getattro;
+    Nuitka_LazyModule_Type.tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC;
+    Nuitka_LazyModule_Type.tp_doc = PyModule_Type.tp_doc;
+    Nuitka_LazyModule_Type.tp_traverse = PyModule_Type.tp_traverse;
+    Nuitka_LazyModule_Type.tp_clear = PyModule_Type.tp_clear;
+    Nuitka_LazyModule_Type.tp_members = PyModule_Type.tp_members;
+    Nuitka_LazyModule_Type.tp_base = &PyModule_Type;
+    Nuitka_LazyModule_Type.tp_dictoffset = PyModule_Type.tp_dictoffset;
+    Nuitka_LazyModule_Type.tp_init = PyModule_Type.tp_init;
+    Nuitka_LazyModule_Type.tp_alloc = PyModule_Type.tp_alloc;
+    Nuitka_LazyModule_Type.tp_new = PyModule_Type.tp_new;
+    Nuitka_LazyModule_Type.tp_free = PyModule_Type.tp_free;
+    int res = PyType_Ready(&Nuitka_LazyModule_Type);
+    assert(res == 0);
+
+    init_done = true;
+}
+
 static PyObject *loadModule(PyObject *module, PyObject *module_name,
                             struct Nuitka_MetaPathBasedLoaderEntry const *entry) {
+    // Deferred modules are recorded when actually executed.
+    if ((entry->flags & NUITKA_LAZY_FLAG) == 0) {
+        recordStartupImport((struct Nuitka_MetaPathBasedLoaderEntry *)entry);
+    }
+
 #ifdef _NUITKA_STANDALONE
     if ((entry->flags & NUITKA_SHLIB_FLAG) != 0) {
         // Append the the entry name from full path module name with dots,
@@ -869,6 +1195,18 @@ static PyObject *loadModule(PyObject *module, PyObject *module_name,
         bool res = Nuitka_SetModule(module_name, module);
         assert(res != false);
 
+        // Execution of the module body is deferred until first use.
+        if ((entry->flags & NUITKA_LAZY_FLAG) != 0) {
+            _initLazyModuleType();
+            ((PyObject *)module)->ob_type = &Nuitka_LazyModule_Type;
+
+            if (isVerbose()) {
+                PySys_WriteStderr("Deferred %s\n", entry->name);
+            }
+
+            return Nuitka_GetModule(module_name);
+        }
+
         // Run the compiled module code, we get the module returned.
         PyObject *result = entry->python_initfunc(module, entry);
         CHECK_OBJECT_X(result);
@@ -928,6 +1266,11 @@ static PyObject *_EXECUTE_EMBEDDED_MODULE(PyObject *module, PyObject *module_nam
         }
     }
 
+    // For deferred modules, this happens when the module body is executed.
+    if (result != NULL && Py_TYPE(result) == &Nuitka_LazyModule_Type) {
+        return result;
+    }
+
     if (result != NULL) {
         // Execute the "postLoad" code produced for the module potentially. This
         // is from plug-ins typically, that want to modify the module immediately
@@ -1519,7 +1862,7 @@ PyObject *Nuitka_Loader_New(struct Nuitka_MetaPathBasedLoaderEntry const *entry)
 }
 
 void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loader_entries,
-                                    unsigned char **bytecode_data) {
+                                    unsigned char **bytecode_data, char const *startup_import_report_filename) {
     // Do it only once.
     if (loader_entries) {
         assert(_loader_entries == loader_entries);
@@ -1529,6 +1872,12 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
 
     _bytecode_data = (char **)bytecode_data;
 
+    if (startup_import_report_filename != NULL) {
+        _startup_import_report_filename = startup_import_report_filename;
+
+        Py_AtExit(writeStartupImportReport);
+    }
+
     if (isVerbose()) {
         PySys_WriteStderr("Setup nuitka compiled module/bytecode/shlib importer.\n");
     }
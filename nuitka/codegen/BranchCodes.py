@@ -19,13 +19,226 @@
 
 """
 
+from nuitka.Options import shallTraceExecution
+from nuitka.PythonVersions import python_version
+
 from .CodeHelpers import generateStatementSequenceCode
 from .ConditionalCodes import generateConditionCode
 from .Emission import withSubCollector
+from .ErrorCodes import getReleaseCode
 from .LabelCodes import getGotoCode, getLabelCode
+from .VariableCodes import getVariableReferenceCode
+
+# Exact types of constants, for which comparing equal with a value of the same
+# exact type has no side effects, and that a dictionary lookup can do.
+if python_version < 0x300:
+    _switch_constant_types = {str: "&PyString_Type", int: "&PyInt_Type"}
+else:
+    _switch_constant_types = {
+        str: "&PyUnicode_Type",
+        bytes: "&PyBytes_Type",
+        int: "&PyLong_Type",
+    }
+
+# Shorter chains are not worth the dispatch.
+_switch_min_cases = 4
+
+
+def _getSwitchCase(statement):
+    condition = statement.subnode_condition
+
+    if not condition.isExpressionComparisonEq():
+        return None, None
+
+    left = condition.subnode_left
+    right = condition.subnode_right
+
+    if left.isExpressionConstantRef():
+        left, right = right, left
+
+    if not right.isExpressionConstantRef():
+        return None, None
+
+    if not left.isExpressionVariableRef() and not left.isExpressionTempVariableRef():
+        return None, None
+
+    return left, right.getCompileTimeConstant()
+
+
+def _getSwitchChain(statement):
+    """Get the cases of an if/elif chain comparing one variable to constants.
+
+    Returns the variable reference of the first comparison, the cases as a
+    list of conditional statements and their constants, and the final "else"
+    branch, or None if this is not such a chain.
+    """
+
+    subject, constant = _getSwitchCase(statement)
+
+    if subject is None or type(constant) not in _switch_constant_types:
+        return None
+
+    constant_type = type(constant)
+    variable = subject.getVariable()
+
+    cases = []
+
+    while True:
+        cases.append((statement, constant))
+
+        no_branch = statement.subnode_no_branch
+
+        if no_branch is None or len(no_branch.subnode_statements) != 1:
+            break
+
+        next_statement = no_branch.subnode_statements[0]
+
+        if not next_statement.isStatementConditional():
+            break
+
+        next_subject, next_constant = _getSwitchCase(next_statement)
+
+        if (
+            next_subject is None
+            or next_subject.getVariable() is not variable
+            or type(next_constant) is not constant_type
+        ):
+            break
+
+        statement = next_statement
+        constant = next_constant
+
+    if len(cases) < _switch_min_cases:
+        return None
+
+    return subject, cases, statement.subnode_no_branch
+
+
+def _generateSwitchBranchCode(subject, cases, else_branch, emit, context):
+    case_targets = [context.allocateLabel("switch_case") for _case in cases]
+    condition_targets = [context.allocateLabel("switch_condition") for _case in cases]
+    else_target = context.allocateLabel("switch_else")
+    end_target = context.allocateLabel("switch_end")
+
+    # The constants map to the first case that compares equal to them.
+    dispatch_dict = {}
+    for count, (_statement, constant) in enumerate(cases):
+        dispatch_dict.setdefault(constant, count)
+
+    constant_type = type(cases[0][1])
+
+    # For values of the exact type of the constants, we can jump directly to the
+    # branch, otherwise the comparisons are done one by one, since they may run
+    # arbitrary code.
+    with withSubCollector(emit, context) as subject_emit:
+        subject_name = context.allocateTempName("switch_subject")
+        index_name = context.allocateTempName("switch_index", "int")
+
+        # The reference node itself is generated by the first comparison, so
+        # the value is taken directly from the variable here, and errors for
+        # unassigned variables are attributed to it.
+        old_source_ref = context.setCurrentSourceCodeReference(
+            subject.getSourceReference()
+        )
+
+        getVariableReferenceCode(
+            to_name=subject_name,
+            variable=subject.getVariable(),
+            variable_trace=subject.getVariableTrace(),
+            needs_check=subject.mayRaiseException(BaseException),
+            conversion_check=False,
+            emit=subject_emit,
+            context=context,
+        )
+
+        context.setCurrentSourceCodeReference(old_source_ref)
+
+        subject_emit(
+            "%s = Py_TYPE(%s) == %s ? DICT_GET_SWITCH_INDEX(%s, %s) : -2;"
+            % (
+                index_name,
+                subject_name,
+                _switch_constant_types[constant_type],
+                context.getConstantCode(dispatch_dict),
+                subject_name,
+            )
+        )
+
+        getReleaseCode(subject_name, subject_emit, context)
+
+        subject_emit("switch (%s) {" % index_name)
+
+        for count, case_target in enumerate(case_targets):
+            if dispatch_dict[cases[count][1]] == count:
+                subject_emit("case %d:\n    goto %s;" % (count, case_target))
+
+        subject_emit(
+            """\
+case -1:
+    goto %s;
+default:
+    break;
+}"""
+            % else_target
+        )
+
+    old_true_target = context.getTrueBranchTarget()
+    old_false_target = context.getFalseBranchTarget()
+
+    for count, (statement, _constant) in enumerate(cases):
+        if count > 0:
+            getLabelCode(condition_targets[count], emit)
+
+        context.setTrueBranchTarget(case_targets[count])
+        context.setFalseBranchTarget(
+            condition_targets[count + 1] if count + 1 < len(cases) else else_target
+        )
+
+        with withSubCollector(emit, context) as condition_emit:
+            generateConditionCode(
+                condition=statement.subnode_condition,
+                emit=condition_emit,
+                context=context,
+            )
+
+        context.setTrueBranchTarget(old_true_target)
+        context.setFalseBranchTarget(old_false_target)
+
+    for count, (statement, _constant) in enumerate(cases):
+        getLabelCode(case_targets[count], emit)
+
+        generateStatementSequenceCode(
+            statement_sequence=statement.subnode_yes_branch, emit=emit, context=context
+        )
+
+        getGotoCode(end_target, emit)
+
+    getLabelCode(else_target, emit)
+
+    if else_branch is not None:
+        generateStatementSequenceCode(
+            statement_sequence=else_branch, emit=emit, context=context
+        )
+
+    getLabelCode(end_target, emit)
 
 
 def generateBranchCode(statement, emit, context):
+    if not shallTraceExecution():
+        switch_chain = _getSwitchChain(statement)
+
+        if switch_chain is not None:
+            subject, cases, else_branch = switch_chain
+
+            _generateSwitchBranchCode(
+                subject=subject,
+                cases=cases,
+                else_branch=else_branch,
+                emit=emit,
+                context=context,
+            )
+
+            return
 
     true_target = context.allocateLabel("branch_yes")
     false_target = context.allocateLabel("branch_no")
@@ -18,7 +18,8 @@
 """ Codes for classes.
 
 Most the class specific stuff is solved in re-formulation. Only the selection
-of the metaclass remains as specific.
+of the metaclass, and for classes without keywords, the preparation of the
+namespace and the creation remain as specific.
 """
 
 from nuitka.PythonVersions import python_version
@@ -56,6 +57,71 @@ def generateSelectMetaclassCode(to_name, expression, emit, context):
         context.addCleanupTempName(value_name)
 
 
+def generateClassNamespacePrepareCode(to_name, expression, emit, context):
+    metaclass_name, bases_name = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
+
+    # This is used for Python3 only.
+    assert python_version >= 0x300
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "prepared_value", expression, emit, context
+    ) as value_name:
+
+        emit(
+            "%s = PREPARE_CLASS_NAMESPACE(%s, %s, %s);"
+            % (
+                value_name,
+                metaclass_name,
+                context.getConstantCode(constant=expression.getClassName()),
+                bases_name,
+            )
+        )
+
+        getErrorExitCode(
+            check_name=value_name,
+            release_names=(metaclass_name, bases_name),
+            emit=emit,
+            context=context,
+        )
+
+        context.addCleanupTempName(value_name)
+
+
+def generateClassCreationCode(to_name, expression, emit, context):
+    metaclass_name, bases_name, dict_name = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
+
+    # This is used for Python3 only.
+    assert python_version >= 0x300
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "class_value", expression, emit, context
+    ) as value_name:
+
+        emit(
+            "%s = BUILD_CLASS(%s, %s, %s, %s);"
+            % (
+                value_name,
+                metaclass_name,
+                context.getConstantCode(constant=expression.getClassName()),
+                bases_name,
+                dict_name,
+            )
+        )
+
+        getErrorExitCode(
+            check_name=value_name,
+            release_names=(metaclass_name, bases_name, dict_name),
+            emit=emit,
+            context=context,
+        )
+
+        context.addCleanupTempName(value_name)
+
+
 def generateBuiltinSuperCode(to_name, expression, emit, context):
     type_name, object_name = generateChildExpressionsCode(
         expression=expression, emit=emit, context=context
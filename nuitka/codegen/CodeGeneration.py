@@ -73,7 +73,12 @@ from .BuiltinCodes import (
     generateBuiltinXrange3Code,
 )
 from .CallCodes import generateCallCode, getCallsCode, getCallsDecls
-from .ClassCodes import generateBuiltinSuperCode, generateSelectMetaclassCode
+from .ClassCodes import (
+    generateBuiltinSuperCode,
+    generateClassCreationCode,
+    generateClassNamespacePrepareCode,
+    generateSelectMetaclassCode,
+)
 from .CodeHelpers import setExpressionDispatchDict, setStatementDispatchDict
 from .ComparisonCodes import (
     generateBuiltinIsinstanceCode,
@@ -102,6 +107,7 @@ from .CoroutineCodes import (
 from .DictCodes import (
     generateBuiltinDictCode,
     generateDictionaryCreationCode,
+    generateDictionaryPresizedCreationCode,
     generateDictOperationGetCode,
     generateDictOperationInCode,
     generateDictOperationRemoveCode,
@@ -185,6 +191,7 @@ from .ListCodes import (
     generateListOperationAppendCode,
     generateListOperationExtendCode,
     generateListOperationPopCode,
+    generateListPresizedCreationCode,
 )
 from .LocalsDictCodes import (
     generateLocalsDictDelCode,
@@ -205,6 +212,7 @@ from .ModuleCodes import (
     generateModuleAttributeFileCode,
     generateNuitkaLoaderCreationCode,
     getModuleCode,
+    getUnityCode,
 )
 from .OperationCodes import (
     generateOperationBinaryCode,
@@ -487,6 +495,10 @@ def generateHelpersCode():
     )
 
 
+def generateUnityCode(module_entries):
+    return getUnityCode(module_entries)
+
+
 setExpressionDispatchDict(
     {
         "EXPRESSION_ATTRIBUTE_CHECK": generateAttributeCheckCode,
@@ -641,7 +653,9 @@ setExpressionDispatchDict(
         "EXPRESSION_MAKE_SET_LITERAL": generateSetLiteralCreationCode,
         "EXPRESSION_MAKE_TUPLE": generateTupleCreationCode,
         "EXPRESSION_MAKE_LIST": generateListCreationCode,
+        "EXPRESSION_MAKE_LIST_PRESIZED": generateListPresizedCreationCode,
         "EXPRESSION_MAKE_DICT": generateDictionaryCreationCode,
+        "EXPRESSION_MAKE_DICT_PRESIZED": generateDictionaryPresizedCreationCode,
         "EXPRESSION_OPERATION_BINARY_ADD": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_SUB": generateOperationBinaryCode,
         "EXPRESSION_OPERATION_BINARY_MULT": generateOperationBinaryCode,
@@ -695,6 +709,8 @@ setExpressionDispatchDict(
         "EXPRESSION_ASYNC_ITER": generateAsyncIterCode,
         "EXPRESSION_ASYNC_NEXT": generateAsyncNextCode,
         "EXPRESSION_SELECT_METACLASS": generateSelectMetaclassCode,
+        "EXPRESSION_CLASS_NAMESPACE_PREPARE": generateClassNamespacePrepareCode,
+        "EXPRESSION_CLASS_CREATION": generateClassCreationCode,
         "EXPRESSION_STRING_CONCATENATION": generateStringContenationCode,
         "EXPRESSION_BUILTIN_FORMAT": generateBuiltinFormatCode,
         "EXPRESSION_BUILTIN_ASCII": generateBuiltinAsciiCode,
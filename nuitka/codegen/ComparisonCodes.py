@@ -21,8 +21,17 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 "isinstance" check as used in conditions, as well as exception matching.
 """
 
+from nuitka.Constants import isHashSearchableConstant
 from nuitka.containers.oset import OrderedSet
-from nuitka.nodes.shapes.BuiltinTypeShapes import tshape_bool
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    tshape_bool,
+    tshape_dict,
+    tshape_frozenset,
+    tshape_set,
+    tshape_str,
+    tshapes_hash_searchable,
+)
+from nuitka.PythonVersions import python_version
 
 from . import OperatorCodes
 from .CodeHelpers import generateExpressionCode, pickCodeHelper
@@ -103,6 +112,31 @@ specialized_cmp_helpers_set = OrderedSet(
 )
 
 
+def _getContainsCode(left, right, left_name, right_name, context):
+    right_shape = right.getTypeShape()
+
+    # The container goes first in the API.
+    if right_shape is tshape_dict:
+        return "PyDict_Contains(%s, %s)" % (right_name, left_name)
+    elif (
+        right_shape in (tshape_set, tshape_frozenset)
+        and left.getTypeShape() in tshapes_hash_searchable
+    ):
+        return "PySet_Contains(%s, %s)" % (right_name, left_name)
+    elif right_shape is tshape_str and python_version >= 0x300:
+        return "PyUnicode_Contains(%s, %s)" % (right_name, left_name)
+    elif (
+        right.isExpressionConstantTupleRef() or right.isExpressionConstantListRef()
+    ) and isHashSearchableConstant(right.getCompileTimeConstant()):
+        return "SEQUENCE_CONTAINS_HASH_SEARCHABLE(%s, %s, %s)" % (
+            right_name,
+            context.getConstantCode(frozenset(right.getCompileTimeConstant())),
+            left_name,
+        )
+    else:
+        return "PySequence_Contains(%s, %s)" % (right_name, left_name)
+
+
 def generateComparisonExpressionCode(to_name, expression, emit, context):
     left = expression.subnode_left
     right = expression.subnode_right
@@ -130,8 +164,17 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         res_name = context.getIntResName()
 
         emit(
-            "%s = PySequence_Contains(%s, %s);"
-            % (res_name, right_name, left_name)  # sequence goes first in the API.
+            "%s = %s;"
+            % (
+                res_name,
+                _getContainsCode(
+                    left=left,
+                    right=right,
+                    left_name=left_name,
+                    right_name=right_name,
+                    context=context,
+                ),
+            )
         )
 
         getErrorExitBoolCode(
@@ -222,6 +265,18 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
         assert False, comparator
 
 
+def _isIsinstanceCacheUseful(classes):
+    # The cache is keyed by the identity of the classes value, and keeps it
+    # alive, so it is only for values that are the same for every call.
+    if classes.isCompileTimeConstant():
+        return True
+
+    if classes.isExpressionVariableRef() or classes.isExpressionVariableOrBuiltinRef():
+        return classes.getVariable().isModuleVariable()
+
+    return False
+
+
 def generateBuiltinIsinstanceCode(to_name, expression, emit, context):
     inst_name = context.allocateTempName("isinstance_inst")
     cls_name = context.allocateTempName("isinstance_cls")
@@ -241,7 +296,17 @@ def generateBuiltinIsinstanceCode(to_name, expression, emit, context):
 
     res_name = context.getIntResName()
 
-    emit("%s = Nuitka_IsInstance(%s, %s);" % (res_name, inst_name, cls_name))
+    if _isIsinstanceCacheUseful(expression.subnode_classes):
+        emit(
+            """\
+{
+    static struct Nuitka_IsInstanceCache isinstance_cache;
+    %s = Nuitka_IsInstanceCached(&isinstance_cache, %s, %s);
+}"""
+            % (res_name, inst_name, cls_name)
+        )
+    else:
+        emit("%s = Nuitka_IsInstance(%s, %s);" % (res_name, inst_name, cls_name))
 
     getErrorExitBoolCode(
         condition="%s == -1" % res_name,
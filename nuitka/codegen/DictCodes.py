@@ -28,7 +28,7 @@ from .CodeHelpers import (
     withCleanupFinally,
     withObjectCodeTemporaryAssignment,
 )
-from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode
+from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCode
 
 
 def generateBuiltinDictCode(to_name, expression, emit, context):
@@ -102,6 +102,87 @@ def generateDictionaryCreationCode(to_name, expression, emit, context):
         )
 
 
+def generateDictionaryPresizedCreationCode(to_name, expression, emit, context):
+    (iterator_name,) = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "dict_result", expression, emit, context
+    ) as result_name:
+        emit(
+            "%s = MAKE_DICT_EMPTY_PRESIZED(ITERATOR_LENGTH_HINT(%s));"
+            % (result_name, iterator_name)
+        )
+
+        getReleaseCode(release_name=iterator_name, emit=emit, context=context)
+
+        context.addCleanupTempName(result_name)
+
+
+def _getDictionaryTemplateKeys(pairs):
+    """Get the constant keys of a dictionary creation, if a template can be used."""
+
+    # The template relies on the key table layout of Python3.6 or higher.
+    if python_version < 0x360:
+        return None
+
+    keys = []
+
+    for pair in pairs:
+        key = pair.subnode_key
+
+        if not key.isExpressionConstantStrRef():
+            return None
+
+        keys.append(key.getCompileTimeConstant())
+
+    # Overwritten keys need the normal code, as do single entries.
+    if len(set(keys)) != len(keys) or len(keys) < 2:
+        return None
+
+    return keys
+
+
+def _getDictionaryTemplateCreationCode(to_name, pairs, keys, emit, context):
+    value_names = []
+
+    for pair in pairs:
+        value_name = context.allocateTempName("dict_template_value")
+
+        generateExpressionCode(
+            to_name=value_name,
+            expression=pair.subnode_value,
+            emit=emit,
+            context=context,
+        )
+
+        value_names.append(value_name)
+
+    emit(
+        """\
+{
+    PyObject *dict_template_values[] = {%s};
+    %s = DICT_MAKE_FROM_TEMPLATE(%s, dict_template_values);
+}"""
+        % (
+            ", ".join(str(value_name) for value_name in value_names),
+            to_name,
+            context.getConstantCode(dict.fromkeys(keys)),
+        )
+    )
+
+    getErrorExitCode(
+        check_name=to_name,
+        release_names=value_names,
+        needs_check=False,
+        emit=emit,
+        context=context,
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _getDictionaryCreationCode(to_name, pairs, emit, context):
     # Detailed, and verbose code, pylint: disable=too-many-locals
 
@@ -110,6 +191,19 @@ def _getDictionaryCreationCode(to_name, pairs, emit, context):
     # Empty dictionaries should not get to this function, but be constant value instead.
     assert pairs_count > 0
 
+    # Dictionaries with only constant keys, are created from a template that
+    # is hashed only once.
+    template_keys = _getDictionaryTemplateKeys(pairs)
+
+    if template_keys is not None:
+        return _getDictionaryTemplateCreationCode(
+            to_name=to_name,
+            pairs=pairs,
+            keys=template_keys,
+            emit=emit,
+            context=context,
+        )
+
     # Unique per dictionary, they might be nested, but used for all of them.
     dict_key_name = context.allocateTempName("dict_key")
     dict_value_name = context.allocateTempName("dict_value")
@@ -295,7 +295,6 @@ def getFrameGuardHeavyCode(
             template_frame_guard_full_exception_handler
             % {
                 "frame_identifier": frame_identifier,
-                "frame_cache_identifier": frame_cache_identifier,
                 "tb_making": getTracebackMakingIdentifier(
                     context=context, lineno_name=exception_lineno
                 ),
@@ -425,7 +424,6 @@ def getFrameGuardLightCode(
             % {
                 "context_identifier": context_identifier,
                 "frame_identifier": frame_identifier,
-                "frame_cache_identifier": frame_cache_identifier,
                 "exception_type": exception_type,
                 "exception_tb": exception_tb,
                 "exception_lineno": exception_lineno,
@@ -108,6 +108,9 @@ def getConstantDefaultPopulation():
         # For Python3 "bytes" built-in.
         result.append("bytes")
 
+        # For Python3 class creation.
+        result.append("__prepare__")
+
     # For meta path based loader, iter_modules and Python3 "__name__" to
     # "__package__" parsing
     result.append(".")
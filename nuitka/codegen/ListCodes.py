@@ -27,7 +27,7 @@ from .CodeHelpers import (
     withCleanupFinally,
     withObjectCodeTemporaryAssignment,
 )
-from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode
+from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCode
 from .PythonAPICodes import generateCAPIObjectCode
 
 
@@ -76,6 +76,24 @@ def generateListCreationCode(to_name, expression, emit, context):
                 )
 
 
+def generateListPresizedCreationCode(to_name, expression, emit, context):
+    (iterator_name,) = generateChildExpressionsCode(
+        expression=expression, emit=emit, context=context
+    )
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "list_result", expression, emit, context
+    ) as result_name:
+        emit(
+            "%s = MAKE_LIST_EMPTY_PRESIZED(ITERATOR_LENGTH_HINT(%s));"
+            % (result_name, iterator_name)
+        )
+
+        getReleaseCode(release_name=iterator_name, emit=emit, context=context)
+
+        context.addCleanupTempName(result_name)
+
+
 def generateListOperationAppendCode(statement, emit, context):
     list_arg_name = context.allocateTempName("append_list")
     generateExpressionCode(
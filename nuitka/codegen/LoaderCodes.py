@@ -32,12 +32,14 @@ needed except for technical reasons.
 """
 
 from nuitka import Options
+from nuitka.build.DataComposerInterface import readStartupImports
 from nuitka.ModuleRegistry import (
     getDoneModules,
     getUncompiledModules,
     getUncompiledTechnicalModules,
 )
 from nuitka.Tracing import inclusion_logger
+from nuitka.utils.CStrings import encodePythonStringToC
 
 from .Indentation import indented
 from .templates.CodeTemplatesLoader import (
@@ -78,6 +80,9 @@ def getModuleMetapathLoaderEntryCode(module, bytecode_accessor):
         if module.isCompiledPythonPackage():
             flags.append("NUITKA_PACKAGE_FLAG")
 
+        if module_name.hasOneOfNamespaces(Options.getLazyImportPackages()):
+            flags.append("NUITKA_LAZY_FLAG")
+
         return template_metapath_loader_compiled_module_entry % {
             "module_name": module_name,
             "module_identifier": module.getCodeName(),
@@ -85,17 +90,44 @@ def getModuleMetapathLoaderEntryCode(module, bytecode_accessor):
         }
 
 
+def _getStartupOrderedModules(modules):
+    """Put the modules imported at startup first, in the order of use.
+
+    The loader table is searched from the start, so this makes finding the
+    modules needed early fast, the others keep their order.
+    """
+
+    startup_imports_filename = Options.getStartupImportsFilename()
+
+    if startup_imports_filename is None:
+        return modules
+
+    order = dict(
+        (module_name, count)
+        for count, module_name in enumerate(
+            readStartupImports(startup_imports_filename)
+        )
+    )
+
+    return sorted(
+        modules, key=lambda module: order.get(module.getFullName(), len(order))
+    )
+
+
+def _getStartupImportReportFilenameCode():
+    startup_import_report_filename = Options.getStartupImportReportFilename()
+
+    if startup_import_report_filename is None:
+        return "NULL"
+    else:
+        return encodePythonStringToC(startup_import_report_filename.encode("utf8"))
+
+
 def getMetapathLoaderBodyCode(bytecode_accessor):
     metapath_loader_inittab = []
     metapath_module_decls = []
 
     for other_module in getDoneModules():
-        metapath_loader_inittab.append(
-            getModuleMetapathLoaderEntryCode(
-                module=other_module, bytecode_accessor=bytecode_accessor
-            )
-        )
-
         if other_module.isCompiledPythonModule():
             metapath_module_decls.append(
                 """\
@@ -103,10 +135,12 @@ extern PyObject *modulecode_%(module_identifier)s(PyObject *, struct Nuitka_Meta
                 % {"module_identifier": other_module.getCodeName()}
             )
 
-    for uncompiled_module in getUncompiledModules():
+    for other_module in _getStartupOrderedModules(
+        list(getDoneModules()) + list(getUncompiledModules())
+    ):
         metapath_loader_inittab.append(
             getModuleMetapathLoaderEntryCode(
-                module=uncompiled_module, bytecode_accessor=bytecode_accessor
+                module=other_module, bytecode_accessor=bytecode_accessor
             )
         )
 
@@ -142,4 +176,5 @@ extern PyObject *modulecode_%(module_identifier)s(PyObject *, struct Nuitka_Meta
         "metapath_loader_inittab": indented(metapath_loader_inittab),
         "bytecode_count": bytecode_accessor.getConstantsCount(),
         "frozen_modules": indented(frozen_defs),
+        "startup_import_report_filename": _getStartupImportReportFilenameCode(),
     }
@@ -20,6 +20,7 @@
 """
 
 import os
+import re
 
 from nuitka import Options
 from nuitka.__past__ import iterItems
@@ -39,9 +40,26 @@ from .templates.CodeTemplatesModules import (
     template_module_exception_exit,
     template_module_external_entry_point,
     template_module_noexception_exit,
+    template_unity_body,
+    template_unity_module_include,
 )
 from .VariableCodes import getVariableReferenceCode
 
+# File level static names of the module template, which are not specific to
+# the module, and must be renamed when several modules are part of the same
+# translation unit. Taken from the template, so they cannot be forgotten.
+module_static_names = tuple(
+    sorted(
+        set(
+            re.findall(
+                r"^(?:NUITKA_MAY_BE_UNUSED )?static [^=;(\[]*?\b(\w+)\s*[=;(\[]",
+                template_module_body_template,
+                re.MULTILINE,
+            )
+        )
+    )
+)
+
 
 def getModuleAccessCode(context):
     return "module_%s" % context.getModuleCodeName()
@@ -145,6 +163,40 @@ def getModuleCode(
     }
 
 
+def getUnityCode(module_entries):
+    """Get code including the C files of several modules.
+
+    Args:
+        module_entries: list of module name, code name, and filename tuples
+    Returns:
+        C code of the translation unit
+    """
+
+    module_includes = []
+
+    for module_name, module_identifier, filename in module_entries:
+        module_includes.append(
+            template_unity_module_include
+            % {
+                "module_name": module_name,
+                "filename": filename,
+                "renames": "\n".join(
+                    "#define %s %s_%s" % (static_name, static_name, module_identifier)
+                    for static_name in module_static_names
+                ),
+                "unrenames": "\n".join(
+                    "#undef %s" % static_name for static_name in module_static_names
+                ),
+            }
+        )
+
+    return template_unity_body % {
+        "module_count": len(module_entries),
+        "version": getNuitkaVersion(),
+        "module_includes": "".join(module_includes),
+    }
+
+
 def generateModuleAttributeFileCode(to_name, expression, emit, context):
     # TODO: Special treatment justified?
     with withObjectCodeTemporaryAssignment(
@@ -19,6 +19,7 @@
 
 """
 
+from nuitka.nodes.shapes.BuiltinTypeShapes import tshape_int
 from nuitka.PythonVersions import python_version
 
 from .CodeHelpers import (
@@ -28,7 +29,6 @@ from .CodeHelpers import (
 )
 from .ErrorCodes import getErrorExitCode
 from .PythonAPICodes import generateCAPIObjectCode
-from .TupleCodes import getTupleCreationCode
 
 
 def generateBuiltinBytes1Code(to_name, expression, emit, context):
@@ -151,26 +151,46 @@ def generateBuiltinOrdCode(to_name, expression, emit, context):
 def generateStringContenationCode(to_name, expression, emit, context):
     values = expression.subnode_values
 
-    with withObjectCodeTemporaryAssignment(
-        to_name, "string_concat_result", expression, emit, context
-    ) as value_name:
+    part_names = []
 
-        tuple_temp_name = context.allocateTempName("string_concat_values")
+    for value in values:
+        # Exact int values need not be formatted before all parts are known,
+        # as that has no side effects, the string builder writes them.
+        if (
+            value.isExpressionBuiltinFormat()
+            and value.subnode_format_spec is None
+            and value.subnode_value.getTypeShape() is tshape_int
+        ):
+            value = value.subnode_value
 
-        # TODO: Consider using _PyUnicode_JoinArray which avoids the tuple,
-        # but got all to be able to release arrays.
-        getTupleCreationCode(
-            to_name=tuple_temp_name, elements=values, emit=emit, context=context
+        part_name = context.allocateTempName("string_concat_part")
+
+        generateExpressionCode(
+            to_name=part_name, expression=value, emit=emit, context=context
         )
 
+        part_names.append(part_name)
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "string_concat_result", expression, emit, context
+    ) as value_name:
+
         emit(
-            "%s = PyUnicode_Join(%s, %s);"
-            % (value_name, context.getConstantCode(""), tuple_temp_name)
+            """\
+{
+    PyObject *string_concat_parts[] = {%s};
+    %s = UNICODE_BUILD_STRING(string_concat_parts, %d);
+}"""
+            % (
+                ", ".join(str(part_name) for part_name in part_names),
+                value_name,
+                len(part_names),
+            )
         )
 
         getErrorExitCode(
             check_name=value_name,
-            release_name=tuple_temp_name,
+            release_names=part_names,
             emit=emit,
             context=context,
         )
@@ -235,6 +235,52 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d(PyObject *called, PyObject **arg
                  ((PyCFunctionObject *)called)->m_ml->ml_name
             );
             return NULL;
+#endif
+#if PYTHON_VERSION >= 0x360
+        } else if (flags == METH_FASTCALL) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+#if PYTHON_VERSION < 0x370
+            PyObject *result = (*(_PyCFunctionFast)method)(self, args, %(args_count)d, NULL);
+#else
+            PyObject *result = (*(_PyCFunctionFast)method)(self, args, %(args_count)d);
+#endif
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
+#endif
+#if PYTHON_VERSION >= 0x370
+        } else if (flags == (METH_FASTCALL | METH_KEYWORDS)) {
+            PyCFunction method = PyCFunction_GET_FUNCTION(called);
+            PyObject *self = PyCFunction_GET_SELF(called);
+
+            // Recursion guard is not strictly necessary, as we already have
+            // one on our way to here.
+#ifdef _NUITKA_FULL_COMPAT
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+#endif
+
+            PyObject *result = (*(_PyCFunctionFastWithKeywords)method)(self, args, %(args_count)d, NULL);
+
+#ifdef _NUITKA_FULL_COMPAT
+            Py_LeaveRecursiveCall();
+#endif
+
+            return Nuitka_CheckFunctionResult(result);
 #endif
         } else if (flags & METH_VARARGS) {
             PyCFunction method = PyCFunction_GET_FUNCTION(called);
@@ -261,12 +307,6 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d(PyObject *called, PyObject **arg
 #else
             if (flags == (METH_VARARGS|METH_KEYWORDS)) {
                 result = (*(PyCFunctionWithKeywords)method)(self, pos_args, NULL);
-            } else if (flags == METH_FASTCALL) {
-#if PYTHON_VERSION < 0x370
-                result = (*(_PyCFunctionFast)method)(self, &PyTuple_GET_ITEM(pos_args, 0), %(args_count)d, NULL);
-#else
-                result = (*(_PyCFunctionFast)method)(self, &pos_args, %(args_count)d);
-#endif
             } else {
                 result = (*method)(self, pos_args);
             }
@@ -305,6 +345,16 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d(PyObject *called, PyObject **arg
         );
     }
 
+#if PYTHON_VERSION >= 0x380
+    {
+        PyObject *result;
+
+        if (CALL_FUNCTION_VECTORCALL(called, args, %(args_count)d, &result)) {
+            return result;
+        }
+    }
+#endif
+
     PyObject *pos_args = MAKE_TUPLE(args, %(args_count)d);
 
     PyObject *result = CALL_FUNCTION(called, pos_args, NULL);
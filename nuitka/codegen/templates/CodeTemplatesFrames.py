@@ -22,6 +22,9 @@
 # Frame in a function
 template_frame_guard_full_block = """\
 if (isFrameUnusable(%(frame_cache_identifier)s)) {
+    if (%(frame_cache_identifier)s != NULL) {
+        %(frame_cache_identifier)s->m_is_cached = false;
+    }
     Py_XDECREF(%(frame_cache_identifier)s);
 
 #if _DEBUG_REFCOUNTS
@@ -33,11 +36,17 @@ if (isFrameUnusable(%(frame_cache_identifier)s)) {
     count_allocated_frame_cache_instances += 1;
 #endif
     %(frame_cache_identifier)s = MAKE_FUNCTION_FRAME(%(code_identifier)s, %(module_identifier)s, %(locals_size)s);
+    %(frame_cache_identifier)s->m_is_cached = true;
 #if _DEBUG_REFCOUNTS
 } else {
     count_hit_frame_cache_instances += 1;
 #endif
 }
+
+// Locals attached for an exception that was handled since are not observable.
+if (unlikely(%(frame_cache_identifier)s->m_type_description != NULL)) {
+    Nuitka_Frame_ReleaseLocals(%(frame_cache_identifier)s);
+}
 assert(%(frame_cache_identifier)s->m_type_description == NULL);
 %(frame_identifier)s = %(frame_cache_identifier)s;
 
@@ -95,17 +104,6 @@ if (%(exception_tb)s == NULL) {
 // Attaches locals to frame if any.
 %(attach_locals)s
 
-// Release cached frame if used for exception.
-if (%(frame_identifier)s == %(frame_cache_identifier)s) {
-#if _DEBUG_REFCOUNTS
-    count_active_frame_cache_instances -= 1;
-    count_released_frame_cache_instances += 1;
-#endif
-
-    Py_DECREF(%(frame_cache_identifier)s);
-    %(frame_cache_identifier)s = NULL;
-}
-
 assertFrameObject(%(frame_identifier)s);
 
 // Put the previous frame back on top.
@@ -162,6 +160,9 @@ goto %(parent_exception_exit)s;
 # Frame in a generator, coroutine or asyncgen.
 template_frame_guard_generator = """\
 if (isFrameUnusable(%(frame_cache_identifier)s)) {
+    if (%(frame_cache_identifier)s != NULL) {
+        %(frame_cache_identifier)s->m_is_cached = false;
+    }
     Py_XDECREF(%(frame_cache_identifier)s);
 
 #if _DEBUG_REFCOUNTS
@@ -173,11 +174,17 @@ if (isFrameUnusable(%(frame_cache_identifier)s)) {
     count_allocated_frame_cache_instances += 1;
 #endif
     %(frame_cache_identifier)s = MAKE_FUNCTION_FRAME(%(code_identifier)s, %(module_identifier)s, %(locals_size)s);
+    %(frame_cache_identifier)s->m_is_cached = true;
 #if _DEBUG_REFCOUNTS
 } else {
     count_hit_frame_cache_instances += 1;
 #endif
 }
+
+// Locals attached for an exception that was handled since are not observable.
+if (unlikely(%(frame_cache_identifier)s->m_type_description != NULL)) {
+    Nuitka_Frame_ReleaseLocals(%(frame_cache_identifier)s);
+}
 %(context_identifier)s->m_frame = %(frame_cache_identifier)s;
 
 // Mark the frame object as in use, ref count 1 will be up for reuse.
@@ -261,17 +268,6 @@ if (!EXCEPTION_MATCH_GENERATOR(%(exception_type)s)) {
 
 %(attach_locals)s
 
-    // Release cached frame if used for exception.
-    if (%(frame_identifier)s == %(frame_cache_identifier)s) {
-#if _DEBUG_REFCOUNTS
-        count_active_frame_cache_instances -= 1;
-        count_released_frame_cache_instances += 1;
-#endif
-
-        Py_DECREF(%(frame_cache_identifier)s);
-        %(frame_cache_identifier)s = NULL;
-    }
-
     assertFrameObject(%(frame_identifier)s);
 }
 
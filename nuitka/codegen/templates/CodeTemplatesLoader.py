@@ -66,7 +66,7 @@ void setupMetaPathBasedLoader(void) {
     static bool init_done = false;
     if (init_done == false) {
         loadConstantsBlob((PyObject **)bytecode_data, ".bytecode", %(bytecode_count)d);
-        registerMetaPathBasedUnfreezer(meta_path_loader_entries, bytecode_data);
+        registerMetaPathBasedUnfreezer(meta_path_loader_entries, bytecode_data, %(startup_import_report_filename)s);
 
         init_done = true;
     }
@@ -580,6 +580,10 @@ MOD_INIT_DECL(%(module_identifier)s) {
 
 template_module_exception_exit = """\
     module_exception_exit:
+#if defined(_NUITKA_EXE)
+    // Like with CPython, importing it again executes the module body again.
+    _init_done = false;
+#endif
     RESTORE_ERROR_OCCURRED(exception_type, exception_value, exception_tb);
     return NULL;
 }"""
@@ -605,6 +609,19 @@ template_header_guard = """\
 #endif
 """
 
+template_unity_body = """\
+/* Generated code combining %(module_count)d compiled modules into one
+ * translation unit, created by Nuitka version %(version)s
+ */
+%(module_includes)s"""
+
+template_unity_module_include = """
+/* Compiled module '%(module_name)s' */
+%(renames)s
+#include "%(filename)s"
+%(unrenames)s
+"""
+
 from . import TemplateDebugWrapper  # isort:skip
 
 TemplateDebugWrapper.checkDebug(globals())
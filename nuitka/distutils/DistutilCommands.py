@@ -22,7 +22,9 @@
 import distutils.command.build  # pylint: disable=I0021,import-error,no-name-in-module
 import distutils.command.install  # pylint: disable=I0021,import-error,no-name-in-module
 import os
+import subprocess
 import sys
+import threading
 
 import wheel.bdist_wheel  # pylint: disable=I0021,import-error,no-name-in-module
 
@@ -161,6 +163,11 @@ class build(distutils.command.build.build):
         setMainScriptDirectory(".")
 
         to_builds = self._find_to_build()
+
+        concurrency, jobs = self._get_job_split(len(to_builds))
+
+        builds = []
+
         for to_build in to_builds:
             package, main_filename, finding = findModule(
                 importing=None,
@@ -190,6 +197,9 @@ class build(distutils.command.build.build):
                 "--remove-output",
             ]
 
+            if jobs is not None:
+                command.append("--jobs=%d" % jobs)
+
             if type(to_build) is PyPackage:
                 command += (
                     "--include-package=%s" % package_name.replace("/", ".")
@@ -223,21 +233,132 @@ class build(distutils.command.build.build):
 
             command.append(main_filename)
 
-            # Adding traces for clarity, TODO: color scheme used is not really clear.
+            builds.append((to_build, command))
+
+        # The sources are needed by all builds, only remove them after all of
+        # them are finished.
+        if concurrency > 1:
+            self._run_builds_parallel(builds, build_lib, concurrency)
+        else:
+            for to_build, command in builds:
+                self._run_build(to_build, command, build_lib)
+
+        for root, _, filenames in os.walk(build_lib):
+            for filename in filenames:
+                fullpath = os.path.join(root, filename)
+
+                if fullpath.lower().endswith((".py", ".pyw", ".pyc", ".pyo")):
+                    os.unlink(fullpath)
+
+        os.chdir(old_dir)
+
+        self.build_lib = build_lib
+
+    def _get_job_split(self, build_count):
+        """Split the parallel jobs budget between Nuitka processes and C compilation.
+
+        The "parallel" option of the build command, e.g. given as "-j", is the
+        budget. Independent builds run concurrently, and each gets an equal
+        share of the rest for its C compilation, so the machine is used fully
+        but not oversubscribed.
+
+        Returns:
+            tuple of concurrent build count and C jobs per build, the latter
+            is None for the Nuitka default.
+        """
+
+        # Python2 has no such option, and without it, we build one by one.
+        parallel = getattr(self, "parallel", None)
+
+        if not parallel or build_count < 2:
+            return 1, None
+
+        if parallel is True:
+            from nuitka.utils.Utils import getCoreCount
+
+            parallel = getCoreCount()
+
+        concurrency = min(parallel, build_count)
+
+        # Not overriding what the user asked for the Nuitka invocations.
+        # Keys may be given with or without leading dashes.
+        nuitka_options = self.distribution.command_options.get("nuitka", {})
+
+        if "jobs" in (option.lstrip("-") for option in nuitka_options):
+            return concurrency, None
+
+        return concurrency, max(1, parallel // concurrency)
+
+    @staticmethod
+    def _run_build(to_build, command, build_lib):
+        # Adding traces for clarity, TODO: color scheme used is not really clear.
+        my_print("Building: %s with %r" % (to_build, command), style="yellow")
+        check_call(command, cwd=build_lib)
+        my_print("Finished compilation of %s." % to_build, style="yellow")
+
+    def _run_build_process(self, to_build, command, build_lib):
+        with self._build_processes_lock:
+            # Another build failed already, do not start anymore.
+            if self._build_processes is None:
+                return
+
             my_print("Building: %s with %r" % (to_build, command), style="yellow")
-            check_call(command, cwd=build_lib)
+
+            process = subprocess.Popen(command, cwd=build_lib)
+            self._build_processes.append(process)
+
+        result = process.wait()
+
+        if result != 0:
+            # Stopped builds are not errors of their own.
+            if self._stop_build_processes():
+                raise subprocess.CalledProcessError(result, command)
+        else:
             my_print("Finished compilation of %s." % to_build, style="yellow")
 
-            for root, _, filenames in os.walk(build_lib):
-                for filename in filenames:
-                    fullpath = os.path.join(root, filename)
+    def _stop_build_processes(self):
+        """Stop the running builds and not start anymore.
 
-                    if fullpath.lower().endswith((".py", ".pyw", ".pyc", ".pyo")):
-                        os.unlink(fullpath)
+        Returns:
+            bool - True if they were not stopped before.
+        """
+
+        with self._build_processes_lock:
+            if self._build_processes is None:
+                return False
+
+            for process in self._build_processes:
+                if process.poll() is None:
+                    process.terminate()
+
+            self._build_processes = None
+
+            return True
+
+    def _run_builds_parallel(self, builds, build_lib, concurrency):
+        from concurrent.futures import (  # pylint: disable=I0021,import-error
+            ThreadPoolExecutor,
+        )
+
+        # pylint: disable=attribute-defined-outside-init
+        self._build_processes = []
+        self._build_processes_lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(self._run_build_process, to_build, command, build_lib)
+                for to_build, command in builds
+            ]
 
-            os.chdir(old_dir)
+            # The failing build stops the others, and raises its error here,
+            # e.g. "KeyboardInterrupt" stops them too.
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                self._stop_build_processes()
 
-            self.build_lib = build_lib
+                raise
 
 
 # Required by distutils, used as command name, pylint: disable=invalid-name
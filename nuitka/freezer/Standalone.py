@@ -30,6 +30,7 @@ import marshal
 import os
 import pkgutil
 import shutil
+import site
 import subprocess
 import sys
 
@@ -67,6 +68,7 @@ from nuitka.utils.FileOperations import (
     listDir,
     makePath,
     putTextFileContents,
+    replaceFileAtomic,
     resolveShellPatternToFilenames,
     withFileLock,
 )
@@ -224,33 +226,11 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
-def _detectImports(command, user_provided, technical):
+def _getImportDetections(command):
+    """Run the command with CPython and parse the imports it reports."""
     # This is pretty complicated stuff, with variants to deal with.
     # pylint: disable=too-many-branches,too-many-locals,too-many-statements
 
-    # Print statements for stuff to show, the modules loaded.
-    if python_version >= 0x300:
-        command += (
-            '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + '
-            'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and '
-            'module.__file__ not in (None, "<frozen>"))), file = sys.stderr)'
-        )  # do not read it
-
-    reduced_path = [
-        path_element
-        for path_element in sys.path
-        if not areSamePaths(path_element, ".")
-        if not areSamePaths(
-            path_element, os.path.dirname(sys.modules["__main__"].__file__)
-        )
-    ]
-
-    # Make sure the right import path (the one Nuitka binary is running with)
-    # is used.
-    command = (
-        "import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)
-    ) + command
-
     import tempfile
 
     tmp_file, tmp_filename = tempfile.mkstemp()
@@ -278,8 +258,6 @@ def _detectImports(command, user_provided, technical):
             printError(line)
         general.sysexit("Error, please report the issue with above output.")
 
-    result = []
-
     detections = []
 
     for line in stderr.replace(b"\r", b"").split(b"\n"):
@@ -343,6 +321,154 @@ def _detectImports(command, user_provided, technical):
 
                 detections.append((module_name, 1, "shlib", filename))
 
+    return detections
+
+
+def _getDirectoryFingerprint(path):
+    """Modification times of a directory and its sub-directories.
+
+    These change when modules are added or removed, which is what would change
+    the result of an import detection.
+    """
+    result = [path, os.stat(path).st_mtime]
+
+    for sub_path, _filename in listDir(path):
+        if os.path.isdir(sub_path):
+            result.append((sub_path, os.stat(sub_path).st_mtime))
+
+    return repr(result)
+
+
+def _getSiteFingerprint():
+    """Site packages directories, their ".pth" files and site customization.
+
+    These decide the search path and what shadows standard library modules,
+    e.g. a package installed or a ".pth" file added.
+    """
+    site_dirs = []
+
+    # Old "virtualenv" replaces "site" with a version lacking these.
+    if hasattr(site, "getsitepackages"):
+        site_dirs.extend(site.getsitepackages())
+    if hasattr(site, "getusersitepackages"):
+        site_dirs.append(site.getusersitepackages())
+
+    result = []
+
+    for site_dir in sorted(set(site_dirs)):
+        if not os.path.isdir(site_dir):
+            continue
+
+        result.append((site_dir, os.stat(site_dir).st_mtime))
+
+        for pth_filename, filename in listDir(site_dir):
+            if filename.endswith(".pth"):
+                stat = os.stat(pth_filename)
+                result.append((filename, stat.st_mtime, stat.st_size))
+
+    for module_name in ("sitecustomize", "usercustomize"):
+        filename = getattr(sys.modules.get(module_name), "__file__", None)
+
+        if filename is not None and os.path.exists(filename):
+            result.append((filename, os.stat(filename).st_mtime))
+
+    return repr(result)
+
+
+def _getImportDetectionsCacheFilename(command):
+    # The command contains the search path and the modules to import, the
+    # standard library is what is being scanned, and site packages may
+    # shadow it.
+    hashed_value = sys.version + sys.executable + command
+
+    for stdlib_dir in sorted(getStandardLibraryPaths()):
+        hashed_value += _getDirectoryFingerprint(stdlib_dir)
+
+    hashed_value += _getSiteFingerprint()
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(getCacheDir(), "early-imports")
+
+    makePath(cache_dir)
+
+    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
+
+
+def _loadImportDetections(cache_filename):
+    try:
+        with open(cache_filename, "rb") as cache_file:
+            detections = marshal.load(cache_file)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+
+    # Files removed since, e.g. by an update of a package in a way that does
+    # not change the directories, make the cached result unusable.
+    for _module_name, _prio, _kind, filename in detections:
+        if not os.path.exists(filename):
+            return None
+
+    return [
+        (ModuleName(module_name), prio, kind, filename)
+        for module_name, prio, kind, filename in detections
+    ]
+
+
+def _storeImportDetections(cache_filename, detections):
+    detections = [
+        (module_name.asString(), prio, kind, filename)
+        for module_name, prio, kind, filename in detections
+    ]
+
+    # Concurrent runs must never see partial contents.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "wb") as cache_file:
+            marshal.dump(detections, cache_file)
+
+        replaceFileAtomic(temp_filename, cache_filename)
+    except (IOError, OSError):
+        pass
+
+
+def _detectImports(command, user_provided, technical):
+    # Print statements for stuff to show, the modules loaded.
+    if python_version >= 0x300:
+        command += (
+            '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + '
+            'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and '
+            'module.__file__ not in (None, "<frozen>"))), file = sys.stderr)'
+        )  # do not read it
+
+    reduced_path = [
+        path_element
+        for path_element in sys.path
+        if not areSamePaths(path_element, ".")
+        if not areSamePaths(
+            path_element, os.path.dirname(sys.modules["__main__"].__file__)
+        )
+    ]
+
+    # Make sure the right import path (the one Nuitka binary is running with)
+    # is used.
+    command = (
+        "import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)
+    ) + command
+
+    cache_filename = _getImportDetectionsCacheFilename(command)
+
+    detections = None
+    if not Options.shallUpdateImportDetectionsCache():
+        detections = _loadImportDetections(cache_filename)
+
+    if detections is None:
+        detections = _getImportDetections(command)
+        _storeImportDetections(cache_filename, detections)
+
+    result = []
+
     for module_name, _prio, kind, filename in sorted(detections):
         if kind == "precompiled":
             _detectedPrecompiledFile(
@@ -0,0 +1,182 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Index of directory contents for module search.
+
+Locating a module checks many file names in every search path element, e.g.
+for every suffix of extension modules and byte code. Rather than asking the
+file system for each of them, every directory is listed only once and the
+answers are given from that listing.
+
+The listings are persisted in the cache directory, so following runs do not
+even need to list the directory again, as long as its modification time is
+unchanged, which it is not when entries are added, removed, or renamed. Only
+the listings used by the last run are kept.
+"""
+
+import json
+import os
+import time
+
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import makePath, replaceFileAtomic
+
+# Directory path to dictionary of names to "d" for directories or "f" for
+# files, or None if it is not a directory.
+_directory_index = {}
+
+# Persisted listings, path to list of modification time and listing.
+_persisted_index = None
+
+# Listings made or confirmed in this run, to be persisted.
+_used_index = {}
+
+# Listings of directories changed so recently, that changes within the
+# time stamp resolution are possible, are not trusted across runs.
+_mtime_safety_margin = 2
+
+
+def _getIndexFilename():
+    return os.path.join(getCacheDir(), "import-index", "directory-index.json")
+
+
+def _loadPersistedIndex():
+    # Singleton, pylint: disable=global-statement
+    global _persisted_index
+
+    _persisted_index = {}
+
+    try:
+        with open(_getIndexFilename()) as index_file:
+            _persisted_index = json.load(index_file)
+    except (IOError, OSError, ValueError):
+        pass
+
+
+def _listDirectory(path):
+    result = {}
+
+    # Python2 has no "os.scandir" and needs to ask each entry individually.
+    if hasattr(os, "scandir"):
+        for entry in os.scandir(path):
+            try:
+                if entry.is_dir():
+                    result[entry.name] = "d"
+                elif entry.is_file():
+                    result[entry.name] = "f"
+            except OSError:
+                pass
+    else:
+        for filename in os.listdir(path):
+            full_path = os.path.join(path, filename)
+
+            if os.path.isdir(full_path):
+                result[filename] = "d"
+            elif os.path.isfile(full_path):
+                result[filename] = "f"
+
+    return result
+
+
+def _getDirectoryListing(path):
+    if _persisted_index is None:
+        _loadPersistedIndex()
+
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+
+    persisted = _persisted_index.get(path)
+
+    if persisted is not None and persisted[0] == mtime:
+        listing = persisted[1]
+    else:
+        try:
+            listing = _listDirectory(path)
+        except OSError:
+            return None
+
+        if time.time() - mtime < _mtime_safety_margin:
+            return listing
+
+    # Same form as loaded from JSON, to compare with the persisted one.
+    _used_index[path] = [mtime, listing]
+
+    return listing
+
+
+def getDirectoryListing(path):
+    """Get the entries of a directory.
+
+    Args:
+        path: directory to get the listing of
+
+    Returns:
+        Dictionary of names to "d" for directories and "f" for files, or
+        None, if path is not a directory.
+    """
+    path = os.path.normcase(os.path.abspath(path))
+
+    if path not in _directory_index:
+        _directory_index[path] = _getDirectoryListing(path)
+
+    return _directory_index[path]
+
+
+def _getEntryKind(path):
+    dirname, filename = os.path.split(path)
+
+    listing = getDirectoryListing(dirname)
+
+    if listing is None:
+        return None
+
+    return listing.get(filename)
+
+
+def isDirectory(path):
+    """ Like "os.path.isdir", but answered from the directory index. """
+    return _getEntryKind(path) == "d"
+
+
+def isFile(path):
+    """ Like "os.path.isfile", but answered from the directory index. """
+    return _getEntryKind(path) == "f"
+
+
+def saveDirectoryIndex():
+    """Persist the directory listings used in this run for the next ones."""
+
+    # Unchanged, no need to write it again.
+    if _persisted_index is None or _used_index == _persisted_index:
+        return
+
+    index_filename = _getIndexFilename()
+    makePath(os.path.dirname(index_filename))
+
+    # Write to a temporary file first, so concurrent runs never see partial
+    # contents.
+    temp_filename = "%s.%d.tmp" % (index_filename, os.getpid())
+
+    try:
+        with open(temp_filename, "w") as index_file:
+            json.dump(_used_index, index_file)
+
+        replaceFileAtomic(temp_filename, index_filename)
+    except (IOError, OSError):
+        pass
@@ -0,0 +1,125 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Prefetching of modules that are likely going to be followed.
+
+As soon as the import statements of a module are seen, while building its
+tree, the source code of the imported modules found in the package tree of
+the importing module is read in the background. By the time the optimization
+follows the import, the source code is then already there.
+
+These are located only by their file name. The module search, the recursion
+decisions and the plug-in hooks, are left to the actual import, as doing them
+early would add to the work, and plug-ins would see modules they never get.
+"""
+
+import ast
+import os
+
+from nuitka.PythonVersions import python_version
+from nuitka.tree.SourceReading import prefetchSourceCode
+
+from .DirectoryIndex import isFile
+
+
+def _getImportedNames(body):
+    """Yield module names and levels of the import statements found."""
+
+    # Python2 tries relative imports first, unless absolute import is asked for.
+    default_level = 0 if python_version >= 0x300 else -1
+
+    for node in ast.walk(body):
+        if type(node) is ast.Import:
+            for alias in node.names:
+                parts = alias.name.split(".")
+
+                # Packages of the module get imported as well.
+                for count in range(1, len(parts) + 1):
+                    yield ".".join(parts[:count]), default_level
+        elif type(node) is ast.ImportFrom:
+            level = node.level or default_level
+
+            if node.module is not None:
+                yield node.module, level
+
+            # Imported names may be sub-modules.
+            for alias in node.names:
+                if alias.name != "*":
+                    if node.module is None:
+                        yield alias.name, level
+                    else:
+                        yield node.module + "." + alias.name, level
+
+
+def _getImportDirectory(module, parent_package, level):
+    """Directory that imported module names of the given level start from."""
+
+    directory = module.getCompileTimeDirectory()
+
+    # Absolute imports start from the top of the package tree of the module.
+    if level == 0:
+        up_count = parent_package.count(".") + 1 if parent_package else 0
+    else:
+        up_count = level - 1
+
+    for _count in range(up_count):
+        directory = os.path.dirname(directory)
+
+    return directory
+
+
+def _prefetchModule(directory, module_name):
+    module_path = os.path.join(directory, *module_name.split("."))
+
+    # Packages take precedence over modules of the same name.
+    for module_filename in (
+        os.path.join(module_path, "__init__.py"),
+        module_path + ".py",
+    ):
+        if isFile(module_filename):
+            prefetchSourceCode(module_filename)
+            break
+
+
+def prefetchImportedModules(module, body):
+    """Start reading the source code of modules imported by a module.
+
+    Args:
+        module: the module being built
+        body: ast of its source code
+    """
+
+    if module.isCompiledPythonPackage():
+        parent_package = module.getFullName()
+    else:
+        parent_package = module.getFullName().getPackageName()
+
+    done = set()
+
+    for module_name, level in _getImportedNames(body):
+        # Python2 default imports may be relative or absolute ones.
+        for import_level in (1, 0) if level == -1 else (level,):
+            if (module_name, import_level) in done:
+                continue
+            done.add((module_name, import_level))
+
+            _prefetchModule(
+                directory=_getImportDirectory(
+                    module=module, parent_package=parent_package, level=import_level
+                ),
+                module_name=module_name,
+            )
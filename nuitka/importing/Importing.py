@@ -55,6 +55,7 @@ from nuitka.utils.FileOperations import listDir
 from nuitka.utils.Importing import getSharedLibrarySuffixes
 from nuitka.utils.ModuleNames import ModuleName
 
+from .DirectoryIndex import isDirectory, isFile
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 from .Whitelisting import isWhiteListedNotExistingModule
 
@@ -87,10 +88,10 @@ def isPackageDir(dirname):
 
     return (
         "." not in os.path.basename(dirname)
-        and os.path.isdir(dirname)
+        and isDirectory(dirname)
         and (
             python_version >= 0x300
-            or os.path.isfile(os.path.join(dirname, "__init__.py"))
+            or isFile(os.path.join(dirname, "__init__.py"))
             or isPreloadedPackagePath(dirname)
         )
     )
@@ -368,7 +369,7 @@ def _findModuleInPath2(module_name, search_path):
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        if isDirectory(package_directory):
             found = False
 
             for suffix, _mode, mtype in imp.get_suffixes():
@@ -379,7 +380,7 @@ def _findModuleInPath2(module_name, search_path):
 
                 file_path = os.path.join(package_directory, package_file_name)
 
-                if os.path.isfile(file_path):
+                if isFile(file_path):
                     candidates.add(
                         ImportScanFinding(
                             found_in=entry,
@@ -409,7 +410,7 @@ def _findModuleInPath2(module_name, search_path):
 
             full_path = os.path.join(entry, module_name + suffix)
 
-            if os.path.isfile(full_path):
+            if isFile(full_path):
                 candidates.add(
                     ImportScanFinding(
                         found_in=entry,
@@ -34,12 +34,18 @@ work on, and let them decide and do the heavy lifting of optimization
 and annotation is happening in the nodes that implement these compute slots.
 """
 
+from nuitka.PythonVersions import python_version
+
 from .ExpressionBases import (
     ExpressionChildHavingBase,
     ExpressionChildrenHavingBase,
 )
 from .NodeBases import StatementChildHavingBase, StatementChildrenHavingBase
 from .NodeMakingHelpers import wrapExpressionWithNodeSideEffects
+from .StringConcatenationNodes import (
+    getFormattingValuesFromTuple,
+    makeFormatMethodNode,
+)
 
 
 class StatementAssignmentAttribute(StatementChildrenHavingBase):
@@ -171,6 +177,38 @@ class ExpressionAttributeLookup(ExpressionChildHavingBase):
             trace_collection=trace_collection,
         )
 
+    def computeExpressionCall(self, call_node, call_args, call_kw, trace_collection):
+        if (
+            self.attribute_name == "format"
+            and python_version >= 0x360
+            and self.subnode_expression.isExpressionConstantStrRef()
+            and (call_kw is None or call_kw.isExpressionConstantDictEmptyRef())
+        ):
+            values = getFormattingValuesFromTuple(call_args)
+
+            if values is not None:
+                new_node = makeFormatMethodNode(
+                    template=self.subnode_expression.getCompileTimeConstant(),
+                    values=values,
+                    source_ref=call_node.source_ref,
+                )
+
+                if new_node is not None:
+                    return (
+                        new_node,
+                        "new_expression",
+                        """\
+Lowered 'str.format' with constant template to string building.""",
+                    )
+
+        return ExpressionChildHavingBase.computeExpressionCall(
+            self,
+            call_node=call_node,
+            call_args=call_args,
+            call_kw=call_kw,
+            trace_collection=trace_collection,
+        )
+
     def mayRaiseException(self, exception_type):
         return self.subnode_expression.mayRaiseExceptionAttributeLookup(
             exception_type=exception_type, attribute_name=self.attribute_name
@@ -57,8 +57,6 @@ class ExpressionBuiltinFormat(ExpressionChildrenHavingBase):
         return tshape_str_or_unicode
 
     def computeExpression(self, trace_collection):
-        # TODO: Can use the format built-in on compile time constants at least.
-
         value = self.subnode_value
         format_spec = self.subnode_format_spec
 
@@ -78,6 +76,30 @@ Removed useless 'format' on '%s' value."""
                     % value.getTypeShape().getTypeName(),
                 )
 
+        # Built-in types with constant values format the same at compile time,
+        # except for the "n" format, which depends on the locale at run time.
+        if (
+            value.isCompileTimeConstant()
+            and type(value.getCompileTimeConstant()) in (int, float, str)
+            and (
+                format_spec is None
+                or (
+                    format_spec.isExpressionConstantStrRef()
+                    and "n" not in format_spec.getCompileTimeConstant()
+                )
+            )
+        ):
+            return trace_collection.getCompileTimeComputationResult(
+                node=self,
+                computation=lambda: format(
+                    value.getCompileTimeConstant(),
+                    format_spec.getCompileTimeConstant()
+                    if format_spec is not None
+                    else "",
+                ),
+                description="Built-in 'format' with constant arguments.",
+            )
+
         # TODO: Provide "__format__" slot based handling.
 
         # Any code could be run, note that.
@@ -154,3 +154,72 @@ class ExpressionBuiltinType3(ExpressionChildrenHavingBase):
         # TODO: Should be compile time computable if bases and dict are.
 
         return self, None, None
+
+
+class ExpressionClassNamespacePrepare(ExpressionChildrenHavingBase):
+    """Prepare the namespace of a class, for classes without keywords.
+
+    This is "metaclass.__prepare__(class_name, bases)" if the metaclass has
+    it, otherwise an empty dictionary.
+    """
+
+    kind = "EXPRESSION_CLASS_NAMESPACE_PREPARE"
+
+    named_children = ("metaclass", "bases")
+    __slots__ = ("class_name",)
+
+    def __init__(self, metaclass, class_name, bases, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self, values={"metaclass": metaclass, "bases": bases}, source_ref=source_ref
+        )
+
+        self.class_name = class_name
+
+    def getDetails(self):
+        return {"class_name": self.class_name}
+
+    def getClassName(self):
+        return self.class_name
+
+    def computeExpression(self, trace_collection):
+        # The "__prepare__" of the metaclass can do anything.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
+
+
+class ExpressionClassCreation(ExpressionChildrenHavingBase):
+    """Create a class from its prepared namespace, for classes without keywords.
+
+    This is "metaclass(class_name, bases, class_dict)", done without the
+    call protocol if the metaclass is "type".
+    """
+
+    kind = "EXPRESSION_CLASS_CREATION"
+
+    named_children = ("metaclass", "bases", "class_dict")
+    __slots__ = ("class_name",)
+
+    def __init__(self, metaclass, class_name, bases, class_dict, source_ref):
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values={"metaclass": metaclass, "bases": bases, "class_dict": class_dict},
+            source_ref=source_ref,
+        )
+
+        self.class_name = class_name
+
+    def getDetails(self):
+        return {"class_name": self.class_name}
+
+    def getClassName(self):
+        return self.class_name
+
+    def computeExpression(self, trace_collection):
+        # The metaclass, "__init_subclass__" and "__set_name__" of the class
+        # attributes can do anything.
+        trace_collection.onControlFlowEscape(self)
+        trace_collection.onExceptionRaiseExit(BaseException)
+
+        return self, None, None
@@ -35,6 +35,7 @@ from nuitka.Constants import (
     getUnhashableConstant,
     isConstant,
     isHashable,
+    isHashSearchableConstant,
     isMutable,
 )
 from nuitka.Tracing import optimization_logger
@@ -76,6 +77,7 @@ from .shapes.BuiltinTypeShapes import (
     tshape_type,
     tshape_unicode,
     tshape_xrange,
+    tshapes_hash_searchable,
 )
 
 
@@ -561,7 +563,42 @@ class ExpressionConstantDictEmptyRef(EmptyContainerMixin, ExpressionConstantDict
         )
 
 
-class ExpressionConstantTupleRef(ExpressionConstantRefBase):
+class HashSearchableContainerMixin(object):
+    __slots__ = ()
+
+    def computeExpressionComparisonIn(self, in_node, value_node, trace_collection):
+        if (
+            not value_node.isCompileTimeConstant()
+            and value_node.getTypeShape() in tshapes_hash_searchable
+            and isHashSearchableConstant(self.constant)
+        ):
+            result = makeConstantRefNode(
+                constant=frozenset(self.constant),
+                user_provided=self.user_provided,
+                source_ref=self.source_ref,
+            )
+
+            self.parent.replaceChild(self, result)
+            self.finalize()
+
+            return (
+                in_node,
+                "new_constant",
+                """Containment test in constant %s lowered to frozenset."""
+                % self.getTypeShape().getTypeName(),
+            )
+
+        return CompileTimeConstantExpressionBase.computeExpressionComparisonIn(
+            self,
+            in_node=in_node,
+            value_node=value_node,
+            trace_collection=trace_collection,
+        )
+
+
+class ExpressionConstantTupleRef(
+    HashSearchableContainerMixin, ExpressionConstantRefBase
+):
     kind = "EXPRESSION_CONSTANT_TUPLE_REF"
 
     __slots__ = ()
@@ -642,7 +679,7 @@ class ExpressionConstantTupleEmptyRef(EmptyContainerMixin, ExpressionConstantTup
         )
 
 
-class ExpressionConstantListRef(ExpressionConstantRefBase):
+class ExpressionConstantListRef(HashSearchableContainerMixin, ExpressionConstantRefBase):
     kind = "EXPRESSION_CONSTANT_LIST_REF"
 
     __slots__ = ()
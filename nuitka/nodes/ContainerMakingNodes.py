@@ -270,6 +270,33 @@ Iteration over list lowered to iteration over tuple.""",
         )
 
 
+class ExpressionMakeListPresized(
+    SideEffectsFromChildrenMixin, ExpressionChildHavingBase
+):
+    """ Empty list with room for the items an iterator will still provide.
+
+    Used as the starting value of list contractions, so that appending the
+    results does not have to grow the list over and over.
+    """
+
+    kind = "EXPRESSION_MAKE_LIST_PRESIZED"
+
+    named_child = "iterator"
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildHavingBase.__init__(self, value=iterator, source_ref=source_ref)
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_list
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.subnode_iterator.mayRaiseException(exception_type)
+
+
 class ExpressionMakeSet(ExpressionMakeSequenceBase):
     kind = "EXPRESSION_MAKE_SET"
 
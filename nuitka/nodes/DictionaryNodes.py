@@ -338,6 +338,37 @@ Removed sequence creation for unused sequence.""",
             pair.onContentEscapes(trace_collection)
 
 
+class ExpressionMakeDictPresized(
+    SideEffectsFromChildrenMixin, ExpressionChildHavingBase
+):
+    """ Empty dictionary with room for the items an iterator will still provide.
+
+    Used as the starting value of dict contractions, so that setting the
+    results does not have to grow the dictionary over and over.
+    """
+
+    kind = "EXPRESSION_MAKE_DICT_PRESIZED"
+
+    named_child = "iterator"
+
+    def __init__(self, iterator, source_ref):
+        ExpressionChildHavingBase.__init__(self, value=iterator, source_ref=source_ref)
+
+    @staticmethod
+    def getTypeShape():
+        return tshape_dict
+
+    @staticmethod
+    def hasShapeDictionaryExact():
+        return True
+
+    def computeExpression(self, trace_collection):
+        return self, None, None
+
+    def mayRaiseException(self, exception_type):
+        return self.subnode_iterator.mayRaiseException(exception_type)
+
+
 class StatementDictOperationSet(StatementChildrenHavingBase):
     kind = "STATEMENT_DICT_OPERATION_SET"
 
@@ -58,6 +58,16 @@ def getLocalsDictHandles():
     return locals_dict_handles
 
 
+def releaseLocalsDictHandle(locals_scope):
+    """Forget a locals scope, whose owner is released."""
+    locals_name = locals_scope.getName()
+
+    if locals_dict_handles.get(locals_name) is locals_scope:
+        del locals_dict_handles[locals_name]
+
+        locals_scope.finalize()
+
+
 class LocalsDictHandleBase(object):
     __slots__ = (
         "locals_name",
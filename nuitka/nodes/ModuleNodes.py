@@ -42,7 +42,7 @@ from nuitka.utils.ModuleNames import ModuleName
 from .Checkers import checkStatementsSequenceOrNone
 from .FutureSpecs import fromFlags
 from .IndicatorMixins import EntryPointMixin, MarkNeedsAnnotationsMixin
-from .LocalsScopes import getLocalsDictHandle
+from .LocalsScopes import getLocalsDictHandle, releaseLocalsDictHandle
 from .NodeBases import (
     ChildrenHavingMixin,
     ClosureGiverNodeMixin,
@@ -527,6 +527,54 @@ class CompiledPythonModule(
         for function in self.getUsedFunctions():
             yield function.trace_collection
 
+    def releaseTree(self):
+        """Release the node tree after its code was generated.
+
+        Only what the loader code and the reports need of the module is kept,
+        code cannot be generated for it again afterwards.
+        """
+
+        Variables.releaseSharedScopeInformation(self)
+
+        # Locals scopes are registered globally, and their variables have the
+        # traces, which refer to the nodes.
+        locals_scopes = []
+        pending = [self]
+
+        while pending:
+            node = pending.pop()
+
+            locals_scope = getattr(node, "locals_scope", None)
+            if locals_scope is not None:
+                locals_scopes.append(locals_scope)
+
+            pending.extend(node.getVisitableNodes())
+
+        for locals_scope in locals_scopes:
+            releaseLocalsDictHandle(locals_scope)
+
+        for variable in self.variables.values():
+            variable.finalize()
+
+        self.variables = {}
+
+        body = self.subnode_body
+        functions = self.subnode_functions
+
+        self.setChild("body", None)
+        self.setChild("functions", ())
+
+        for function_body in functions:
+            function_body.trace_collection = None
+            function_body.finalize()
+
+        if body is not None:
+            body.finalize()
+
+        self.trace_collection = None
+        self.active_functions = OrderedSet()
+        self.visited_functions = set()
+
     def isUnoptimized(self):
         # Modules don't do this, pylint: disable=no-self-use
         return False
@@ -37,12 +37,21 @@ from .NodeMakingHelpers import (
     makeRaiseExceptionReplacementExpressionFromInstance,
     wrapExpressionWithSideEffects,
 )
-from .shapes.BuiltinTypeShapes import tshape_bool, tshape_int_or_long
+from .shapes.BuiltinTypeShapes import (
+    tshape_bool,
+    tshape_int,
+    tshape_int_or_long,
+    tshape_str,
+)
 from .shapes.StandardShapes import (
     ShapeLargeConstantValue,
     ShapeLargeConstantValuePredictable,
     vshape_unknown,
 )
+from .StringConcatenationNodes import (
+    getFormattingValuesFromTuple,
+    makePercentFormattingNode,
+)
 
 
 class ExpressionPropertiesFromTypeShapeMixin(object):
@@ -453,6 +462,44 @@ class ExpressionOperationBinaryMod(ExpressionOperationBinaryBase):
     def _getOperationShape(left_shape, right_shape):
         return left_shape.getOperationBinaryModShape(right_shape)
 
+    def _getFormattingValues(self):
+        right = self.subnode_right
+
+        if right.getTypeShape() in (tshape_int, tshape_str):
+            # Cannot be a tuple or mapping, so it is the only value.
+            return (right,)
+        else:
+            return getFormattingValuesFromTuple(right)
+
+    def computeExpression(self, trace_collection):
+        result = ExpressionOperationBinaryBase.computeExpression(
+            self, trace_collection=trace_collection
+        )
+
+        if (
+            result[0] is self
+            and python_version >= 0x360
+            and self.subnode_left.isExpressionConstantStrRef()
+        ):
+            values = self._getFormattingValues()
+
+            if values is not None:
+                new_node = makePercentFormattingNode(
+                    template=self.subnode_left.getCompileTimeConstant(),
+                    values=values,
+                    source_ref=self.source_ref,
+                )
+
+                if new_node is not None:
+                    return (
+                        new_node,
+                        "new_expression",
+                        """\
+Lowered '%' string formatting with constant template to string building.""",
+                    )
+
+        return result
+
 
 class ExpressionOperationBinaryDivmod(ExpressionOperationBinaryBase):
     kind = "EXPRESSION_OPERATION_BINARY_DIVMOD"
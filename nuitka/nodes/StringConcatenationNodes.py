@@ -21,10 +21,23 @@ This is used for Python 3.6 fstrings re-formulation and has pretty direct
 code alternative to actually looking up that method from the empty string
 object, so it got a dedicated node, also to perform optimizations specific
 to this.
+
+String formatting with "%" and "str.format" using constant templates is
+lowered to this too, when the template is simple enough.
 """
+from string import Formatter
+
 from .ConstantRefNodes import makeConstantRefNode
 from .ExpressionBases import ExpressionChildHavingBase
-from .shapes.BuiltinTypeShapes import tshape_str_or_unicode
+from .shapes.BuiltinTypeShapes import (
+    tshape_float,
+    tshape_int,
+    tshape_str,
+    tshape_str_or_unicode,
+)
+
+# For these exact types, formatting without a spec is the same as "str".
+_formats_as_str_shapes = (tshape_int, tshape_float, tshape_str)
 
 
 class ExpressionStringConcatenation(ExpressionChildHavingBase):
@@ -98,3 +111,223 @@ class ExpressionStringConcatenation(ExpressionChildHavingBase):
             )
 
         return self, None, None
+
+
+def getFormattingValuesFromTuple(node):
+    """Get the value nodes of a tuple for use in string formatting or None."""
+
+    if node is None:
+        return ()
+    elif node.isExpressionMakeTuple():
+        return node.subnode_elements
+    elif node.isExpressionConstantTupleRef():
+        return tuple(
+            makeConstantRefNode(
+                constant=value, source_ref=node.source_ref, user_provided=True
+            )
+            for value in node.getCompileTimeConstant()
+        )
+    else:
+        return None
+
+
+def _makeFormattedValue(value, conversion, format_spec, source_ref):
+    # Cyclic dependency otherwise, pylint: disable=cyclic-import
+    from .BuiltinFormatNodes import ExpressionBuiltinAscii, ExpressionBuiltinFormat
+    from .BuiltinTypeNodes import ExpressionBuiltinStrP3
+    from .OperatorNodes import ExpressionOperationUnary
+
+    # Same as the "FormattedValue" of f-strings.
+    if conversion is None:
+        pass
+    elif conversion == "s":
+        value = ExpressionBuiltinStrP3(
+            value=value, encoding=None, errors=None, source_ref=source_ref
+        )
+    elif conversion == "r":
+        value = ExpressionOperationUnary(
+            operator="Repr", operand=value, source_ref=source_ref
+        )
+    elif conversion == "a":
+        value = ExpressionBuiltinAscii(value=value, source_ref=source_ref)
+    else:
+        assert False, conversion
+
+    # The "%" formatting uses converted values as they are, where "str.format"
+    # formats them with an empty format spec still.
+    if conversion is not None and format_spec is None:
+        return value
+
+    return ExpressionBuiltinFormat(
+        value=value,
+        format_spec=makeConstantRefNode(constant=format_spec, source_ref=source_ref)
+        if format_spec
+        else None,
+        source_ref=source_ref,
+    )
+
+
+def _makeFormattingConcatenation(parsed, values, source_ref):
+    # Values are now evaluated interleaved with the formatting of the ones
+    # before them, which only can make no difference if they have no side
+    # effects. Each must also be used exactly once, and in order.
+    for value in values[1:]:
+        if value.mayHaveSideEffects():
+            return None
+
+    parts = []
+    used = 0
+
+    for literal, field in parsed:
+        if literal:
+            parts.append(makeConstantRefNode(constant=literal, source_ref=source_ref))
+
+        if field is not None:
+            index, conversion, format_spec = field
+
+            if index != used or index >= len(values):
+                return None
+
+            used += 1
+
+            parts.append(
+                _makeFormattedValue(
+                    value=values[index],
+                    conversion=conversion,
+                    format_spec=format_spec,
+                    source_ref=source_ref,
+                )
+            )
+
+    if used != len(values):
+        return None
+
+    if not parts:
+        return makeConstantRefNode(constant="", source_ref=source_ref)
+
+    return ExpressionStringConcatenation(values=parts, source_ref=source_ref)
+
+
+def _parsePercentTemplate(template, values):
+    result = []
+    literal = []
+
+    pos = 0
+    while pos < len(template):
+        char = template[pos]
+        pos += 1
+
+        if char != "%":
+            literal.append(char)
+            continue
+
+        # Widths, flags, mapping keys, and all other conversions are left to
+        # run time.
+        code = template[pos : pos + 1]
+        pos += 1
+
+        if code == "%":
+            literal.append("%")
+            continue
+
+        if code not in ("s", "r", "a", "d", "i") or len(result) >= len(values):
+            return None
+
+        value_shape = values[len(result)].getTypeShape()
+
+        if code in ("d", "i"):
+            # Only for exact "int" values this is the same as formatting them.
+            if value_shape is not tshape_int:
+                return None
+
+            conversion = None
+        elif code == "s" and value_shape in _formats_as_str_shapes:
+            conversion = None
+        else:
+            conversion = code
+
+        result.append(("".join(literal), (len(result), conversion, None)))
+        literal = []
+
+    result.append(("".join(literal), None))
+
+    return result
+
+
+def makePercentFormattingNode(template, values, source_ref):
+    """Make a string concatenation for "template % values" or None.
+
+    Only templates with plain "%s", "%r", "%a", "%d" and "%i" conversions
+    are handled, and only when the number of values matches. Everything else
+    is left to the formatting at run time, which also raises the errors.
+    """
+
+    parsed = _parsePercentTemplate(template, values)
+
+    if parsed is None:
+        return None
+
+    return _makeFormattingConcatenation(
+        parsed=parsed, values=values, source_ref=source_ref
+    )
+
+
+def _parseFormatTemplate(template):
+    result = []
+    auto_index = 0
+    manual_index = False
+
+    try:
+        formatter_parsed = list(Formatter().parse(template))
+    except ValueError:
+        return None
+
+    for literal, field_name, format_spec, conversion in formatter_parsed:
+        if field_name is None:
+            result.append((literal, None))
+            continue
+
+        # Attribute and item lookups, nested format specs, keyword fields and
+        # invalid conversions are left to run time.
+        if conversion not in (None, "s", "r", "a"):
+            return None
+
+        if field_name == "":
+            if manual_index:
+                return None
+
+            index = auto_index
+            auto_index += 1
+        elif field_name.isdecimal():
+            if auto_index:
+                return None
+
+            index = int(field_name)
+            manual_index = True
+        else:
+            return None
+
+        if "{" in format_spec:
+            return None
+
+        result.append((literal, (index, conversion, format_spec)))
+
+    return result
+
+
+def makeFormatMethodNode(template, values, source_ref):
+    """Make a string concatenation for "template.format(*values)" or None.
+
+    Only positional fields without lookups and nested format specs are
+    handled, and only when all values are used once in order. Everything
+    else is left to the method at run time, which also raises the errors.
+    """
+
+    parsed = _parseFormatTemplate(template)
+
+    if parsed is None:
+        return None
+
+    return _makeFormattingConcatenation(
+        parsed=parsed, values=values, source_ref=source_ref
+    )
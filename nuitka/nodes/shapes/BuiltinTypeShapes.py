@@ -3969,3 +3969,11 @@ class ShapeTypeBuiltinExceptionClass(ShapeBase):
 
 
 tshape_exception_class = ShapeTypeBuiltinExceptionClass()
+
+# Values of these shapes compare equal by value only, and agree with their hash
+# on it, so containment tests for them can use a set of constant values.
+tshapes_hash_searchable = tuple(
+    shape
+    for shape in (tshape_str, tshape_int, tshape_long, tshape_bytes, tshape_bool)
+    if shape is not None
+)
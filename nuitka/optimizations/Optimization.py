@@ -44,6 +44,7 @@ from nuitka.utils.MemoryUsage import (
     MemoryWatch,
     getHumanReadableProcessMemoryUsage,
 )
+from nuitka.utils.PerformanceReport import timeModule, timePhase
 
 from . import Graphs, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
@@ -549,7 +550,8 @@ def makeOptimizationPass():
         global tag_set
         tag_set = TagSet()
 
-        changed = optimizeModule(current_module)
+        with timeModule(current_module.getFullName()):
+            changed = optimizeModule(current_module)
 
         if changed:
             finished = False
@@ -616,13 +618,15 @@ def optimize(output_filename):
     if _progress:
         progress_logger.info("PASS 1:")
 
-    makeOptimizationPass()
+    with timePhase("Optimization pass 1"):
+        makeOptimizationPass()
     Variables.complete = True
 
     if _progress:
         progress_logger.info("PASS 2:")
 
-    finished = makeOptimizationPass()
+    with timePhase("Optimization pass 2"):
+        finished = makeOptimizationPass()
 
     if Options.isExperimental("check_xml_persistence"):
         _checkXMLPersistence()
@@ -644,6 +648,7 @@ def optimize(output_filename):
         if _progress:
             progress_logger.info("PASS %d:" % pass_count)
 
-        finished = makeOptimizationPass()
+        with timePhase("Optimization pass %d" % pass_count):
+            finished = makeOptimizationPass()
 
     Graphs.endGraph(output_filename)
@@ -80,6 +80,11 @@ class NuitkaPluginBase(object):
     # the script's path (use __file__, __module__ or __name__).
     plugin_name = None
 
+    # Plugins that only deal with some packages can name them here as a tuple,
+    # e.g. ("gevent",) and then module specific methods are only called for
+    # modules within these packages. The default None means all modules.
+    module_prefixes = None
+
     @staticmethod
     def isAlwaysEnabled():
         """Request to be always enabled.
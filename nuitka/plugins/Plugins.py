@@ -74,6 +74,10 @@ def _addActivePlugin(plugin_class, args, force=False):
 
     active_plugins[plugin_name] = plugin_instance
 
+    # Activation changes which plugins handle which hooks.
+    _plugins_by_hook.clear()
+    _plugins_by_hook_and_package.clear()
+
 
 def getActivePlugins():
     """Return list of active plugins.
@@ -86,6 +90,100 @@ def getActivePlugins():
     return active_plugins.values()
 
 
+# Methods of "NuitkaPluginBase" that a plugin needs to override for a hook to
+# have any effect, if not just the hook method itself.
+_hook_methods = {
+    "considerImplicitImports": ("considerImplicitImports", "getImplicitImports"),
+    "onModuleSourceCode": ("onModuleSourceCode", "checkModuleSourceCode"),
+    "onModuleDiscovered": (
+        "onModuleDiscovered",
+        "createPreModuleLoadCode",
+        "createPostModuleLoadCode",
+    ),
+    "considerExtraDlls": ("considerExtraDlls", "getExtraDlls"),
+    "considerFailedImportReferrals": (
+        "considerFailedImportReferrals",
+        "module_aliases",
+    ),
+}
+
+_plugins_by_hook = {}
+_plugins_by_hook_and_package = {}
+
+
+def _isOverriding(plugin, method_name):
+    if method_name in plugin.__dict__:
+        return True
+
+    for plugin_class in type(plugin).__mro__:
+        if method_name in plugin_class.__dict__:
+            return plugin_class is not NuitkaPluginBase
+
+    return False
+
+
+def getActivePluginsForHook(hook_name):
+    """Return active plugins that do something for a hook.
+
+    Args:
+        hook_name - name of the "NuitkaPluginBase" method
+
+    Returns:
+        tuple of plugins overriding the hook, in activation order
+
+    Notes:
+        Plugins only inheriting the default implementation of the
+        hook are left out, it would do nothing for them.
+    """
+
+    if hook_name not in _plugins_by_hook:
+        method_names = _hook_methods.get(hook_name, (hook_name,))
+
+        _plugins_by_hook[hook_name] = tuple(
+            plugin
+            for plugin in getActivePlugins()
+            if any(_isOverriding(plugin, method_name) for method_name in method_names)
+        )
+
+    return _plugins_by_hook[hook_name]
+
+
+def getActivePluginsForModule(hook_name, module_name):
+    """Return active plugins that do something for a hook and module.
+
+    Args:
+        hook_name - name of the "NuitkaPluginBase" method
+        module_name - name of the module the hook is called for
+
+    Returns:
+        tuple of plugins overriding the hook, and that did not limit
+        themselves with "module_prefixes" to other packages.
+    """
+
+    if type(module_name) is not ModuleName:
+        module_name = ModuleName(module_name)
+
+    key = hook_name, module_name.getTopLevelPackageName()
+
+    if key not in _plugins_by_hook_and_package:
+        _plugins_by_hook_and_package[key] = tuple(
+            plugin
+            for plugin in getActivePluginsForHook(hook_name)
+            if plugin.module_prefixes is None
+            or any(
+                ModuleName(module_prefix).getTopLevelPackageName() == key[1]
+                for module_prefix in plugin.module_prefixes
+            )
+        )
+
+    return tuple(
+        plugin
+        for plugin in _plugins_by_hook_and_package[key]
+        if plugin.module_prefixes is None
+        or module_name.hasOneOfNamespaces(plugin.module_prefixes)
+    )
+
+
 def hasActivePlugin(plugin_name):
     """Decide if a plugin is active.
 
@@ -198,7 +296,9 @@ class Plugins(object):
 
     @staticmethod
     def considerImplicitImports(module, signal_change):
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "considerImplicitImports", module.getFullName()
+        ):
             plugin.considerImplicitImports(module, signal_change)
 
         # Post load code may have been created, if so indicate it's used.
@@ -213,7 +313,7 @@ class Plugins(object):
     @staticmethod
     def onStandaloneDistributionFinished(dist_dir):
         """Let plugins postprocess the distribution folder if standalone"""
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForHook("onStandaloneDistributionFinished"):
             plugin.onStandaloneDistributionFinished(dist_dir)
 
         return None
@@ -232,7 +332,9 @@ class Plugins(object):
 
         result = []
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "considerExtraDlls", module.getFullName()
+        ):
             for extra_dll in plugin.considerExtraDlls(dist_dir, module):
                 # Backward compatibility with plugins not yet migrated to getExtraDlls usage.
                 if len(extra_dll) == 3:
@@ -276,7 +378,7 @@ class Plugins(object):
 
         result = []
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForHook("removeDllDependencies"):
             for removed_dll in plugin.removeDllDependencies(
                 dll_filename, dll_filenames
             ):
@@ -294,14 +396,18 @@ class Plugins(object):
             Data file description pairs, either (source, dest) or (func, dest)
             where the func will be called to create the content dynamically.
         """
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "considerDataFiles", module.getFullName()
+        ):
             for value in plugin.considerDataFiles(module):
                 if value:
                     yield plugin, value
 
     @staticmethod
     def onModuleDiscovered(module):
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "onModuleDiscovered", module.getFullName()
+        ):
             plugin.onModuleDiscovered(module)
 
     @staticmethod
@@ -309,7 +415,7 @@ class Plugins(object):
         assert type(module_name) is ModuleName
         assert type(source_code) is str
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule("onModuleSourceCode", module_name):
             source_code = plugin.onModuleSourceCode(module_name, source_code)
             assert type(source_code) is str
 
@@ -320,7 +426,9 @@ class Plugins(object):
         assert type(module_name) is ModuleName
         assert type(source_code) is str
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "onFrozenModuleSourceCode", module_name
+        ):
             source_code = plugin.onFrozenModuleSourceCode(
                 module_name, is_package, source_code
             )
@@ -333,7 +441,7 @@ class Plugins(object):
         assert type(module_name) is ModuleName
         assert bytecode.__class__.__name__ == "code"
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule("onFrozenModuleBytecode", module_name):
             bytecode = plugin.onFrozenModuleBytecode(module_name, is_package, bytecode)
             assert bytecode.__class__.__name__ == "code"
 
@@ -343,7 +451,7 @@ class Plugins(object):
     def onModuleEncounter(module_filename, module_name, module_kind):
         result = False
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule("onModuleEncounter", module_name):
             must_recurse = plugin.onModuleEncounter(
                 module_filename, module_name, module_kind
             )
@@ -356,13 +464,15 @@ class Plugins(object):
     def onModuleInitialSet():
         from nuitka.ModuleRegistry import addRootModule
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForHook("onModuleInitialSet"):
             for module in plugin.onModuleInitialSet():
                 addRootModule(module)
 
     @staticmethod
     def considerFailedImportReferrals(module_name):
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule(
+            "considerFailedImportReferrals", module_name
+        ):
             new_module_name = plugin.considerFailedImportReferrals(module_name)
 
             if new_module_name is not None:
@@ -389,7 +499,7 @@ class Plugins(object):
 
         source_ref = importing.getSourceReference()
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForHook("suppressUnknownImportWarning"):
             if plugin.suppressUnknownImportWarning(
                 importing_module, module_name, source_ref
             ):
@@ -407,7 +517,7 @@ class Plugins(object):
         Returns:
             "compiled" (default) or "bytecode".
         """
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForModule("decideCompilation", module_name):
             value = plugin.decideCompilation(module_name, source_ref)
 
             if value is not None:
@@ -434,7 +544,7 @@ class Plugins(object):
         if cls.preprocessor_symbols is None:
             cls.preprocessor_symbols = OrderedDict()
 
-            for plugin in getActivePlugins():
+            for plugin in getActivePluginsForHook("getPreprocessorSymbols"):
                 value = plugin.getPreprocessorSymbols()
 
                 if value is not None:
@@ -452,7 +562,7 @@ class Plugins(object):
     def getExtraCodeFiles():
         result = OrderedDict()
 
-        for plugin in getActivePlugins():
+        for plugin in getActivePluginsForHook("getExtraCodeFiles"):
             value = plugin.getExtraCodeFiles()
 
             if value is not None:
@@ -473,7 +583,7 @@ class Plugins(object):
         if cls.extra_link_libraries is None:
             cls.extra_link_libraries = OrderedSet()
 
-            for plugin in getActivePlugins():
+            for plugin in getActivePluginsForHook("getExtraLinkLibraries"):
                 value = plugin.getExtraLinkLibraries()
 
                 if value is not None:
@@ -27,6 +27,8 @@ class NuitkaPluginDillWorkarounds(NuitkaPluginBase):
 
     plugin_name = "dill-compat"
 
+    module_prefixes = ("dill",)
+
     @staticmethod
     def isAlwaysEnabled():
         return False
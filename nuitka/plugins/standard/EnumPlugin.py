@@ -31,6 +31,8 @@ class NuitkaPluginEnumWorkarounds(NuitkaPluginBase):
 
     plugin_name = "enum-compat"
 
+    module_prefixes = ("enum",)
+
     @classmethod
     def isRelevant(cls):
         return python_version < 0x300
@@ -28,6 +28,8 @@ class EventletPlugin(NuitkaPluginBase):
     plugin_name = "eventlet"
     plugin_desc = "Required by the eventlet package"
 
+    module_prefixes = ("dns",)
+
     @classmethod
     def isRelevant(cls):
         """One time only check: may this plugin be required?
@@ -53,6 +55,8 @@ class EventletPluginDetector(NuitkaPluginBase):
 
     detector_for = EventletPlugin
 
+    module_prefixes = ("eventlet",)
+
     @classmethod
     def isRelevant(cls):
         """One time only check: may this plugin be required?
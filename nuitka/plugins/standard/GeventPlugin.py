@@ -29,6 +29,8 @@ class GeventPlugin(NuitkaPluginBase):
     plugin_name = "gevent"
     plugin_desc = "Required by the gevent package"
 
+    module_prefixes = ("gevent",)
+
     @classmethod
     def isRelevant(cls):
         """One time only check: may this plugin be required?
@@ -69,6 +71,8 @@ class GeventPluginDetector(NuitkaPluginBase):
 
     detector_for = GeventPlugin
 
+    module_prefixes = ("gevent",)
+
     @classmethod
     def isRelevant(cls):
         """One time only check: may this plugin be required?
@@ -0,0 +1,868 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Data tables for implicit imports of popular modules.
+
+Most of the knowledge of the "implicit-imports" plugin is plain data, mapping a
+module name to the names of modules it imports implicitly. Keeping it in tables
+allows for indexed lookups rather than going over every known module for each
+imported module. Only cases that need to look at the module itself remain code
+in the plugin.
+"""
+
+# Modules imported implicitly by the given module, looked up by exact name.
+implicit_imports = {
+    "PySide.QtDeclarative": ("PySide.QtGui",),
+    "PySide.QtHelp": ("PySide.QtGui",),
+    "PySide.QtOpenGL": ("PySide.QtGui",),
+    "PySide.QtScriptTools": ("PySide.QtScript", "PySide.QtGui"),
+    "PySide.QtSql": ("PySide.QtGui",),
+    "PySide.QtSvg": ("PySide.QtGui",),
+    "PySide.QtTest": ("PySide.QtGui",),
+    "PySide.QtUiTools": ("PySide.QtGui", "PySide.QtXml"),
+    "PySide.QtWebKit": ("PySide.QtGui",),
+    "PySide.phonon": ("PySide.QtGui",),
+    "lxml": (
+        "lxml.builder",
+        "lxml.etree",
+        "lxml.objectify",
+        "lxml.sax",
+        "lxml._elementpath",
+    ),
+    "lxml.etree": ("lxml._elementpath",),
+    "lxml.html": ("lxml.html.clean", "lxml.html.diff", "lxml.etree"),
+    "gtk._gtk": ("pangocairo", "pango", "cairo", "gio", "atk"),
+    "atk": ("gobject",),
+    "gtkunixprint": ("gobject", "cairo", "gtk"),
+    "pango": ("gobject",),
+    "pangocairo": ("pango", "cairo"),
+    "reportlab.rl_config": ("reportlab.rl_settings",),
+    "socket": ("_socket",),
+    "ctypes": ("_ctypes",),
+    "gi._gi": ("gi._error",),
+    "gi._gi_cairo": ("cairo",),
+    "cairo._cairo": ("gi._gobject",),
+    "Tkinter": ("_tkinter",),
+    "tkinter": ("_tkinter",),
+    "cryptography": ("_cffi_backend",),
+    "bcrypt._bcrypt": ("_cffi_backend",),
+    "nacl._sodium": ("_cffi_backend",),
+    "brotli._brotli": ("_cffi_backend",),
+    "_dbus_glib_bindings": ("_dbus_bindings",),
+    "_mysql": ("_mysql_exceptions",),
+    "lxml.objectify": ("lxml.etree",),
+    "_yaml": ("yaml",),
+    "apt_inst": ("apt_pkg",),
+    "engineio": ("engineio.async_drivers",),
+    "engineio.async_drivers": (
+        "engineio.async_drivers.aiohttp",
+        "engineio.async_drivers.asgi",
+        "engineio.async_drivers.eventlet",
+        "engineio.async_drivers.gevent",
+        "engineio.async_drivers.gevent_uwsgi",
+        "engineio.async_drivers.sanic",
+        "engineio.async_drivers.threading",
+        "engineio.async_drivers.tornado",
+    ),
+    "eventlet": ("eventlet.hubs",),
+    "eventlet.hubs": (
+        "eventlet.hubs.epolls",
+        "eventlet.hubs.hub",
+        "eventlet.hubs.kqueue",
+        "eventlet.hubs.poll",
+        "eventlet.hubs.pyevent",
+        "eventlet.hubs.selects",
+        "eventlet.hubs.timer",
+    ),
+    "gevent": (
+        "_cffi_backend",
+        "gevent._config",
+        "gevent.core",
+        "gevent.resolver_thread",
+        "gevent.resolver_ares",
+        "gevent.socket",
+        "gevent.threadpool",
+        "gevent.thread",
+        "gevent.threading",
+        "gevent.select",
+        "gevent.hub",
+        "gevent.greenlet",
+        "gevent.local",
+        "gevent.event",
+        "gevent.queue",
+        "gevent.resolver",
+        "gevent.subprocess",
+    ),
+    "gevent.hub": (
+        "gevent._hub_primitives",
+        "gevent._greenlet_primitives",
+        "gevent._hub_local",
+        "gevent._waiter",
+        "gevent._util",
+        "gevent._ident",
+        "gevent.exceptions",
+    ),
+    "gevent.libev": (
+        "gevent.libev.corecext",
+        "gevent.libev.corecffi",
+        "gevent.libev.watcher",
+    ),
+    "gevent.libuv": (
+        "gevent._interfaces",
+        "gevent._ffi",
+        "gevent.libuv.loop",
+        "gevent.libuv.watcher",
+    ),
+    "gevent.libuv.loop": ("gevent.libuv._corecffi", "gevent._interfaces"),
+    "gevent._ffi": ("gevent._ffi.loop", "gevent._ffi.callback", "gevent._ffi.watcher"),
+    "gevent._waiter": ("gevent.__waiter",),
+    "gevent._hub_local": ("gevent.__hub_local", "gevent.__greenlet_primitives"),
+    "gevent._hub_primitives": ("gevent.__hub_primitives",),
+    "gevent.greenlet": ("gevent._hub_local", "gevent._greenlet"),
+    "gevent._greenlet": ("gevent.__ident",),
+    "gevent.monkey": (
+        "gevent.builtins",
+        "gevent.time",
+        "gevent.local",
+        "gevent.ssl",
+        "gevent.events",
+    ),
+    "gevent.resolver": (
+        "gevent.resolver.blocking",
+        "gevent.resolver.cares",
+        "gevent.resolver.thread",
+    ),
+    "gevent._semaphore": ("gevent._abstract_linkable", "gevent.__semaphore"),
+    "gevent._abstract_linkable": ("gevent.__abstract_linkable",),
+    "gevent.local": ("gevent._local",),
+    "gevent.event": ("gevent._event",),
+    "gevent.queue": ("gevent._queue",),
+    "gevent.pool": ("gevent._imap",),
+    "gevent._imap": ("gevent.__imap",),
+    "tensorflow": ("tensorboard", "tensorflow_estimator"),
+    "tensorflow.python": (
+        "tensorflow.python._pywrap_tensorflow_internal",
+        "tensorflow.python.ops",
+        "tensorflow.python.ops.cond_v2",
+    ),
+    "tensorflow.lite.python.interpreter_wrapper": (
+        "tensorflow.lite.python.interpreter_wrapper._tensorflow_wrap_interpreter_wrapper",
+    ),
+    "tensorflow.lite.python.optimize": (
+        "tensorflow.lite.python.optimize._tensorflow_lite_wrap_calibration_wrapper",
+    ),
+    "tensorflow.lite.toco.python": (
+        "tensorflow.lite.toco.python._tensorflow_wrap_toco",
+    ),
+    "boto3": (
+        "boto3.ec2",
+        "boto3.ec2.createtags",
+        "boto3.ec2.deletetags",
+        "boto3.dynamodb",
+        "boto3.s3",
+        "boto3.s3.inject",
+        "boto3.s3.transfer",
+    ),
+    "osgeo": (
+        "osgeo._gdal",
+        "osgeo._gdalconst",
+        "osgeo._gdal_array",
+        "osgeo._gnm",
+        "osgeo._ogr",
+        "osgeo._osr",
+    ),
+    "cv2": ("numpy", "numpy.core"),
+    "fastapi": ("fastapi.routing",),
+    "pydantic": (
+        "pydantic.typing",
+        "pydantic.fields",
+        "pydantic.utils",
+        "pydantic.schema",
+        "pydantic.env_settings",
+        "pydantic.main",
+        "pydantic.error_wrappers",
+        "pydantic.validators",
+        "pydantic.mypy",
+        "pydantic.version",
+        "pydantic.types",
+        "pydantic.color",
+        "pydantic.parse",
+        "pydantic.json",
+        "pydantic.datetime_parse",
+        "pydantic.dataclasses",
+        "pydantic.class_validators",
+        "pydantic.networks",
+        "pydantic.errors",
+    ),
+    "uvicorn": ("uvicorn.loops", "uvicorn.lifespan", "uvicorn.protocols"),
+    "uvicorn.config": ("uvicorn.logging",),
+    "uvicorn.lifespan": ("uvicorn.lifespan.off", "uvicorn.lifespan.on"),
+    "uvicorn.loops": ("uvicorn.loops.auto", "uvicorn.loops.uvloop"),
+    "uvicorn.protocols": ("uvicorn.protocols.http", "uvicorn.protocols.websockets"),
+    "uvicorn.protocols.http": (
+        "uvicorn.protocols.http.auto",
+        "uvicorn.protocols.http.h11_impl",
+        "uvicorn.protocols.http.httptools_impl",
+    ),
+    "uvicorn.protocols.websockets": (
+        "uvicorn.protocols.websockets.auto",
+        "uvicorn.protocols.websockets.websockets_impl",
+        "uvicorn.protocols.websockets.wsproto_impl",
+    ),
+    "vtkmodules": ("vtkmodules.all", "vtkmodules.util"),
+    "vtkmodules.util": (
+        "vtkmodules.util.misc",
+        "vtkmodules.util.numpy_support",
+        "vtkmodules.util.vtkAlgorithm",
+        "vtkmodules.util.vtkConstants",
+        "vtkmodules.util.vtkImageExportToArray",
+        "vtkmodules.util.vtkImageImportFromArray",
+        "vtkmodules.util.vtkMethodParser",
+        "vtkmodules.util.vtkVariant",
+    ),
+    "vtkmodules.qt": ("vtkmodules.qt.QVTKRenderWindowInteractor",),
+    "vtkmodules.tk": (
+        "vtkmodules.tk.vtkLoadPythonTkWidgets",
+        "vtkmodules.tk.vtkTkImageViewerWidget",
+        "vtkmodules.tk.vtkTkPhotoImage",
+        "vtkmodules.tk.vtkTkRenderWidget",
+        "vtkmodules.tk.vtkTkRenderWindowInteractor",
+    ),
+    "vtkmodules.wx": (
+        "vtkmodules.wx.wxVTKRenderWindow",
+        "vtkmodules.wx.wxVTKRenderWindowInteractor",
+    ),
+    "chainer": ("chainer.distributions", "chainer.distributions.utils"),
+    "chainer.distributions": ("chainer.distributions.utils",),
+    "numpy": (
+        "numpy._mklinit",
+        "numpy.compat",
+        "numpy.lib",
+        "numpy.linalg",
+        "numpy.fft",
+        "numpy.polynomial",
+        "numpy.random",
+        "numpy.ctypeslib",
+        "numpy.ma",
+        "numpy.matrixlib",
+    ),
+    "numpy.core": ("numpy.core._dtype_ctypes", "numpy.core._multiarray_tests"),
+    "numpy.random": (
+        "numpy.random._bit_generator",
+        "numpy.random._bounded_integers",
+        "numpy.random._common",
+        "numpy.random._generator",
+        "numpy.random._mt19937",
+        "numpy.random._pcg64",
+        "numpy.random._philox",
+        "numpy.random._sfc64",
+        "numpy.random.bit_generator",
+        "numpy.random.bounded_integers",
+        "numpy.random.common",
+        "numpy.random.generator",
+        "numpy.random.mt19937",
+        "numpy.random.pcg64",
+        "numpy.random.philox",
+        "numpy.random.sfc64",
+        "numpy.random.entropy",
+        "numpy.random.mtrand",
+    ),
+    "matplotlib": (
+        "matplotlib.backend_managers",
+        "matplotlib.backend_bases",
+        "mpl_toolkits",
+    ),
+    "matplotlib.backends": (
+        "matplotlib.backends._backend_agg",
+        "matplotlib.backends._tkagg",
+        "matplotlib.backends.backend_tkagg",
+        "matplotlib.backends.backend_agg",
+    ),
+    "matplotlib.backends.backend_cairo": ("cairo", "cairocffi"),
+    "scipy.stats._stats": ("scipy.special.cython_special",),
+    "scipy.special": ("scipy.special._ufuncs_cxx",),
+    "scipy.linalg": ("scipy.linalg.cython_blas", "scipy.linalg.cython_lapack"),
+    "scipy.sparse.csgraph": ("scipy.sparse.csgraph._validation",),
+    "scipy._lib": ("scipy._lib.messagestream",),
+    "scipy.spatial": ("scipy.spatial.transform",),
+    "scipy.spatial.transform": ("scipy.spatial.transform._rotation_groups",),
+    "statsmodels.nonparametric": (
+        "statsmodels.nonparametric.linbin",
+        "statsmodels.nonparametric._smoothers_lowess",
+    ),
+    "statsmodels.tsa": ("statsmodels.tsa._exponential_smoothers",),
+    "statsmodels.tsa.innovations": ("statsmodels.tsa.innovations._arma_innovations",),
+    "statsmodels.tsa.kalmanf": ("statsmodels.tsa.kalmanf.kalman_loglike",),
+    "statsmodels.tsa.regime_switching": (
+        "statsmodels.tsa.regime_switching._hamilton_filter",
+        "statsmodels.tsa.regime_switching._kim_smoother",
+    ),
+    "statsmodels.tsa.statespace": (
+        "statsmodels.tsa.statespace._filters",
+        "statsmodels.tsa.statespace._initialization",
+        "statsmodels.tsa.statespace._kalman_filter",
+        "statsmodels.tsa.statespace._kalman_smoother",
+        "statsmodels.tsa.statespace._representation",
+        "statsmodels.tsa.statespace._simulation_smoother",
+        "statsmodels.tsa.statespace._smoothers",
+        "statsmodels.tsa.statespace._tools",
+    ),
+    "statsmodels.tsa.statespace._filters": (
+        "statsmodels.tsa.statespace._filters._conventional",
+        "statsmodels.tsa.statespace._filters._inversions",
+        "statsmodels.tsa.statespace._filters._univariate",
+        "statsmodels.tsa.statespace._filters._univariate_diffuse",
+    ),
+    "statsmodels.tsa.statespace._smoothers": (
+        "statsmodels.tsa.statespace._smoothers._alternative",
+        "statsmodels.tsa.statespace._smoothers._classical",
+        "statsmodels.tsa.statespace._smoothers._conventional",
+        "statsmodels.tsa.statespace._smoothers._univariate",
+        "statsmodels.tsa.statespace._smoothers._univariate_diffuse",
+    ),
+    "pywt": ("pywt._extensions",),
+    "pywt._extensions": (
+        "pywt._extensions._cwt",
+        "pywt._extensions._dwt",
+        "pywt._extensions._pywt",
+        "pywt._extensions._swt",
+    ),
+    "imageio": (
+        "PIL.BlpImagePlugin",
+        "PIL.BmpImagePlugin",
+        "PIL.BufrStubImagePlugin",
+        "PIL.CurImagePlugin",
+        "PIL.DcxImagePlugin",
+        "PIL.DdsImagePlugin",
+        "PIL.EpsImagePlugin",
+        "PIL.FitsStubImagePlugin",
+        "PIL.FliImagePlugin",
+        "PIL.FpxImagePlugin",
+        "PIL.FtexImagePlugin",
+        "PIL.GbrImagePlugin",
+        "PIL.GifImagePlugin",
+        "PIL.GribStubImagePlugin",
+        "PIL.Hdf5StubImagePlugin",
+        "PIL.IcnsImagePlugin",
+        "PIL.IcoImagePlugin",
+        "PIL.ImImagePlugin",
+        "PIL.ImtImagePlugin",
+        "PIL.IptcImagePlugin",
+        "PIL.Jpeg2KImagePlugin",
+        "PIL.JpegImagePlugin",
+        "PIL.McIdasImagePlugin",
+        "PIL.MicImagePlugin",
+        "PIL.MpegImagePlugin",
+        "PIL.MpoImagePlugin",
+        "PIL.MspImagePlugin",
+        "PIL.PalmImagePlugin",
+        "PIL.PcdImagePlugin",
+        "PIL.PcxImagePlugin",
+        "PIL.PdfImagePlugin",
+        "PIL.PixarImagePlugin",
+        "PIL.PngImagePlugin",
+        "PIL.PpmImagePlugin",
+        "PIL.PsdImagePlugin",
+        "PIL.SgiImagePlugin",
+        "PIL.SpiderImagePlugin",
+        "PIL.SunImagePlugin",
+        "PIL.TgaImagePlugin",
+        "PIL.TiffImagePlugin",
+        "PIL.WebPImagePlugin",
+        "PIL.WmfImagePlugin",
+        "PIL.XbmImagePlugin",
+        "PIL.XpmImagePlugin",
+        "PIL.XVThumbImagePlugin",
+    ),
+    "skimage.draw": ("skimage.draw._draw",),
+    "skimage.external.tifffile": ("skimage.external.tifffile._tifffile",),
+    "skimage.feature.orb_cy": ("skimage.feature._orb_descriptor_positions",),
+    "skimage.feature": (
+        "skimage.feature.brief_cy",
+        "skimage.feature.censure_cy",
+        "skimage.feature.corner_cy",
+        "skimage.feature.orb_cy",
+        "skimage.feature._cascade",
+        "skimage.feature._haar",
+        "skimage.feature._hessian_det_appx",
+        "skimage.feature._hoghistogram",
+        "skimage.feature._texture",
+    ),
+    "skimage.filters.rank": (
+        "skimage.filters.rank.bilateral_cy",
+        "skimage.filters.rank.core_cy",
+        "skimage.filters.rank.generic_cy",
+        "skimage.filters.rank.percentile_cy",
+    ),
+    "skimage.future.graph": ("skimage.future.graph._ncut_cy",),
+    "skimage.graph": (
+        "skimage.graph.heap",
+        "skimage.graph._mcp",
+        "skimage.graph._spath",
+    ),
+    "skimage.io": ("skimage.io._plugins",),
+    "skimage.io._plugins": (
+        "skimage.io._plugins._colormixer",
+        "skimage.io._plugins._histograms",
+        "skimage.io._plugins.fits_plugin",
+        "skimage.io._plugins.gdal_plugin",
+        "skimage.io._plugins.gtk_plugin",
+        "skimage.io._plugins.imageio_plugin",
+        "skimage.io._plugins.imread_plugin",
+        "skimage.io._plugins.matplotlib_plugin",
+        "skimage.io._plugins.pil_plugin",
+        "skimage.io._plugins.qt_plugin",
+        "skimage.io._plugins.simpleitk_plugin",
+        "skimage.io._plugins.skivi_plugin",
+        "skimage.io._plugins.tifffile_plugin",
+        "skimage.io._plugins.util",
+    ),
+    "skimage.measure": (
+        "skimage.measure._ccomp",
+        "skimage.measure._find_contours_cy",
+        "skimage.measure._marching_cubes_classic_cy",
+        "skimage.measure._marching_cubes_lewiner_cy",
+        "skimage.measure._moments_cy",
+        "skimage.measure._pnpoly",
+    ),
+    "skimage.morphology": (
+        "skimage.morphology._convex_hull",
+        "skimage.morphology._extrema_cy",
+        "skimage.morphology._flood_fill_cy",
+        "skimage.morphology._greyreconstruct",
+        "skimage.morphology._max_tree",
+        "skimage.morphology._skeletonize_3d_cy",
+        "skimage.morphology._skeletonize_cy",
+        "skimage.morphology._watershed",
+    ),
+    "skimage.restoration": (
+        "skimage.restoration._denoise_cy",
+        "skimage.restoration._nl_means_denoising",
+        "skimage.restoration._unwrap_1d",
+        "skimage.restoration._unwrap_2d",
+        "skimage.restoration._unwrap_3d",
+    ),
+    "skimage.segmentation": (
+        "skimage.segmentation._felzenszwalb_cy",
+        "skimage.segmentation._quickshift_cy",
+        "skimage.segmentation._slic",
+    ),
+    "skimage.transform": (
+        "skimage.transform._hough_transform",
+        "skimage.transform._radon_transform",
+        "skimage.transform._warps_cy",
+    ),
+    "skimage._shared": (
+        "skimage._shared.geometry",
+        "skimage._shared.interpolation",
+        "skimage._shared.transform",
+    ),
+    "sklearn.cluster": (
+        "sklearn.cluster._dbscan_inner",
+        "sklearn.cluster._hierarchical",
+        "sklearn.cluster._k_means",
+        "sklearn.cluster._k_means_elkan",
+    ),
+    "sklearn.datasets": ("sklearn.datasets._svmlight_format",),
+    "sklearn.decomposition": (
+        "sklearn.decomposition.cdnmf_fast",
+        "sklearn.decomposition._online_lda",
+    ),
+    "sklearn.ensemble": ("sklearn.ensemble._gradient_boosting",),
+    "sklearn.externals": ("sklearn.externals.joblib",),
+    "sklearn.externals.joblib": ("sklearn.externals.joblib.numpy_pickle",),
+    "sklearn.ensemble._hist_gradient_boosting": (
+        "sklearn.ensemble._hist_gradient_boosting.histogram",
+        "sklearn.ensemble._hist_gradient_boosting.splitting",
+        "sklearn.ensemble._hist_gradient_boosting.types",
+        "sklearn.ensemble._hist_gradient_boosting.utils",
+        "sklearn.ensemble._hist_gradient_boosting._binning",
+        "sklearn.ensemble._hist_gradient_boosting._gradient_boosting",
+        "sklearn.ensemble._hist_gradient_boosting._loss",
+        "sklearn.ensemble._hist_gradient_boosting._predictor",
+    ),
+    "sklearn.feature_extraction": ("sklearn.feature_extraction._hashing",),
+    "sklearn.linear_model": (
+        "sklearn.linear_model.cd_fast",
+        "sklearn.linear_model.sag_fast",
+        "sklearn.linear_model.sgd_fast",
+    ),
+    "sklearn.manifold": (
+        "sklearn.manifold._barnes_hut_tsne",
+        "sklearn.manifold._utils",
+    ),
+    "sklearn.metrics": ("sklearn.metrics.pairwise_fast",),
+    "sklearn.metrics.cluster": ("sklearn.metrics.cluster.expected_mutual_info_fast",),
+    "sklearn.neighbors": (
+        "sklearn.neighbors.ball_tree",
+        "sklearn.neighbors.dist_metrics",
+        "sklearn.neighbors.kd_tree",
+        "sklearn.neighbors.quad_tree",
+        "sklearn.neighbors.typedefs",
+    ),
+    "sklearn.preprocessing": ("sklearn.preprocessing._csr_polynomial_expansion",),
+    "sklearn.svm": (
+        "sklearn.svm.liblinear",
+        "sklearn.svm.libsvm",
+        "sklearn.svm.libsvm_sparse",
+    ),
+    "sklearn.tree": (
+        "sklearn.tree._criterion",
+        "sklearn.tree._splitter",
+        "sklearn.tree._tree",
+        "sklearn.tree._utils",
+    ),
+    "sklearn.utils": (
+        "sklearn.utils.arrayfuncs",
+        "sklearn.utils.fast_dict",
+        "sklearn.utils.graph_shortest_path",
+        "sklearn.utils.lgamma",
+        "sklearn.utils.murmurhash",
+        "sklearn.utils.seq_dataset",
+        "sklearn.utils.sparsefuncs_fast",
+        "sklearn.utils.weight_vector",
+        "sklearn.utils._cython_blas",
+        "sklearn.utils._logistic_sigmoid",
+        "sklearn.utils._random",
+    ),
+    "sklearn.utils.sparsetools": (
+        "sklearn.utils.sparsetools._graph_validation",
+        "sklearn.utils.sparsetools._graph_tools",
+    ),
+    "PIL._imagingtk": ("PIL._tkinter_finder",),
+    "pkg_resources._vendor.packaging": (
+        "pkg_resources._vendor.packaging.version",
+        "pkg_resources._vendor.packaging.specifiers",
+        "pkg_resources._vendor.packaging.requirements",
+    ),
+    "urllib3": (
+        "urllib3",
+        "urllib3._collections",
+        "urllib3.connection",
+        "urllib3.connection.appengine",
+        "urllib3.connectionpool",
+        "urllib3.contrib",
+        "urllib3.contrib.appengine",
+        "urllib3.exceptions",
+        "urllib3.fields",
+        "urllib3.filepost",
+        "urllib3.packages",
+        "urllib3.packages.six",
+        "urllib3.packages.ssl_match_hostname",
+        "urllib3.poolmanager",
+        "urllib3.request",
+        "urllib3.response",
+        "urllib3.util",
+        "urllib3.util.connection",
+        "urllib3.util.queue",
+        "urllib3.util.request",
+        "urllib3.util.response",
+        "urllib3.util.retry",
+        "urllib3.util.ssl_",
+        "urllib3.util.timeout",
+        "urllib3.util.url",
+        "urllib3.util.wait",
+        "urllib.error",
+        "urllib.parse",
+        "urllib.request",
+        "urllib.response",
+    ),
+    "requests.packages": (
+        "urllib3",
+        "urllib3._collections",
+        "urllib3.connection",
+        "urllib3.connection.appengine",
+        "urllib3.connectionpool",
+        "urllib3.contrib",
+        "urllib3.contrib.appengine",
+        "urllib3.exceptions",
+        "urllib3.fields",
+        "urllib3.filepost",
+        "urllib3.packages",
+        "urllib3.packages.six",
+        "urllib3.packages.ssl_match_hostname",
+        "urllib3.poolmanager",
+        "urllib3.request",
+        "urllib3.response",
+        "urllib3.util",
+        "urllib3.util.connection",
+        "urllib3.util.queue",
+        "urllib3.util.request",
+        "urllib3.util.response",
+        "urllib3.util.retry",
+        "urllib3.util.ssl_",
+        "urllib3.util.timeout",
+        "urllib3.util.url",
+        "urllib3.util.wait",
+        "urllib.error",
+        "urllib.parse",
+        "urllib.request",
+        "urllib.response",
+    ),
+    "requests_toolbelt._compat": (
+        "urllib3",
+        "urllib3._collections",
+        "urllib3.connection",
+        "urllib3.connection.appengine",
+        "urllib3.connectionpool",
+        "urllib3.contrib",
+        "urllib3.contrib.appengine",
+        "urllib3.exceptions",
+        "urllib3.fields",
+        "urllib3.filepost",
+        "urllib3.packages",
+        "urllib3.packages.six",
+        "urllib3.packages.ssl_match_hostname",
+        "urllib3.poolmanager",
+        "urllib3.request",
+        "urllib3.response",
+        "urllib3.util",
+        "urllib3.util.connection",
+        "urllib3.util.queue",
+        "urllib3.util.request",
+        "urllib3.util.response",
+        "urllib3.util.retry",
+        "urllib3.util.ssl_",
+        "urllib3.util.timeout",
+        "urllib3.util.url",
+        "urllib3.util.wait",
+        "urllib.error",
+        "urllib.parse",
+        "urllib.request",
+        "urllib.response",
+    ),
+    "uvloop.loop": ("uvloop._noop",),
+    "fitz.fitz": ("fitz._fitz",),
+    "pandas._libs": (
+        "pandas._libs.tslibs.np_datetime",
+        "pandas._libs.tslibs.nattype",
+        "pandas._libs.tslibs.base",
+    ),
+    "pandas.core.window": ("pandas._libs.skiplist",),
+    "zmq.backend": ("zmq.backend.cython",),
+    "flask.app": ("jinja2.ext", "jinja2.ext.autoescape", "jinja2.ext.with_"),
+    "pycparser.c_parser": ("pycparser.yacctab", "pycparser.lextab"),
+    "passlib.hash": ("passlib.handlers.sha2_crypt",),
+    "pyglet": (
+        "pyglet.app",
+        "pyglet.canvas",
+        "pyglet.clock",
+        "pyglet.com",
+        "pyglet.event",
+        "pyglet.font",
+        "pyglet.gl",
+        "pyglet.graphics",
+        "pyglet.input",
+        "pyglet.image",
+        "pyglet.lib",
+        "pyglet.media",
+        "pyglet.model",
+        "pyglet.resource",
+        "pyglet.sprite",
+        "pyglet.shapes",
+        "pyglet.text",
+        "pyglet.window",
+    ),
+}
+
+# Additional entries that only apply to Python2.
+implicit_imports_python2 = {
+    "sip": ("enum",),
+}
+
+# Additional entries that only apply to Windows.
+implicit_imports_windows = {
+    "gevent": ("gevent.libuv",),
+}
+
+# Additional entries that only apply to non-Windows platforms.
+implicit_imports_non_windows = {
+    "gevent": ("gevent.libev",),
+    "tensorflow.include.external.protobuf_archive.python.google.protobuf.internal": (
+        "tensorflow.include.external.protobuf_archive.python.google.protobuf.internal._api_implementation",
+    ),
+    "tensorflow.include.external.protobuf_archive.python.google.protobuf.pyext": (
+        "tensorflow.include.external.protobuf_archive.python.google.protobuf.pyext._message",
+    ),
+    "tensorflow.python.framework": ("tensorflow.python.framework.fast_tensor_util",),
+    "tensorflow.compiler.tf2tensorrt": (
+        "tensorflow.compiler.tf2tensorrt._wrap_py_utils",
+    ),
+    "tensorflow.compiler.tf2tensorrt.python.ops": (
+        "tensorflow.compiler.tf2tensorrt.python.ops.libtftrt",
+    ),
+    "tensorflow.compiler.tf2xla.ops": ("tensorflow.compiler.tf2xla.ops._xla_ops",),
+    "tensorflow.contrib.tensor_forest": (
+        "tensorflow.contrib.tensor_forest.libforestprotos",
+    ),
+    "tensorflow.contrib.tensor_forest.python.ops": (
+        "tensorflow.contrib.tensor_forest.python.ops._model_ops",
+        "tensorflow.contrib.tensor_forest.python.ops._stats_ops",
+        "tensorflow.contrib.tensor_forest.python.ops._tensor_forest_ops",
+    ),
+    "tensorflow.contrib.tensor_forest.hybrid.python.ops": (
+        "tensorflow.contrib.tensor_forest.hybrid.python.ops._training.ops",
+    ),
+    "tensorflow.contrib.resampler.python.ops": (
+        "tensorflow.contrib.resampler.python.ops._resampler_ops",
+    ),
+    "tensorflow.contrib.nearest_neighbor.python.ops": (
+        "tensorflow.contrib.nearest_neighbor.python.ops._nearest_neighbor_ops",
+    ),
+    "tensorflow.contrib.ignite": ("tensorflow.contrib.ignite._ignite_ops",),
+    "tensorflow.contrib.kinesis": ("tensorflow.contrib.kinesis._dataset_ops",),
+    "tensorflow.contrib.ffmpeg": ("tensorflow.contrib.ffmpeg.ffmpeg",),
+    "tensorflow.contrib.framework.python.ops": (
+        "tensorflow.contrib.framework.python.ops._variable_ops",
+    ),
+    "tensorflow.contrib.text.python.ops": (
+        "tensorflow.contrib.text.python.ops._skip_gram_ops",
+    ),
+    "tensorflow.contrib.reduce_slice_ops.python.ops": (
+        "tensorflow.contrib.reduce_slice_ops.python.ops._reduce_slice_ops",
+    ),
+    "tensorflow.contrib.periodic_resample.python.ops": (
+        "tensorflow.contrib.periodic_resample.python.ops._periodic_resample_op",
+    ),
+    "tensorflow.contrib.memory_stats.python.ops": (
+        "tensorflow.contrib.memory_stats.python.ops._memory_stats_ops",
+    ),
+    "tensorflow.contrib.libsvm.python.ops": (
+        "tensorflow.contrib.libsvm.python.ops._libsvm_ops",
+    ),
+    "tensorflow.contrib.fused_conv.python.ops": (
+        "tensorflow.contrib.fused_conv.python.ops._fused_conv2d_bias_activation_op",
+    ),
+    "tensorflow.contrib.kafka": ("tensorflow.contrib.kafka._dataset_ops",),
+    "tensorflow.contrib.hadoop": ("tensorflow.contrib.hadoop._dataset_ops",),
+    "tensorflow.contrib.seq2seq.python.ops": (
+        "tensorflow.contrib.seq2seq.python.ops._beam_search_ops",
+    ),
+    "tensorflow.contrib.rpc.python.kernel_tests": (
+        "tensorflow.contrib.rpc.python.kernel_tests.libtestexample",
+    ),
+    "tensorflow.contrib.boosted_trees.python.ops": (
+        "tensorflow.contrib.boosted_trees.python.ops._boosted_trees_ops",
+    ),
+    "tensorflow.contrib.layers.python.ops": (
+        "tensorflow.contrib.layers.python.ops._sparse_feature_cross_op",
+    ),
+    "tensorflow.contrib.image.python.ops": (
+        "tensorflow.contrib.image.python.ops._distort_image_ops",
+        "tensorflow.contrib.image.python.ops._image_ops",
+        "tensorflow.contrib.image.python.ops._single_image_random_dot_stereograms",
+    ),
+    "tensorflow.contrib.factorization.python.ops": (
+        "tensorflow.contrib.factorization.python.ops._factorization_ops",
+    ),
+    "tensorflow.contrib.input_pipeline.python.ops": (
+        "tensorflow.contrib.input_pipeline.python.ops._input_pipeline_ops",
+    ),
+    "tensorflow.contrib.rnn.python.ops": (
+        "tensorflow.contrib.rnn.python.ops._gru_ops",
+        "tensorflow.contrib.rnn.python.ops._lstm_ops",
+    ),
+    "tensorflow.contrib.bigtable.python.ops": (
+        "tensorflow.contrib.bigtable.python.ops._bigtable",
+    ),
+}
+
+# Entries that apply to the given package and everything below it.
+implicit_imports_namespaces = {
+    "matplotlib.backends.backend_wx": (
+        "matplotlib.backends.backend_wx",
+        "matplotlib.backends.backend_wxagg",
+        "wx",
+    ),
+    "matplotlib.backends.backend_wxagg": (
+        "matplotlib.backends.backend_wx",
+        "matplotlib.backends.backend_wxagg",
+        "wx",
+    ),
+    "matplotlib.backends.backend_gtk3": (
+        "matplotlib.backends.backend_gtk3",
+        "matplotlib.backends.backend_gtk3agg",
+        "gi",
+    ),
+    "matplotlib.backends.backend_gtk3agg": (
+        "matplotlib.backends.backend_gtk3",
+        "matplotlib.backends.backend_gtk3agg",
+        "gi",
+    ),
+    "matplotlib.backends.backend_webagg": (
+        "matplotlib.backends.backend_webagg",
+        "matplotlib.backends.backend_webagg_core",
+        "tornado",
+    ),
+    "matplotlib.backends.backend_webagg_core": (
+        "matplotlib.backends.backend_webagg",
+        "matplotlib.backends.backend_webagg_core",
+        "tornado",
+    ),
+    "matplotlib.backends.backend_qt4agg": (
+        "matplotlib.backends.backend_qt4agg",
+        "matplotlib.backends.backend_qt4",
+        "PyQt4",
+    ),
+    "matplotlib.backends.backend_qt4": (
+        "matplotlib.backends.backend_qt4agg",
+        "matplotlib.backends.backend_qt4",
+        "PyQt4",
+    ),
+    "matplotlib.backends.backend_qt5agg": (
+        "matplotlib.backends.backend_qt5agg",
+        "matplotlib.backends.backend_qt5",
+        "PyQt5",
+    ),
+    "matplotlib.backends.backend_qt5": (
+        "matplotlib.backends.backend_qt5agg",
+        "matplotlib.backends.backend_qt5",
+        "PyQt5",
+    ),
+}
+
+# Entries for both 'Crypto' (pycryptodome) and 'Cryptodome' (pycryptodomex),
+# relative to the top level package name.
+implicit_imports_crypto = {
+    ".Util._raw_api": (
+        ".Cipher._raw_aes",
+        ".Cipher._raw_aesni",
+        ".Cipher._raw_arc2",
+        ".Cipher._raw_blowfish",
+        ".Cipher._raw_cast",
+        ".Cipher._raw_cbc",
+        ".Cipher._raw_cfb",
+        ".Cipher._raw_ctr",
+        ".Cipher._raw_des",
+        ".Cipher._raw_des3",
+        ".Cipher._raw_ecb",
+        ".Cipher._raw_ocb",
+        ".Cipher._raw_ofb",
+    ),
+    ".Util.strxor": (".Util._strxor",),
+    ".Util._cpu_features": (".Util._cpuid_c",),
+    ".Hash.BLAKE2s": (".Hash._BLAKE2s",),
+    ".Hash.SHA1": (".Hash._SHA1",),
+    ".Hash.SHA224": (".Hash._SHA224",),
+    ".Hash.SHA256": (".Hash._SHA256",),
+    ".Hash.SHA384": (".Hash._SHA384",),
+    ".Hash.SHA512": (".Hash._SHA512",),
+    ".Hash.MD5": (".Hash._MD5",),
+    ".Protocol.KDF": (".Cipher._Salsa20", ".Protocol._scrypt"),
+    ".Cipher._mode_gcm": (".Hash._ghash_portable",),
+    ".Cipher.ChaCha20": (".Cipher._chacha20",),
+}
@@ -421,6 +421,8 @@ class NumpyPluginDetector(NuitkaPluginBase):
 
     detector_for = NumpyPlugin
 
+    module_prefixes = ("numpy", "scipy", "skimage", "pandas", "matplotlib", "sklearn")
+
     @classmethod
     def isRelevant(cls):
         """Check whether plugin might be required.
@@ -30,6 +30,8 @@ class NuitkaPluginPbrWorkarounds(NuitkaPluginBase):
 
     plugin_name = "pbr-compat"
 
+    module_prefixes = ("pbr",)
+
     @classmethod
     def isRelevant(cls):
         return Options.isStandaloneMode()
@@ -236,6 +236,8 @@ def installedversions(alpha = 0):
 class NuitkaPluginDetectorPmw(NuitkaPluginBase):
     detector_for = NuitkaPluginPmw
 
+    module_prefixes = ("Pmw",)
+
     @classmethod
     def isRelevant(cls):
         return Options.isStandaloneMode()
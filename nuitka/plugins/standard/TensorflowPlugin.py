@@ -112,6 +112,8 @@ class TensorflowPluginDetector(NuitkaPluginBase):
 
     detector_for = TensorflowPlugin
 
+    module_prefixes = ("tensorflow",)
+
     @classmethod
     def isRelevant(cls):
         """This method is called one time only to check, whether the plugin might make sense at all.
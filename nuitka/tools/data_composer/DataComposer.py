@@ -32,7 +32,10 @@ from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
     unicode,
     xrange,
 )
-from nuitka.build.DataComposerInterface import deriveModuleConstantsBlobName
+from nuitka.build.DataComposerInterface import (
+    deriveModuleConstantsBlobName,
+    readStartupImports,
+)
 from nuitka.Builtins import builtin_exception_values_list, builtin_named_values
 from nuitka.constants.Serialization import (
     BlobData,
@@ -57,6 +60,28 @@ def scanConstFiles(build_dir):
     return result
 
 
+def orderConstFilesForStartup(const_files, startup_imports):
+    """Order the constant files, so the ones needed at startup come first.
+
+    The blobs are searched for by name from the start when loaded, so the
+    global and bytecode ones are put first, then the ones of the modules
+    imported during startup, in the order they are imported.
+    """
+
+    order = {"": -2, ".bytecode": -1}
+
+    for count, module_name in enumerate(startup_imports):
+        order[module_name] = count
+
+    # Sorting is stable, the other modules keep their order.
+    return sorted(
+        const_files,
+        key=lambda const_file: order.get(
+            deriveModuleConstantsBlobName(const_file[1]), len(startup_imports)
+        ),
+    )
+
+
 sizeof_clong = ctypes.sizeof(ctypes.c_long)
 
 max_signed_long = 2 ** (sizeof_clong * 7) - 1
@@ -326,6 +351,14 @@ def main():
 
     const_files = scanConstFiles(build_dir)
 
+    startup_imports_filename = os.environ.get("NUITKA_DATACOMPOSER_STARTUP_IMPORTS")
+
+    if startup_imports_filename:
+        const_files = orderConstFilesForStartup(
+            const_files=const_files,
+            startup_imports=readStartupImports(startup_imports_filename),
+        )
+
     total = 0
 
     desc = []
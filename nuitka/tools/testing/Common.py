@@ -45,6 +45,7 @@ from nuitka.utils.FileOperations import (
     removeDirectory,
 )
 
+from .Scheduling import TestScheduler
 from .SearchModes import (
     SearchModeAll,
     SearchModeByPattern,
@@ -390,6 +391,38 @@ def compareWithCPython(
 
     command += search_mode.getExtraFlags(dirname, filename)
 
+    def onComparisonResult(result):
+        if (
+            result != 0
+            and result != 2
+            and search_mode.abortOnFinding(dirname, filename)
+        ):
+            if on_error is not None:
+                on_error(dirname, filename)
+
+            search_mode.onErrorDetected("Error exit! %s" % result)
+
+        if converted:
+            os.unlink(path)
+
+        if result == 2:
+            sys.stderr.write("Interrupted, with CTRL-C\n")
+            sys.exit(2)
+
+    scheduler = search_mode.getScheduler()
+
+    # With a scheduler, the test case is executed later, concurrently with
+    # others.
+    if scheduler is not None:
+        scheduler.addJob(
+            key=_getTestCaseKey(dirname, filename),
+            command=command,
+            output_name=os.path.join(os.getcwd(), os.path.basename(path)),
+            on_finish=onComparisonResult,
+        )
+
+        return
+
     # Cleanup before and after test stage directory.
     _removeCPythonTestSuiteDir()
 
@@ -401,18 +434,24 @@ def compareWithCPython(
     # Cleanup before and after test stage directory.
     _removeCPythonTestSuiteDir()
 
-    if result != 0 and result != 2 and search_mode.abortOnFinding(dirname, filename):
-        if on_error is not None:
-            on_error(dirname, filename)
+    onComparisonResult(result)
 
-        search_mode.onErrorDetected("Error exit! %s" % result)
 
-    if converted:
-        os.unlink(path)
+def _getTestCaseKey(dirname, filename):
+    # Test cases of the same name exist in different test directories, and
+    # extra options change how long they take.
+    parts = [
+        _python_version_str,
+        os.environ.get("NUITKA_TEST_SUITE", ""),
+        os.getcwd(),
+        os.environ.get("NUITKA_EXTRA_OPTIONS", ""),
+    ]
+
+    if dirname is not None:
+        parts.append(dirname)
+    parts.append(filename)
 
-    if result == 2:
-        sys.stderr.write("Interrupted, with CTRL-C\n")
-        sys.exit(2)
+    return ":".join(parts)
 
 
 def checkCompilesNotWithCPython(dirname, filename, search_mode):
@@ -981,8 +1020,19 @@ def checkReferenceCount(checked_function, max_rounds=20, explain=False):
     return result
 
 
-def createSearchMode():
-    # Dealing with many options, pylint: disable=too-many-branches
+def _isCPythonTestSuite():
+    test_dir = os.path.dirname(os.path.abspath(sys.modules["__main__"].__file__))
+
+    return re.match(r"CPython\d+$", os.path.basename(test_dir)) is not None
+
+
+def createSearchMode(allow_jobs=True):
+    """Create the search mode from the command line of a test runner.
+
+    Test runners that inspect the results of a test case after comparing it,
+    cannot have it executed later, and must not allow jobs. The CPython test
+    suites never do, as their test cases share the "@test" directory.
+    """
 
     parser = OptionParser()
 
@@ -1028,6 +1078,17 @@ Defaults to off.""",
 Defaults to off.""",
     )
 
+    debug_group.add_option(
+        "--jobs",
+        action="store",
+        dest="jobs",
+        type="int",
+        default=int(os.environ.get("NUITKA_TEST_JOBS", "1")),
+        help="""Execute this many test cases concurrently, longest running first
+as recorded in previous runs. Not for the CPython test suites, they share a
+test directory. Defaults to %default.""",
+    )
+
     parser.add_option_group(debug_group)
 
     options, positional_args = parser.parse_args()
@@ -1038,6 +1099,26 @@ Defaults to off.""",
     if options.show_commands:
         os.environ["NUITKA_TRACE_COMMANDS"] = "1"
 
+    search_mode = _createSearchMode(options, positional_args)
+
+    if options.jobs > 1 and (not allow_jobs or _isCPythonTestSuite()):
+        my_print("Note: This test runner does not support '--jobs', ignoring it.")
+    elif options.jobs > 1:
+        search_mode.setScheduler(
+            TestScheduler(
+                jobs=options.jobs,
+                durations_filename=os.path.join(
+                    getTestingCacheDir(), "test_durations.json"
+                ),
+            )
+        )
+
+    return search_mode
+
+
+def _createSearchMode(options, positional_args):
+    # Dealing with many options, pylint: disable=too-many-branches
+
     # Default to searching.
     mode = positional_args[0] if positional_args else "search"
 
@@ -0,0 +1,240 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Scheduling of test case executions for test runners.
+
+Test runners normally execute their test cases one by one. With more than one
+job requested, the test cases are collected instead, and once all are known,
+they are executed concurrently, longest running first, according to the
+durations recorded in previous runs. Outputs are kept per test case, and only
+given when it finished, so they do not interleave.
+"""
+
+import json
+import os
+import subprocess
+import threading
+import time
+
+from nuitka.Tracing import my_print
+from nuitka.utils.FileOperations import getFileContents
+from nuitka.utils.Timing import StopWatch
+
+try:
+    import queue
+except ImportError:
+    # Python2 name, pylint: disable=I0021,import-error
+    import Queue as queue
+
+
+class TestJob(object):
+    __slots__ = (
+        "key",
+        "command",
+        "output_name",
+        "environment",
+        "cwd",
+        "on_finish",
+        "result",
+        "output",
+        "duration",
+    )
+
+    def __init__(self, key, command, output_name, on_finish):
+        self.key = key
+        self.command = command
+        self.output_name = output_name
+        self.on_finish = on_finish
+
+        # Test runners change these per test case, and the job runs later, so
+        # they are captured now.
+        self.environment = dict(os.environ)
+        self.cwd = os.getcwd()
+
+        self.result = None
+        self.output = None
+        self.duration = None
+
+
+class TestScheduler(object):
+    """Execute test commands concurrently with a given number of workers.
+
+    The "on_finish" callbacks of jobs are called in the thread that executes
+    "runJobs", in order of completion, and may abort the run by raising an
+    exception, e.g. through "sys.exit", which terminates running jobs.
+
+    Jobs with the same output name, e.g. test cases with the same main program
+    name in one directory, would overwrite each others build results, and are
+    not executed at the same time.
+    """
+
+    def __init__(self, jobs, durations_filename):
+        self.jobs = jobs
+        self.durations_filename = durations_filename
+
+        self.pending = []
+        self.waiting = []
+        self.processes = {}
+        self.processes_lock = threading.Lock()
+        self.running_output_names = set()
+        self.aborted = False
+
+        if os.path.exists(durations_filename):
+            try:
+                self.durations = json.loads(getFileContents(durations_filename))
+            except ValueError:
+                self.durations = {}
+        else:
+            self.durations = {}
+
+    def addJob(self, key, command, output_name, on_finish):
+        self.pending.append(
+            TestJob(
+                key=key, command=command, output_name=output_name, on_finish=on_finish
+            )
+        )
+
+    def _getSortKey(self, job):
+        # Unknown durations first, to learn about them, then longest first.
+        duration = self.durations.get(job.key)
+
+        if duration is None:
+            return (0, 0)
+        else:
+            return (1, -duration)
+
+    def _runJob(self, job):
+        stop_watch = StopWatch()
+        stop_watch.start()
+
+        process = subprocess.Popen(
+            args=job.command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=job.environment,
+            cwd=job.cwd,
+        )
+
+        with self.processes_lock:
+            self.processes[job] = process
+
+        job.output, _stderr = process.communicate()
+        job.result = process.returncode
+
+        with self.processes_lock:
+            del self.processes[job]
+
+        stop_watch.stop()
+        job.duration = stop_watch.getDelta()
+
+    def _getNextJob(self):
+        """Take the first waiting job that does not conflict with running ones.
+
+        Returns None if no jobs are waiting anymore, and False if all waiting
+        ones conflict.
+        """
+
+        with self.processes_lock:
+            if not self.waiting:
+                return None
+
+            for count, job in enumerate(self.waiting):
+                if job.output_name not in self.running_output_names:
+                    del self.waiting[count]
+                    self.running_output_names.add(job.output_name)
+
+                    return job
+
+            return False
+
+    def _worker(self, done_queue):
+        while not self.aborted:
+            job = self._getNextJob()
+
+            if job is None:
+                break
+
+            if job is False:
+                time.sleep(0.1)
+                continue
+
+            try:
+                self._runJob(job)
+            # Any problem must be reported to the main thread, which is
+            # otherwise waiting forever, pylint: disable=broad-except
+            except Exception as e:
+                job.result = 1
+                job.output = str(e).encode("utf8")
+
+            with self.processes_lock:
+                self.running_output_names.discard(job.output_name)
+
+            done_queue.put(job)
+
+    def _terminateProcesses(self):
+        with self.processes_lock:
+            for process in self.processes.values():
+                try:
+                    process.terminate()
+                except OSError:
+                    pass
+
+    def _saveDurations(self):
+        with open(self.durations_filename, "w") as durations_file:
+            json.dump(self.durations, durations_file, indent=1, sort_keys=True)
+
+    def runJobs(self):
+        jobs = sorted(self.pending, key=self._getSortKey)
+        self.pending = []
+        self.aborted = False
+
+        self.waiting = list(jobs)
+        self.running_output_names = set()
+
+        done_queue = queue.Queue()
+
+        workers = []
+        for _i in range(min(self.jobs, len(jobs))):
+            worker = threading.Thread(target=self._worker, args=(done_queue,))
+            worker.daemon = True
+            worker.start()
+
+            workers.append(worker)
+
+        try:
+            for _i in range(len(jobs)):
+                # Waiting with a timeout, allows for "KeyboardInterrupt" to
+                # be received.
+                while True:
+                    try:
+                        job = done_queue.get(timeout=1)
+                        break
+                    except queue.Empty:
+                        pass
+
+                if job.output:
+                    my_print(job.output.decode("utf8", "replace"), end="")
+
+                if job.duration is not None:
+                    self.durations[job.key] = job.duration
+
+                job.on_finish(job.result)
+        finally:
+            self.aborted = True
+            self._terminateProcesses()
+
+            self._saveDurations()
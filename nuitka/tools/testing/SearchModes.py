@@ -32,11 +32,26 @@ class SearchModeBase(object):
     def __init__(self):
         self.may_fail = []
 
+        self.scheduler = None
+
     def consider(self, dirname, filename):
         # Virtual method, pylint: disable=no-self-use,unused-argument
         return True
 
+    def setScheduler(self, scheduler):
+        self.scheduler = scheduler
+
+    def getScheduler(self):
+        return self.scheduler
+
     def finish(self):
+        # Scheduled test cases are only executed now that all are known.
+        if self.scheduler is not None:
+            self.scheduler.runJobs()
+
+        self.onFinish()
+
+    def onFinish(self):
         pass
 
     def abortOnFinding(self, dirname, filename):
@@ -112,7 +127,7 @@ class SearchModeByPattern(SearchModeBase):
         self.active = self._match(dirname, filename, self.start_at)
         return self.active
 
-    def finish(self):
+    def onFinish(self):
         if not self.active:
             sys.exit("Error, became never active.")
 
@@ -165,7 +180,7 @@ class SearchModeResume(SearchModeBase):
 
         return self.active
 
-    def finish(self):
+    def onFinish(self):
         os.unlink(self.cache_filename)
         if not self.active:
             sys.exit("Error, became never active, restarting next time.")
@@ -197,5 +212,5 @@ class SearchModeAll(SearchModeBase):
     def onErrorDetected(self, message):
         self.updateTotalErrors()
 
-    def finish(self):
+    def onFinish(self):
         self.exit("Total " + str(self.total_errors) + " error(s) found.")
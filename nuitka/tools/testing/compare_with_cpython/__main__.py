@@ -121,14 +121,20 @@ def getCPythonResults(cpython_cmd, cpython_cached, force_update):
     if cpython_cached:
         # TODO: Hashing stuff and creating cache filename is duplicate code
         # and should be shared.
-        hash_input = " -- ".join(cpython_cmd)
+
+        # Files are keyed by their contents, not their location, which may
+        # be a random temporary directory, e.g. for 2to3 converted tests.
+        hash_input = " -- ".join(
+            os.path.basename(element) if os.path.isfile(element) else element
+            for element in cpython_cmd
+        )
         if str is not bytes:
             hash_input = hash_input.encode("utf8")
 
         command_hash = hashlib.md5(hash_input)
 
         for element in cpython_cmd:
-            if os.path.exists(element):
+            if os.path.isfile(element):
                 with open(element, "rb") as element_file:
                     command_hash.update(element_file.read())
 
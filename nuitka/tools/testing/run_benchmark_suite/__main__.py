@@ -0,0 +1,454 @@
+#!/usr/bin/python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Run the construct and program benchmarks as a suite.
+
+This measures all constructs and a few benchmark programs with Valgrind tick
+counts, in parallel, and records the results per Nuitka commit in a local
+SQLite database, so they can be compared against a baseline commit to detect
+regressions and improvements before a release.
+
+"""
+
+from __future__ import print_function
+
+import fnmatch
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
+from optparse import OptionParser
+
+from nuitka.tools.testing.Common import (
+    convertUsing2to3,
+    decideFilenameVersionSkip,
+    decideNeeds2to3,
+    getPythonVersionString,
+    my_print,
+    setup,
+)
+from nuitka.tools.testing.Valgrind import runValgrind
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.Execution import check_output
+from nuitka.utils.FileOperations import removeDirectory
+from nuitka.utils.Utils import getCoreCount
+
+# Programs measured in addition to the constructs, by Python major version.
+benchmark_programs = {
+    2: ("pystone.py", "mandelbrot.py", "binary-trees.py"),
+    3: ("pystone3.py", "mandelbrot.py", "binary-trees.py"),
+}
+
+
+class BenchmarkCase(object):
+    __slots__ = ("name", "kind", "filename")
+
+    def __init__(self, name, kind, filename):
+        self.name = name
+        self.kind = kind
+        self.filename = filename
+
+
+def _getBenchmarkCases(benchmarks_dir, python_major, patterns):
+    result = []
+
+    constructs_dir = os.path.join(benchmarks_dir, "constructs")
+
+    for filename in sorted(os.listdir(constructs_dir)):
+        if not filename.endswith(".py") or not decideFilenameVersionSkip(filename):
+            continue
+
+        result.append(
+            BenchmarkCase(
+                name="constructs/" + filename[:-3],
+                kind="construct",
+                filename=os.path.join(constructs_dir, filename),
+            )
+        )
+
+    for filename in benchmark_programs[python_major]:
+        result.append(
+            BenchmarkCase(
+                name=filename[:-3],
+                kind="program",
+                filename=os.path.join(benchmarks_dir, filename),
+            )
+        )
+
+    if patterns:
+        result = [
+            case
+            for case in result
+            if any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns)
+        ]
+
+    return result
+
+
+def _parseMeasureOutput(output):
+    values = {}
+
+    for line in output.splitlines():
+        if b"=" in line:
+            key, value = line.split(b"=", 1)
+            values[key.strip().decode("ascii")] = value.strip()
+
+    return values
+
+
+def _measureConstruct(case, nuitka_dir, with_cpython):
+    output = check_output(
+        [
+            sys.executable,
+            os.path.join(nuitka_dir, "bin", "measure-construct-performance"),
+            "--nuitka=%s" % os.path.join(nuitka_dir, "bin", "nuitka"),
+            "--cpython=%s" % (os.environ["PYTHON"] if with_cpython else "no"),
+            case.filename,
+        ],
+        stderr=subprocess.STDOUT,
+    )
+
+    values = _parseMeasureOutput(output)
+
+    return (
+        int(values["NUITKA_CONSTRUCT"]),
+        int(values["CPYTHON_CONSTRUCT"]) if with_cpython else None,
+    )
+
+
+def _measureProgram(case, nuitka_dir, with_cpython):
+    temp_dir = tempfile.mkdtemp(prefix=os.path.basename(case.filename) + "-")
+
+    filename = case.filename
+    converted = False
+
+    try:
+        if decideNeeds2to3(filename) and not filename.endswith("3.py"):
+            filename, converted = convertUsing2to3(filename)
+
+        subprocess.check_call(
+            [
+                os.environ["PYTHON"],
+                os.path.join(nuitka_dir, "bin", "nuitka"),
+                "--quiet",
+                "--python-flag=-S",
+                "--remove-output",
+                "--output-dir=%s" % temp_dir,
+                filename,
+            ]
+        )
+
+        binary_filename = os.path.join(
+            temp_dir,
+            os.path.basename(filename)[:-3] + (".exe" if os.name == "nt" else ".bin"),
+        )
+
+        nuitka_ticks = runValgrind(
+            None, "callgrind", (binary_filename,), include_startup=False
+        )
+
+        if with_cpython:
+            cpython_ticks = runValgrind(
+                None,
+                "callgrind",
+                (os.environ["PYTHON"], "-S", filename),
+                include_startup=True,
+            )
+        else:
+            cpython_ticks = None
+
+        return nuitka_ticks, cpython_ticks
+    finally:
+        removeDirectory(temp_dir, ignore_errors=True)
+
+        if converted:
+            os.unlink(filename)
+
+
+def _measureCase(args):
+    case, nuitka_dir, with_cpython = args
+
+    measure = _measureConstruct if case.kind == "construct" else _measureProgram
+
+    try:
+        return case, measure(case, nuitka_dir, with_cpython), None
+    # Report all failures, but do not abort the other cases for it, Valgrind
+    # usage exits on errors, pylint: disable=broad-except
+    except (Exception, SystemExit) as e:
+        error = str(e) or repr(e)
+
+        # Failed tool runs tell what went wrong at the end of their output.
+        output = getattr(e, "output", None)
+        if output:
+            error += "\n" + output.decode("utf-8", "replace").strip()[-2000:]
+
+        return case, None, error
+
+
+def _getNuitkaCommit(nuitka_dir):
+    commit_id = check_output(["git", "rev-parse", "HEAD"], cwd=nuitka_dir).strip()
+    commit_id = commit_id.decode("ascii")
+
+    # Uncommitted changes cannot be compared meaningfully, mark them.
+    if subprocess.call(["git", "diff", "--quiet", "HEAD"], cwd=nuitka_dir) != 0:
+        commit_id += "-dirty"
+
+    return commit_id
+
+
+def _openDatabase(database_filename):
+    connection = sqlite3.connect(database_filename)
+
+    connection.execute(
+        """\
+CREATE TABLE IF NOT EXISTS results (
+    commit_id TEXT NOT NULL,
+    python_version TEXT NOT NULL,
+    benchmark TEXT NOT NULL,
+    nuitka_ticks INTEGER NOT NULL,
+    cpython_ticks INTEGER,
+    recorded REAL NOT NULL,
+    PRIMARY KEY (commit_id, python_version, benchmark)
+)"""
+    )
+
+    return connection
+
+
+def _storeResult(connection, commit_id, python_version, benchmark, ticks):
+    connection.execute(
+        "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+        (commit_id, python_version, benchmark, ticks[0], ticks[1], time.time()),
+    )
+    connection.commit()
+
+
+def _getLatestOtherCommit(connection, commit_id, python_version):
+    row = connection.execute(
+        """\
+SELECT commit_id FROM results WHERE commit_id != ? AND python_version = ?
+ORDER BY recorded DESC LIMIT 1""",
+        (commit_id, python_version),
+    ).fetchone()
+
+    return row[0] if row is not None else None
+
+
+def _getCommitResults(connection, commit_id, python_version):
+    return dict(
+        connection.execute(
+            """\
+SELECT benchmark, nuitka_ticks FROM results
+WHERE commit_id = ? AND python_version = ?""",
+            (commit_id, python_version),
+        ).fetchall()
+    )
+
+
+def _compareResults(current, baseline, threshold):
+    regressions = []
+    improvements = []
+
+    for benchmark, ticks in sorted(current.items()):
+        if benchmark not in baseline:
+            continue
+
+        baseline_ticks = baseline[benchmark]
+
+        if baseline_ticks == 0:
+            continue
+
+        change = 100.0 * (ticks - baseline_ticks) / baseline_ticks
+
+        if change > threshold:
+            regressions.append((benchmark, baseline_ticks, ticks, change))
+        elif change < -threshold:
+            improvements.append((benchmark, baseline_ticks, ticks, change))
+
+    return regressions, improvements
+
+
+def _reportChanges(title, changes):
+    my_print("%s (%d):" % (title, len(changes)))
+
+    for benchmark, baseline_ticks, ticks, change in changes:
+        my_print(
+            "  %-60s %14d -> %14d %+7.2f%%" % (benchmark, baseline_ticks, ticks, change)
+        )
+
+
+def main():
+    # Many details to handle, pylint: disable=too-many-locals
+
+    parser = OptionParser(
+        usage="%prog [options] [benchmark name patterns]",
+    )
+
+    parser.add_option(
+        "--jobs",
+        action="store",
+        dest="jobs",
+        type="int",
+        default=getCoreCount(),
+        help="""\
+Number of benchmarks to measure in parallel. Default is %default.""",
+    )
+
+    parser.add_option(
+        "--database",
+        action="store",
+        dest="database",
+        default=os.path.join(getCacheDir(), "benchmarks.sqlite"),
+        help="""\
+SQLite file to store results in, keyed by Nuitka commit and Python version.
+Default is %default.""",
+    )
+
+    parser.add_option(
+        "--baseline",
+        action="store",
+        dest="baseline",
+        default=None,
+        help="""\
+Commit to compare against. Default is the most recently recorded other
+commit for the same Python version.""",
+    )
+
+    parser.add_option(
+        "--threshold",
+        action="store",
+        dest="threshold",
+        type="float",
+        default=1.0,
+        help="""\
+Change in percent of ticks to report as regression or improvement. Default
+is %default.""",
+    )
+
+    parser.add_option(
+        "--with-cpython",
+        action="store_true",
+        dest="with_cpython",
+        default=False,
+        help="""\
+Also measure the ticks of CPython for the benchmarks. Default is %default.""",
+    )
+
+    parser.add_option(
+        "--compare-only",
+        action="store_true",
+        dest="compare_only",
+        default=False,
+        help="""\
+Do not measure, only compare recorded results of the current commit against
+the baseline. Default is %default.""",
+    )
+
+    parser.add_option(
+        "--fail-on-regression",
+        action="store_true",
+        dest="fail_on_regression",
+        default=False,
+        help="""\
+Exit with error status if a regression is detected. Default is %default.""",
+    )
+
+    options, positional_args = parser.parse_args()
+
+    setup(silent=True, go_main=False)
+
+    nuitka_dir = os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "..")
+    )
+    benchmarks_dir = os.path.join(nuitka_dir, "tests", "benchmarks")
+
+    python_version = getPythonVersionString()
+    commit_id = _getNuitkaCommit(nuitka_dir)
+
+    my_print("Benchmarking commit %s with Python %s." % (commit_id, python_version))
+
+    connection = _openDatabase(options.database)
+
+    failed = []
+
+    if not options.compare_only:
+        cases = _getBenchmarkCases(
+            benchmarks_dir=benchmarks_dir,
+            python_major=int(python_version.split(".")[0]),
+            patterns=positional_args,
+        )
+
+        # Longest running first, the programs take most time.
+        cases.sort(key=lambda case: case.kind != "program")
+
+        pool = ThreadPool(processes=max(1, options.jobs))
+
+        try:
+            for case, ticks, error in pool.imap_unordered(
+                _measureCase,
+                [(case, nuitka_dir, options.with_cpython) for case in cases],
+            ):
+                if error is not None:
+                    my_print("FAILED %s: %s" % (case.name, error))
+                    failed.append(case.name)
+                else:
+                    my_print("%-60s %14d" % (case.name, ticks[0]))
+
+                    _storeResult(
+                        connection=connection,
+                        commit_id=commit_id,
+                        python_version=python_version,
+                        benchmark=case.name,
+                        ticks=ticks,
+                    )
+        finally:
+            pool.close()
+            pool.join()
+
+    baseline_commit = options.baseline or _getLatestOtherCommit(
+        connection, commit_id, python_version
+    )
+
+    if baseline_commit is None:
+        my_print("No baseline results recorded yet, nothing to compare.")
+    else:
+        regressions, improvements = _compareResults(
+            current=_getCommitResults(connection, commit_id, python_version),
+            baseline=_getCommitResults(connection, baseline_commit, python_version),
+            threshold=options.threshold,
+        )
+
+        my_print(
+            "Comparing against %s with threshold %.2f%%."
+            % (baseline_commit, options.threshold)
+        )
+
+        _reportChanges("Regressions", regressions)
+        _reportChanges("Improvements", improvements)
+
+        if regressions and options.fail_on_regression:
+            sys.exit(1)
+
+    if failed:
+        sys.exit("Error, failed to measure: %s" % ", ".join(failed))
+
+
+if __name__ == "__main__":
+    main()
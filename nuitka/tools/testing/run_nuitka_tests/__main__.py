@@ -100,6 +100,16 @@ The plugins tests, execute these to check if Nuitka handles its own plugin
 interfaces, e.g. user plugins, etc. fine. Default is %default.""",
     )
 
+    parser.add_option(
+        "--skip-tools-tests",
+        action="store_false",
+        dest="tools_tests",
+        default=True,
+        help="""\
+The tools tests, execute these to check if the tools used by Nuitka, e.g. the
+test runners, work fine. Default is %default.""",
+    )
+
     parser.add_option(
         "--skip-optimizations-tests",
         action="store_false",
@@ -381,6 +391,17 @@ Make a coverage analysis, that does not really check. Default is %default.""",
 Allow Nuitka to download code if necessary, e.g. dependency walker on Windows. Default is %default.""",
     )
 
+    parser.add_option(
+        "--jobs",
+        action="store",
+        dest="jobs",
+        type="int",
+        default=1,
+        help="""\
+Execute this many test cases of a suite concurrently, for the basics, syntax,
+programs, packages, and plugins tests. Default is %default.""",
+    )
+
     parser.add_option(
         "--mingw64",
         action="store_true",
@@ -623,13 +644,13 @@ def main():
 
         yield flags
 
-    def executeSubTest(command, hide_output=False):
+    def executeSubTest(command, hide_output=False, allow_jobs=False):
         with TimerReport(
             message="Overall execution of %r took %%.2f seconds" % command
         ):
-            _executeSubTest(command, hide_output)
+            _executeSubTest(command, hide_output, allow_jobs)
 
-    def _executeSubTest(command, hide_output):
+    def _executeSubTest(command, hide_output, allow_jobs):
         if options.coverage and "search" in command:
             command = command.replace("search", "coverage")
 
@@ -642,11 +663,18 @@ def main():
 
         my_print("Run '%s' in '%s'." % (" ".join(parts), os.getcwd()))
 
+        env = dict(os.environ)
+
+        # Test runners pick this up as their default, only some of them
+        # support it.
+        if allow_jobs and options.jobs > 1:
+            env["NUITKA_TEST_JOBS"] = str(options.jobs)
+
         if hide_output:
             with open(os.devnull, "w") as devnull:
-                result = subprocess.call(parts, stdout=devnull)
+                result = subprocess.call(parts, stdout=devnull, env=env)
         else:
-            result = subprocess.call(parts)
+            result = subprocess.call(parts, env=env)
 
         if result != 0:
             sys.exit(result)
@@ -676,7 +704,7 @@ def main():
                 % (flags, use_python)
             )
             with withExtendedExtraOptions(*getExtraFlags(where, "basics", flags)):
-                executeSubTest("./tests/basics/run_all.py search")
+                executeSubTest("./tests/basics/run_all.py search", allow_jobs=True)
 
         if options.syntax_tests:
             my_print(
@@ -684,7 +712,7 @@ def main():
                 % (flags, use_python)
             )
             with withExtendedExtraOptions(*getExtraFlags(where, "syntax", flags)):
-                executeSubTest("./tests/syntax/run_all.py search")
+                executeSubTest("./tests/syntax/run_all.py search", allow_jobs=True)
 
         if options.program_tests:
             my_print(
@@ -692,7 +720,7 @@ def main():
                 % (flags, use_python)
             )
             with withExtendedExtraOptions(*getExtraFlags(where, "programs", flags)):
-                executeSubTest("./tests/programs/run_all.py search")
+                executeSubTest("./tests/programs/run_all.py search", allow_jobs=True)
 
         if options.package_tests:
             my_print(
@@ -700,7 +728,7 @@ def main():
                 % (flags, use_python)
             )
             with withExtendedExtraOptions(*getExtraFlags(where, "packages", flags)):
-                executeSubTest("./tests/packages/run_all.py search")
+                executeSubTest("./tests/packages/run_all.py search", allow_jobs=True)
 
         if options.plugin_tests:
             my_print(
@@ -708,7 +736,11 @@ def main():
                 % (flags, use_python)
             )
             with withExtendedExtraOptions(*getExtraFlags(where, "plugins", flags)):
-                executeSubTest("./tests/plugins/run_all.py search")
+                executeSubTest("./tests/plugins/run_all.py search", allow_jobs=True)
+
+        if options.tools_tests:
+            my_print("Running the tools tests with '%s':" % use_python)
+            executeSubTest("./tests/tools/run_all.py search")
 
         # At least one Debian Jessie, these versions won't have lxml installed, so
         # don't run them there. Also these won't be very version dependent in their
@@ -65,6 +65,7 @@ from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
 from nuitka.freezer.Standalone import detectEarlyImports
 from nuitka.importing import Importing
 from nuitka.importing.ImportCache import addImportedModule
+from nuitka.importing.ImportPrefetching import prefetchImportedModules
 from nuitka.importing.PreloadedPackages import getPthImportedPackages
 from nuitka.nodes.AssignNodes import StatementAssignmentVariableName
 from nuitka.nodes.AttributeNodes import (
@@ -121,6 +122,7 @@ from nuitka.Tracing import memory_logger, plugins_logger, unusual_logger
 from nuitka.utils import MemoryUsage
 from nuitka.utils.FileOperations import splitPath
 from nuitka.utils.ModuleNames import ModuleName
+from nuitka.utils.PerformanceReport import timePhase
 
 from . import SyntaxErrors
 from .ReformulationAssertStatements import buildAssertNode
@@ -737,6 +739,11 @@ def buildParseTree(provider, source_code, source_ref, is_module, is_main):
         line_offset=source_ref.getLineNumber() - 1,
     )
 
+    # Start reading the modules this one imports, while we are busy with
+    # building the tree of it.
+    if is_module:
+        prefetchImportedModules(module=provider, body=body)
+
     body, doc = extractDocFromBody(body)
 
     if is_module and is_main and python_version >= 0x360:
@@ -1098,20 +1105,21 @@ def buildModuleTree(filename, package, is_top, is_main):
     # If there is source code associated (not the case for namespace packages of
     # Python3.3 or higher, then read it.
     if source_filename is not None:
-        source_code = readSourceCodeFromFilename(
-            module_name=module.getFullName(), source_filename=source_filename
-        )
+        with timePhase("Tree building", module_name=module.getFullName()):
+            source_code = readSourceCodeFromFilename(
+                module_name=module.getFullName(), source_filename=source_filename
+            )
 
-        if is_main:
-            checkPythonVersionFromCode(source_code)
+            if is_main:
+                checkPythonVersionFromCode(source_code)
 
-        # Read source code.
-        createModuleTree(
-            module=module,
-            source_ref=source_ref,
-            source_code=source_code,
-            is_main=is_main,
-        )
+            # Read source code.
+            createModuleTree(
+                module=module,
+                source_ref=source_ref,
+                source_code=source_code,
+                is_main=is_main,
+            )
 
     # Main modules do not get added to the import cache, but plugins get to see it.
     if module.isMainModule():
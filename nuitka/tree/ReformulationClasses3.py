@@ -39,6 +39,8 @@ from nuitka.nodes.BuiltinTypeNodes import ExpressionBuiltinTuple
 from nuitka.nodes.CallNodes import makeExpressionCall
 from nuitka.nodes.ClassNodes import (
     ExpressionClassBody,
+    ExpressionClassCreation,
+    ExpressionClassNamespacePrepare,
     ExpressionSelectMetaclass,
 )
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
@@ -140,15 +142,37 @@ def buildClassNode3(provider, node, source_ref):
     # according to developer manual.
     class_statement_nodes, class_doc = extractDocFromBody(node)
 
+    # Without keywords, there is no class declaration dictionary, and the
+    # metaclass can only come from the bases, and without these, it is "type".
+    # Such classes are by far the most common, and get the namespace prepared
+    # and are created by dedicated nodes.
+    is_simple_class = not node.keywords
+
     # We need a scope for the temporary variables, and they might be closured.
     temp_scope = provider.allocateTempScope(name="class_creation")
 
-    tmp_class_decl_dict = provider.allocateTempVariable(
-        temp_scope=temp_scope, name="class_decl_dict"
-    )
-    tmp_metaclass = provider.allocateTempVariable(
-        temp_scope=temp_scope, name="metaclass"
-    )
+    if not is_simple_class:
+        tmp_class_decl_dict = provider.allocateTempVariable(
+            temp_scope=temp_scope, name="class_decl_dict"
+        )
+
+    if node.bases or not is_simple_class:
+        tmp_metaclass = provider.allocateTempVariable(
+            temp_scope=temp_scope, name="metaclass"
+        )
+
+        def makeMetaclassRef():
+            return ExpressionTempVariableRef(
+                variable=tmp_metaclass, source_ref=source_ref
+            )
+
+    else:
+
+        def makeMetaclassRef():
+            return makeExpressionBuiltinTypeRef(
+                builtin_name="type", source_ref=source_ref
+            )
+
     tmp_prepared = provider.allocateTempVariable(temp_scope=temp_scope, name="prepared")
 
     class_creation_function = ExpressionClassBody(
@@ -310,33 +334,42 @@ def buildClassNode3(provider, node, source_ref):
             )
         )
 
-    statements += (
-        StatementAssignmentVariable(
-            variable=class_variable,
-            source=makeExpressionCall(
-                called=ExpressionTempVariableRef(
-                    variable=tmp_metaclass, source_ref=source_ref
-                ),
-                args=makeExpressionMakeTuple(
-                    elements=(
-                        makeConstantRefNode(
-                            constant=node.name,
-                            source_ref=source_ref,
-                            user_provided=True,
-                        ),
-                        makeBasesRef(),
-                        ExpressionBuiltinLocalsRef(
-                            locals_scope=locals_scope, source_ref=source_ref
-                        ),
+    if is_simple_class:
+        class_creation = ExpressionClassCreation(
+            metaclass=makeMetaclassRef(),
+            class_name=node.name,
+            bases=makeBasesRef(),
+            class_dict=ExpressionBuiltinLocalsRef(
+                locals_scope=locals_scope, source_ref=source_ref
+            ),
+            source_ref=source_ref,
+        )
+    else:
+        class_creation = makeExpressionCall(
+            called=makeMetaclassRef(),
+            args=makeExpressionMakeTuple(
+                elements=(
+                    makeConstantRefNode(
+                        constant=node.name,
+                        source_ref=source_ref,
+                        user_provided=True,
+                    ),
+                    makeBasesRef(),
+                    ExpressionBuiltinLocalsRef(
+                        locals_scope=locals_scope, source_ref=source_ref
                     ),
-                    source_ref=source_ref,
-                ),
-                kw=ExpressionTempVariableRef(
-                    variable=tmp_class_decl_dict, source_ref=source_ref
                 ),
                 source_ref=source_ref,
             ),
+            kw=ExpressionTempVariableRef(
+                variable=tmp_class_decl_dict, source_ref=source_ref
+            ),
             source_ref=source_ref,
+        )
+
+    statements += (
+        StatementAssignmentVariable(
+            variable=class_variable, source=class_creation, source_ref=source_ref
         ),
         StatementReturn(expression=class_variable_ref, source_ref=source_ref),
     )
@@ -416,20 +449,21 @@ def buildClassNode3(provider, node, source_ref):
                 )
             )
 
-    statements.append(
-        StatementAssignmentVariable(
-            variable=tmp_class_decl_dict,
-            source=makeDictCreationOrConstant2(
-                keys=[keyword.arg for keyword in keywords],
-                values=[
-                    buildNode(provider, keyword.value, source_ref)
-                    for keyword in keywords
-                ],
+    if not is_simple_class:
+        statements.append(
+            StatementAssignmentVariable(
+                variable=tmp_class_decl_dict,
+                source=makeDictCreationOrConstant2(
+                    keys=[keyword.arg for keyword in keywords],
+                    values=[
+                        buildNode(provider, keyword.value, source_ref)
+                        for keyword in keywords
+                    ],
+                    source_ref=source_ref,
+                ),
                 source_ref=source_ref,
-            ),
-            source_ref=source_ref,
+            )
         )
-    )
 
     if node.keywords and node.keywords[-1].arg is None:
         statements.append(
@@ -477,165 +511,209 @@ def buildClassNode3(provider, node, source_ref):
             builtin_name="type", source_ref=source_ref
         )
 
-    call_prepare = StatementAssignmentVariable(
-        variable=tmp_prepared,
-        source=makeExpressionCall(
-            called=ExpressionAttributeLookup(
-                expression=ExpressionTempVariableRef(
-                    variable=tmp_metaclass, source_ref=source_ref
+    if is_simple_class:
+        if node.bases:
+            statements += (
+                StatementAssignmentVariable(
+                    variable=tmp_metaclass,
+                    source=ExpressionSelectMetaclass(
+                        metaclass=unspecified_metaclass_expression,
+                        bases=makeBasesRef(),
+                        source_ref=source_ref,
+                    ),
+                    source_ref=source_ref_orig,
                 ),
-                attribute_name="__prepare__",
-                source_ref=source_ref,
-            ),
-            args=makeExpressionMakeTuple(
-                elements=(
-                    makeConstantRefNode(
-                        constant=node.name, source_ref=source_ref, user_provided=True
+                StatementAssignmentVariable(
+                    variable=tmp_prepared,
+                    source=ExpressionClassNamespacePrepare(
+                        metaclass=makeMetaclassRef(),
+                        class_name=node.name,
+                        bases=makeBasesRef(),
+                        source_ref=source_ref,
                     ),
-                    makeBasesRef(),
+                    source_ref=source_ref,
                 ),
-                source_ref=source_ref,
-            ),
-            kw=ExpressionTempVariableRef(
-                variable=tmp_class_decl_dict, source_ref=source_ref
-            ),
-            source_ref=source_ref,
-        ),
-        source_ref=source_ref,
-    )
-
-    if python_version >= 0x364:
-        call_prepare = makeStatementsSequenceFromStatements(
-            call_prepare,
-            makeStatementConditional(
-                condition=ExpressionAttributeCheck(
+            )
+        else:
+            # The "__prepare__" of "type" gives an empty dictionary.
+            statements.append(
+                StatementAssignmentVariable(
+                    variable=tmp_prepared,
+                    source=makeConstantRefNode(
+                        constant={}, source_ref=source_ref, user_provided=True
+                    ),
+                    source_ref=source_ref,
+                )
+            )
+    else:
+        call_prepare = StatementAssignmentVariable(
+            variable=tmp_prepared,
+            source=makeExpressionCall(
+                called=ExpressionAttributeLookup(
                     expression=ExpressionTempVariableRef(
-                        variable=tmp_prepared, source_ref=source_ref
+                        variable=tmp_metaclass, source_ref=source_ref
                     ),
-                    attribute_name="__getitem__",
+                    attribute_name="__prepare__",
                     source_ref=source_ref,
                 ),
-                yes_branch=None,
-                no_branch=makeRaiseExceptionExpressionFromTemplate(
-                    exception_type="TypeError",
-                    template="%s.__prepare__() must return a mapping, not %s",
-                    template_args=(
-                        ExpressionBuiltinGetattr(
-                            expression=ExpressionTempVariableRef(
-                                variable=tmp_metaclass, source_ref=source_ref
-                            ),
-                            name=makeConstantRefNode(
-                                constant="__name__", source_ref=source_ref
-                            ),
-                            default=makeConstantRefNode(
-                                constant="<metaclass>", source_ref=source_ref
-                            ),
-                            source_ref=source_ref,
-                        ),
-                        ExpressionAttributeLookup(
-                            expression=ExpressionBuiltinType1(
-                                value=ExpressionTempVariableRef(
-                                    variable=tmp_prepared, source_ref=source_ref
-                                ),
-                                source_ref=source_ref,
-                            ),
-                            attribute_name="__name__",
+                args=makeExpressionMakeTuple(
+                    elements=(
+                        makeConstantRefNode(
+                            constant=node.name,
                             source_ref=source_ref,
+                            user_provided=True,
                         ),
+                        makeBasesRef(),
                     ),
                     source_ref=source_ref,
-                ).asStatement(),
+                ),
+                kw=ExpressionTempVariableRef(
+                    variable=tmp_class_decl_dict, source_ref=source_ref
+                ),
                 source_ref=source_ref,
             ),
+            source_ref=source_ref,
         )
 
-    statements += (
-        StatementAssignmentVariable(
-            variable=tmp_metaclass,
-            source=ExpressionSelectMetaclass(
-                metaclass=ExpressionConditional(
-                    condition=ExpressionDictOperationIn(
-                        key=makeConstantRefNode(
-                            constant="metaclass",
-                            source_ref=source_ref,
-                            user_provided=True,
-                        ),
-                        dict_arg=ExpressionTempVariableRef(
-                            variable=tmp_class_decl_dict, source_ref=source_ref
+        if python_version >= 0x364:
+            call_prepare = makeStatementsSequenceFromStatements(
+                call_prepare,
+                makeStatementConditional(
+                    condition=ExpressionAttributeCheck(
+                        expression=ExpressionTempVariableRef(
+                            variable=tmp_prepared, source_ref=source_ref
                         ),
+                        attribute_name="__getitem__",
                         source_ref=source_ref,
                     ),
-                    expression_yes=ExpressionDictOperationGet(
-                        dict_arg=ExpressionTempVariableRef(
-                            variable=tmp_class_decl_dict, source_ref=source_ref
+                    yes_branch=None,
+                    no_branch=makeRaiseExceptionExpressionFromTemplate(
+                        exception_type="TypeError",
+                        template="%s.__prepare__() must return a mapping, not %s",
+                        template_args=(
+                            ExpressionBuiltinGetattr(
+                                expression=ExpressionTempVariableRef(
+                                    variable=tmp_metaclass, source_ref=source_ref
+                                ),
+                                name=makeConstantRefNode(
+                                    constant="__name__", source_ref=source_ref
+                                ),
+                                default=makeConstantRefNode(
+                                    constant="<metaclass>", source_ref=source_ref
+                                ),
+                                source_ref=source_ref,
+                            ),
+                            ExpressionAttributeLookup(
+                                expression=ExpressionBuiltinType1(
+                                    value=ExpressionTempVariableRef(
+                                        variable=tmp_prepared, source_ref=source_ref
+                                    ),
+                                    source_ref=source_ref,
+                                ),
+                                attribute_name="__name__",
+                                source_ref=source_ref,
+                            ),
                         ),
-                        key=makeConstantRefNode(
-                            constant="metaclass",
+                        source_ref=source_ref,
+                    ).asStatement(),
+                    source_ref=source_ref,
+                ),
+            )
+
+        statements += (
+            StatementAssignmentVariable(
+                variable=tmp_metaclass,
+                source=ExpressionSelectMetaclass(
+                    metaclass=ExpressionConditional(
+                        condition=ExpressionDictOperationIn(
+                            key=makeConstantRefNode(
+                                constant="metaclass",
+                                source_ref=source_ref,
+                                user_provided=True,
+                            ),
+                            dict_arg=ExpressionTempVariableRef(
+                                variable=tmp_class_decl_dict, source_ref=source_ref
+                            ),
                             source_ref=source_ref,
-                            user_provided=True,
                         ),
+                        expression_yes=ExpressionDictOperationGet(
+                            dict_arg=ExpressionTempVariableRef(
+                                variable=tmp_class_decl_dict, source_ref=source_ref
+                            ),
+                            key=makeConstantRefNode(
+                                constant="metaclass",
+                                source_ref=source_ref,
+                                user_provided=True,
+                            ),
+                            source_ref=source_ref,
+                        ),
+                        expression_no=unspecified_metaclass_expression,
                         source_ref=source_ref,
                     ),
-                    expression_no=unspecified_metaclass_expression,
+                    bases=makeBasesRef(),
                     source_ref=source_ref,
                 ),
-                bases=makeBasesRef(),
-                source_ref=source_ref,
-            ),
-            source_ref=source_ref_orig,
-        ),
-        makeStatementConditional(
-            condition=ExpressionDictOperationIn(
-                key=makeConstantRefNode(
-                    constant="metaclass", source_ref=source_ref, user_provided=True
-                ),
-                dict_arg=ExpressionTempVariableRef(
-                    variable=tmp_class_decl_dict, source_ref=source_ref
-                ),
-                source_ref=source_ref,
+                source_ref=source_ref_orig,
             ),
-            no_branch=None,
-            yes_branch=StatementDictOperationRemove(
-                dict_arg=ExpressionTempVariableRef(
-                    variable=tmp_class_decl_dict, source_ref=source_ref
+            makeStatementConditional(
+                condition=ExpressionDictOperationIn(
+                    key=makeConstantRefNode(
+                        constant="metaclass", source_ref=source_ref, user_provided=True
+                    ),
+                    dict_arg=ExpressionTempVariableRef(
+                        variable=tmp_class_decl_dict, source_ref=source_ref
+                    ),
+                    source_ref=source_ref,
                 ),
-                key=makeConstantRefNode(
-                    constant="metaclass", source_ref=source_ref, user_provided=True
+                no_branch=None,
+                yes_branch=StatementDictOperationRemove(
+                    dict_arg=ExpressionTempVariableRef(
+                        variable=tmp_class_decl_dict, source_ref=source_ref
+                    ),
+                    key=makeConstantRefNode(
+                        constant="metaclass", source_ref=source_ref, user_provided=True
+                    ),
+                    source_ref=source_ref,
                 ),
                 source_ref=source_ref,
             ),
-            source_ref=source_ref,
-        ),
-        makeStatementConditional(
-            condition=ExpressionAttributeCheck(
-                expression=ExpressionTempVariableRef(
-                    variable=tmp_metaclass, source_ref=source_ref
+            makeStatementConditional(
+                condition=ExpressionAttributeCheck(
+                    expression=ExpressionTempVariableRef(
+                        variable=tmp_metaclass, source_ref=source_ref
+                    ),
+                    attribute_name="__prepare__",
+                    source_ref=source_ref,
                 ),
-                attribute_name="__prepare__",
-                source_ref=source_ref,
-            ),
-            yes_branch=call_prepare,
-            no_branch=StatementAssignmentVariable(
-                variable=tmp_prepared,
-                source=makeConstantRefNode(
-                    constant={}, source_ref=source_ref, user_provided=True
+                yes_branch=call_prepare,
+                no_branch=StatementAssignmentVariable(
+                    variable=tmp_prepared,
+                    source=makeConstantRefNode(
+                        constant={}, source_ref=source_ref, user_provided=True
+                    ),
+                    source_ref=source_ref,
                 ),
                 source_ref=source_ref,
             ),
-            source_ref=source_ref,
-        ),
+        )
+
+    statements.append(
         StatementAssignmentVariableName(
             provider=provider,
             variable_name=mangleName(node.name, provider),
             source=decorated_body,
             source_ref=source_ref,
-        ),
+        )
     )
 
     if python_version >= 0x340:
         class_creation_function.qualname_setup = node.name, qualname_assign
 
-    final = [tmp_class_decl_dict, tmp_metaclass, tmp_prepared]
+    final = [tmp_prepared]
+    if node.bases or not is_simple_class:
+        final.insert(0, tmp_metaclass)
+    if not is_simple_class:
+        final.insert(0, tmp_class_decl_dict)
     if node.bases:
         final.insert(0, tmp_bases)
         if python_version >= 0x370:
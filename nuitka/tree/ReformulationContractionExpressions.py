@@ -40,11 +40,13 @@ from nuitka.nodes.BuiltinNextNodes import ExpressionBuiltinNext1
 from nuitka.nodes.CodeObjectSpecs import CodeObjectSpec
 from nuitka.nodes.ConditionalNodes import makeStatementConditional
 from nuitka.nodes.ConstantRefNodes import makeConstantRefNode
+from nuitka.nodes.ContainerMakingNodes import ExpressionMakeListPresized
 from nuitka.nodes.ContainerOperationNodes import (
     StatementListOperationAppend,
     StatementSetOperationAdd,
 )
 from nuitka.nodes.DictionaryNodes import (
+    ExpressionMakeDictPresized,
     StatementDictOperationSet,
     StatementDictOperationSetKeyValue,
 )
@@ -121,6 +123,32 @@ def _makeIteratorNext(qual, iterator_ref, source_ref):
         return ExpressionBuiltinNext1(value=iterator_ref, source_ref=source_ref)
 
 
+def _makeContainerCreation(node, start_value, iter_tmp, source_ref):
+    # With only one loop and no conditions, every value of the iterator becomes
+    # one item of the result, so for lists and dicts, we can allocate the room
+    # for them from the start. For sets, there is no API for that.
+    if (
+        python_version >= 0x340
+        and type(start_value) in (list, dict)
+        and len(node.generators) == 1
+        and not node.generators[0].ifs
+        and not getattr(node.generators[0], "is_async", False)
+    ):
+        if type(start_value) is list:
+            node_class = ExpressionMakeListPresized
+        else:
+            node_class = ExpressionMakeDictPresized
+
+        return node_class(
+            iterator=ExpressionTempVariableRef(
+                variable=iter_tmp, source_ref=source_ref
+            ),
+            source_ref=source_ref,
+        )
+
+    return makeConstantRefNode(constant=start_value, source_ref=source_ref)
+
+
 def _getStopIterationName(qual):
     if getattr(qual, "is_async", 0):
         return "StopAsyncIteration"
@@ -419,7 +447,12 @@ def _buildContractionBodyNode(
         statements.append(
             StatementAssignmentVariable(
                 variable=container_tmp,
-                source=makeConstantRefNode(constant=start_value, source_ref=source_ref),
+                source=_makeContainerCreation(
+                    node=node,
+                    start_value=start_value,
+                    iter_tmp=iter_tmp,
+                    source_ref=source_ref,
+                ),
                 source_ref=source_ref.atInternal(),
             )
         )
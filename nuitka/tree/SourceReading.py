@@ -25,7 +25,7 @@ import os
 import re
 import sys
 
-from nuitka import SourceCodeReferences
+from nuitka import Options, SourceCodeReferences
 from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version, python_version_str
@@ -113,11 +113,62 @@ see http://python.org/dev/peps/pep-0263/ for details"""
     return source_code
 
 
-def readSourceCodeFromFilename(module_name, source_filename):
+def _readSourceCodeFromFilename(source_filename):
     if python_version < 0x300:
-        source_code = _readSourceCodeFromFilename2(source_filename)
+        return _readSourceCodeFromFilename2(source_filename)
+    else:
+        return _readSourceCodeFromFilename3(source_filename)
+
+
+# Source filenames to futures of their source code, read in the background.
+_prefetched_source_codes = {}
+_prefetch_executor = None
+
+# Source filenames already read or requested, these are not prefetched again.
+_read_source_filenames = set()
+
+
+def prefetchSourceCode(source_filename):
+    """Start reading the source code of a file in the background.
+
+    Notes:
+        Used for modules that are likely to be followed later, so the file
+        system latency is hidden behind other work. Without thread pool
+        support, e.g. Python2 without backport, this does nothing.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _prefetch_executor
+
+    if source_filename in _read_source_filenames:
+        return
+    _read_source_filenames.add(source_filename)
+
+    if _prefetch_executor is None:
+        try:
+            from concurrent.futures import (  # pylint: disable=I0021,import-error,no-name-in-module
+                ThreadPoolExecutor,
+            )
+        except ImportError:
+            _prefetch_executor = False
+        else:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=Options.getJobLimit())
+
+    if _prefetch_executor is not False:
+        _prefetched_source_codes[source_filename] = _prefetch_executor.submit(
+            _readSourceCodeFromFilename, source_filename
+        )
+
+
+def readSourceCodeFromFilename(module_name, source_filename):
+    _read_source_filenames.add(source_filename)
+    future = _prefetched_source_codes.pop(source_filename, None)
+
+    if future is not None:
+        # Errors are raised here, just as if reading it now.
+        source_code = future.result()
     else:
-        source_code = _readSourceCodeFromFilename3(source_filename)
+        source_code = _readSourceCodeFromFilename(source_filename)
 
     # Allow plug-ins to mess with source code, test framework usages
     # will pass None for module name.
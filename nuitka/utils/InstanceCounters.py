@@ -78,6 +78,11 @@ def counted_del(del_func=empty_del):
         return empty_del
 
 
+def getAliveCount():
+    """Total count of counted instances currently alive."""
+    return sum(counted_inits.values()) - sum(counted_dels.values())
+
+
 def printStats():
     printLine("Init/del/alive calls:")
 
@@ -19,6 +19,8 @@
 
 """
 
+import os
+
 from nuitka.Tracing import printLine
 
 from .Utils import getOS
@@ -80,6 +82,24 @@ def getOwnProcessMemoryUsage():
         return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * factor
 
 
+def getOwnProcessCurrentMemoryUsage():
+    """Current memory usage of own process in bytes.
+
+    Unlike the peak usage, this can also decrease. Where the OS offers no
+    cheap way to get it, this is the peak usage too.
+    """
+
+    if getOS() == "Linux":
+        # Second value is the resident set size, in pages.
+        with open("/proc/self/statm") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    else:
+        # On Windows, this is the current usage already.
+        return getOwnProcessMemoryUsage()
+
+
 def getHumanReadableProcessMemoryUsage(value=None):
     if value is None:
         value = getOwnProcessMemoryUsage()
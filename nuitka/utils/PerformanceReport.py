@@ -0,0 +1,232 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compile time performance report.
+
+Records wall time and memory growth of the phases Nuitka goes through, and
+the wall time of the individual modules inside of them, so it can be written
+as JSON or CSV, to compare it over time and to identify the slowest modules.
+
+The memory growth is that of the Nuitka process itself, child processes, e.g.
+Scons and the C compiler, are not included. On Windows and Linux, it is the
+change of the current memory usage, which can be negative when memory gets
+released. Elsewhere it is the growth of the peak memory usage, as that is what
+the OS gives.
+"""
+
+import csv
+import json
+from timeit import default_timer as timer
+
+from nuitka.containers.odict import OrderedDict
+
+from .MemoryUsage import getOwnProcessCurrentMemoryUsage
+
+_enabled = False
+
+# Phases by name, in order of their first start.
+_phases = OrderedDict()
+
+# Names of phases currently executing, inner most last.
+_active_phases = []
+
+
+def enablePerformanceReport():
+    # singleton, pylint: disable=global-statement
+    global _enabled
+    _enabled = True
+
+
+def isPerformanceReportEnabled():
+    return _enabled
+
+
+class PhaseRecord(object):
+    __slots__ = ("name", "wall_time", "memory_growth", "entered", "module_times")
+
+    def __init__(self, name):
+        self.name = name
+
+        self.wall_time = 0.0
+        self.memory_growth = 0
+
+        # Recursion depth, only the outer most entry is counted.
+        self.entered = 0
+
+        # Module name to wall time spent for it in this phase.
+        self.module_times = {}
+
+    def getSlowestModules(self, count):
+        return sorted(
+            self.module_times.items(), key=lambda item: item[1], reverse=True
+        )[:count]
+
+
+def _getPhaseRecord(name):
+    if name not in _phases:
+        _phases[name] = PhaseRecord(name)
+
+    return _phases[name]
+
+
+class timePhase(object):
+    """Context manager to account the time of a phase.
+
+    If a module name is given, the time is also accounted to the module in
+    that phase. Nested phases are accounted to both, the outer and the inner
+    phase.
+    """
+
+    # Context manager, pylint: disable=invalid-name
+
+    __slots__ = ("phase", "module_name", "start_time", "start_memory")
+
+    def __init__(self, phase_name, module_name=None):
+        if _enabled:
+            self.phase = _getPhaseRecord(phase_name)
+        else:
+            self.phase = None
+
+        self.module_name = module_name
+        self.start_time = None
+        self.start_memory = None
+
+    def __enter__(self):
+        if self.phase is not None:
+            self.phase.entered += 1
+            _active_phases.append(self.phase)
+
+            if self.phase.entered == 1:
+                self.start_memory = getOwnProcessCurrentMemoryUsage()
+
+            self.start_time = timer()
+
+    def __exit__(self, exception_type, exception_value, exception_tb):
+        if self.phase is not None:
+            delta_time = timer() - self.start_time
+
+            _active_phases.pop()
+
+            self.phase.entered -= 1
+            if self.phase.entered == 0:
+                self.phase.wall_time += delta_time
+                self.phase.memory_growth += (
+                    getOwnProcessCurrentMemoryUsage() - self.start_memory
+                )
+
+            if self.module_name is not None:
+                _addModuleTime(self.phase, self.module_name, delta_time)
+
+
+class timeModule(object):
+    """Context manager to account the time of a module in the current phase."""
+
+    # Context manager, pylint: disable=invalid-name
+
+    __slots__ = ("module_name", "start_time")
+
+    def __init__(self, module_name):
+        self.module_name = module_name
+        self.start_time = None
+
+    def __enter__(self):
+        if _enabled and _active_phases:
+            self.start_time = timer()
+
+    def __exit__(self, exception_type, exception_value, exception_tb):
+        if self.start_time is not None:
+            _addModuleTime(
+                _active_phases[-1], self.module_name, timer() - self.start_time
+            )
+
+
+def _addModuleTime(phase, module_name, delta_time):
+    module_name = str(module_name)
+
+    phase.module_times[module_name] = (
+        phase.module_times.get(module_name, 0.0) + delta_time
+    )
+
+
+def _writeJsonReport(filename, top_count, extra_values):
+    report = OrderedDict(extra_values)
+
+    report["phases"] = [
+        OrderedDict(
+            (
+                ("name", phase.name),
+                ("wall_time", round(phase.wall_time, 6)),
+                ("memory_growth", phase.memory_growth),
+                ("module_count", len(phase.module_times)),
+                (
+                    "slowest_modules",
+                    [
+                        OrderedDict(
+                            (
+                                ("module", module_name),
+                                ("wall_time", round(wall_time, 6)),
+                            )
+                        )
+                        for module_name, wall_time in phase.getSlowestModules(
+                            top_count
+                        )
+                    ],
+                ),
+            )
+        )
+        for phase in _phases.values()
+    ]
+
+    with open(filename, "w") as output:
+        json.dump(report, output, indent=2)
+
+
+def _writeCsvReport(filename, top_count):
+    # Python2 csv module wants binary files, Python3 text files.
+    if str is bytes:
+        output = open(filename, "wb")
+    else:
+        output = open(filename, "w", newline="")
+
+    with output:
+        writer = csv.writer(output)
+
+        writer.writerow(("phase", "module", "wall_time", "memory_growth"))
+
+        for phase in _phases.values():
+            writer.writerow(
+                (phase.name, "", "%.6f" % phase.wall_time, phase.memory_growth)
+            )
+
+            for module_name, wall_time in phase.getSlowestModules(top_count):
+                writer.writerow((phase.name, module_name, "%.6f" % wall_time, ""))
+
+
+def writePerformanceReport(filename, top_count, extra_values):
+    """Write the recorded phases to a file.
+
+    Args:
+        filename: Output filename, ".csv" suffix selects CSV, otherwise JSON.
+        top_count: How many of the slowest modules to list per phase.
+        extra_values: Pairs of values to identify the compilation with, only
+            used for JSON output.
+    """
+
+    if filename.lower().endswith(".csv"):
+        _writeCsvReport(filename, top_count)
+    else:
+        _writeJsonReport(filename, top_count, extra_values)
@@ -191,3 +191,76 @@ try:
     print("FAIL.")
 except ValueError:
     print("OK.")
+
+
+class EqualsAll(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        print("Comparing", self.name, "with", repr(other))
+        return other == 3 or other == "three"
+
+    def __repr__(self):
+        return "<EqualsAll %s>" % self.name
+
+    __hash__ = object.__hash__
+
+
+def switchInt(x):
+    if x == 1:
+        return "one"
+    elif x == 2:
+        return "two"
+    elif x == 3:
+        return "three"
+    elif 4 == x:
+        return "four"
+    elif x == 2:
+        return "two again"
+    else:
+        return "other"
+
+
+def switchStr(x):
+    if x == "one":
+        return 1
+    elif x == "two":
+        return 2
+    elif x == "three":
+        return 3
+    elif x == "four":
+        return 4
+    return None
+
+
+def switchUnassigned(flag):
+    if flag:
+        x = 2
+
+    if x == 1:
+        return "one"
+    elif x == 2:
+        return "two"
+    elif x == 3:
+        return "three"
+    elif x == 4:
+        return "four"
+    else:
+        return "other"
+
+
+print("Switch dispatch over int constants:")
+for value in (1, 2, 3, 4, 5, -1, -2, True, False, 1.0, 3.5, "1", 2 ** 70, EqualsAll("e")):
+    print(repr(value), switchInt(value))
+
+print("Switch dispatch over str constants:")
+for value in ("one", "four", "five", "", b"one", 1, EqualsAll("e")):
+    print(repr(value), switchStr(value))
+
+print("Switch dispatch with subject that may be unassigned:")
+print(switchUnassigned(True))
+try:
+    switchUnassigned(False)
+except UnboundLocalError as e:
+    print("Gives", repr(e))
@@ -388,6 +388,28 @@ except Exception as e:
     print("Too few args", repr(e))
 
 
+class ClassProxy(object):
+    def __init__(self, wrapped):
+        self._wrapped = wrapped
+
+    @property
+    def __class__(self):
+        return type(self._wrapped)
+
+
+def checkProxyInstances():
+    # The answer depends on the proxied value, not only the type of the proxy.
+    for value in (1, "s", 2, "t"):
+        print(
+            "Instance check of proxy for",
+            repr(value),
+            isinstance(ClassProxy(value), int),
+        )
+
+
+checkProxyInstances()
+
+
 def usingIterToCheckIterable(a):
     try:
         iter(a)
@@ -682,3 +704,47 @@ print(all("Nuitka rocks!"))
 print(all("string"))
 print(all(u"unicode"))
 print(all(b"bytes"))
+
+
+def callWithArgCounts(func):
+    def show(call):
+        try:
+            result = call()
+        except Exception as e:  # pylint: disable=broad-except
+            result = type(e).__name__
+
+        print(result, end=" ")
+
+    show(lambda: func())
+    show(lambda: func(9))
+    show(lambda: func(9, 4))
+    show(lambda: func("a,b,c", ","))
+    show(lambda: func([3, 1, 2], 2, 1))
+    show(lambda: func(1, 2, 3, 4))
+    print()
+
+
+print("Calling built-ins with different argument counts:")
+for func in (
+    len,
+    divmod,
+    sorted,
+    getattr,
+    isinstance,
+    max,
+    copysign,
+    "x-y".split,
+    "{}{}".format,
+    [].count,
+    {}.keys,
+    {1: 2}.get,
+    "abc".startswith,
+    int,
+    str,
+    tuple,
+    range,
+    dict,
+    bool,
+    float,
+):
+    callWithArgCounts(func)
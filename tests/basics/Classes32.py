@@ -145,3 +145,43 @@ class someClassWithPrivateArgumentNames:
 
 print(someClassWithPrivateArgumentNames.f.__annotations__)
 print("OK.")
+
+
+def classesWithPrepareResults():
+    class RecordingNamespace(dict):
+        def __setitem__(self, key, value):
+            print("Namespace set", key)
+            dict.__setitem__(self, key, value)
+
+    class PrepareMeta(type):
+        result = RecordingNamespace
+
+        @classmethod
+        def __prepare__(metacls, name, bases):  # @NoSelf
+            print("Prepare for", name, len(bases))
+
+            if metacls.result is RecordingNamespace:
+                return RecordingNamespace()
+            elif metacls.result is ValueError:
+                raise ValueError("prepare failed")
+
+            return metacls.result
+
+    class Base(metaclass=PrepareMeta):
+        pass
+
+    for result in (RecordingNamespace, None, 1, [], ValueError):
+        PrepareMeta.result = result
+
+        try:
+
+            # No keywords, the metaclass comes from the base.
+            class C(Base):
+                value = 1
+
+            print("Created", type(C).__name__, C.value)
+        except Exception as e:  # pylint: disable=broad-except
+            print("Gives", type(e).__name__, e)
+
+
+classesWithPrepareResults()
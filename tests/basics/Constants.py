@@ -21,6 +21,8 @@
 
 from __future__ import print_function
 
+import gc
+
 try:
     long
 except NameError:
@@ -171,3 +173,33 @@ min_signed_long = long(-(2 ** (8 * 8 - 1) - 1) - 1)
 print("Small long", min_signed_long, type(min_signed_long))
 min_signed_long = long(-(2 ** (8 * 4 - 1) - 1) - 1)
 print("Small long", min_signed_long, type(min_signed_long))
+
+
+
+def trace(value):
+    print("Evaluating", value)
+    return value
+
+
+def makeDictionaries(value):
+    d = {"a": trace(1), "b": trace(value), "a": trace(3)}
+    print("Duplicate keys dictionary:", sorted(d.items()), list(d))
+    d["c"] = value
+    del d["b"]
+    print("Changed afterwards:", sorted(d.items()), list(d))
+
+    atomic_tuple = (value, 2)
+    gc.collect()
+
+    print(
+        "Tracking of dictionaries by values:",
+        gc.is_tracked({"a": value, "b": "x"}),
+        gc.is_tracked({"a": 1, "b": None, "c": value}),
+        gc.is_tracked({"a": value, "b": [value]}),
+        gc.is_tracked({"a": atomic_tuple, "b": value}),
+        gc.is_tracked({"a": (1, [value]), "b": 2.0}),
+    )
+
+
+makeDictionaries(2)
+makeDictionaries("value")
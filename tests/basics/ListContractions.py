@@ -113,3 +113,29 @@ def allowedDelOnIteratorVariable(z):
 
 
 print(allowedDelOnIteratorVariable(3))
+
+
+def mutatedWhileIterated():
+    values = [1, 2, 3]
+
+    def grow(x):
+        if len(values) < 6:
+            values.append(x * 10)
+
+        return x
+
+    print("Growing list:", [grow(x) for x in values], values)
+
+    values = [1, 2, 3, 4, 5, 6]
+
+    def shrink(x):
+        values.pop()
+
+        return x
+
+    print("Shrinking list:", [shrink(x) for x in values], values)
+
+    print("Sparse large range:", [x for x in range(10 ** 6) if x % 250000 == 3])
+
+
+mutatedWhileIterated()
@@ -90,3 +90,57 @@ try:
     x = value[1]
 except Exception as e:
     print("Indexing None gives", repr(e))
+
+
+class StrSubclass(str):
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 7
+
+
+def containmentInConstants(value):
+    print("Containment of", repr(value), end=" ")
+
+    try:
+        print(
+            value in (1, "a", 2.5, None, True),
+            value not in [b"b", 3, "c"],
+            value in ("x", "y", "z", "a"),
+            value in (0, 1, 2, 3),
+        )
+    except TypeError as e:
+        print("gives", repr(e))
+
+
+for value in (
+    1,
+    1.0,
+    True,
+    False,
+    0,
+    2.5,
+    "a",
+    u"a",
+    b"b",
+    None,
+    3,
+    StrSubclass("q"),
+    [1],
+    {},
+    (1,),
+):
+    containmentInConstants(value)
+
+
+def containmentKnownShapes(x):
+    s = str(x)
+    i = int(x)
+
+    print("Known shapes", s in ("1", "2", "3"), i in (1, 2.0, True), i not in (5, 6))
+
+
+containmentKnownShapes(1)
+containmentKnownShapes(2)
+containmentKnownShapes(7)
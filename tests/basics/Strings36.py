@@ -0,0 +1,143 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Test string building, formatting, and f-strings.
+
+These are Python3.6 specific constructs, that will give a SyntaxError or
+not be relevant on older versions.
+"""
+
+import locale
+
+
+class StrSubclass(str):
+    def __str__(self):
+        return "str-of-subclass"
+
+    def __format__(self, spec):
+        return "format-of-subclass"
+
+
+class Reporting(object):
+    def __repr__(self):
+        return "<repr>"
+
+    def __str__(self):
+        return "<str>"
+
+    def __format__(self, spec):
+        return "<format %r>" % spec
+
+
+def tryFormat(func):
+    try:
+        return func()
+    except Exception as e:  # pylint: disable=broad-except
+        return type(e).__name__ + ": " + ascii(str(e))
+
+
+def percentFormatting(a, b, c):
+    print("Percent formatting:")
+    print("%s and %s" % (a, b))
+    print("%r and %a" % (a, c))
+    print("%d items, %i more" % (b, b + 1))
+    print("%s%%" % b)
+    print("%s" % StrSubclass("x"))
+    print("%s|%r|%s" % (Reporting(), Reporting(), True))
+    print("%d" % True)
+    print("%d" % 3.7)
+    print("%5s|%-4d|" % (a, b))
+    print(tryFormat(lambda: "%s %s" % (a,)))
+    print(tryFormat(lambda: "%s" % (a, b)))
+    print(tryFormat(lambda: "%d" % a))
+    print(tryFormat(lambda: "%y" % (a,)))
+
+
+percentFormatting("text", 42, "\xe4")
+
+
+def formatMethod(a, b, c):
+    print("Format method:")
+    print("{} and {}".format(a, b))
+    print("{0} and {1}".format(a, b))
+    print("{1} and {0}".format(a, b))
+    print("{0}{0}".format(a))
+    print("{!r} and {!a} and {!s}".format(a, c, b))
+    print("{:>8}|{:05d}|{:.2f}".format(a, b, 1.5))
+    print("{}".format(StrSubclass("x")))
+    print("{!s}".format(StrSubclass("x")))
+    print("{} {!r} {:spec}".format(Reporting(), Reporting(), Reporting()))
+    print("{{literal}} {}".format(b))
+    print("{٣}".format(*range(4)))
+    print(tryFormat(lambda: "{} {}".format(a)))
+    print(tryFormat(lambda: "{0} {}".format(a, b)))
+    print(tryFormat(lambda: "{!x}".format(a)))
+    print(tryFormat(lambda: "{\xb2}".format(a)))
+    print(tryFormat(lambda: "{:d}".format(a)))
+    print(tryFormat(lambda: "{".format(a)))
+
+
+formatMethod("text", 42, "\xe4")
+
+
+def constantFormatting():
+    print("Constant formatting:")
+    print(format(1234567, "n"), format(1234567.5, "n"), "{:n}".format(1234567))
+    print(format(1234567, ","), format(1.5, ".3f"), format("s", ">3"))
+    print(tryFormat(lambda: format("s", "d")))
+
+
+constantFormatting()
+
+try:
+    locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
+except locale.Error:
+    pass
+else:
+    constantFormatting()
+    locale.setlocale(locale.LC_ALL, "C")
+
+
+def buildFormattedStrings(a, b, c):
+    print("Building f-strings:")
+    print(ascii(f"{a}|{b}|{c}"))
+    print(ascii(f"[{a}{b}]"))
+    print(ascii(f"{a:}{c!s}{a!r}"))
+    print(ascii(f"{c}\xe4{a}€{b}\U0001f600"))
+    print(ascii(f"€{a}"), ascii(f"{c}"), ascii(f"{a}\xff"))
+    print(ascii(f"{''}{a}{''}"), ascii(f"{''}"), ascii(f"{''}{''}"))
+
+
+for value in (
+    0,
+    -1,
+    7,
+    2 ** 31,
+    2 ** 62,
+    2 ** 63 - 1,
+    2 ** 63,
+    -(2 ** 63),
+    -(2 ** 63) - 1,
+    2 ** 64,
+    10 ** 40,
+    -(10 ** 40),
+    True,
+):
+    buildFormattedStrings(value, -value, "\U0001f600")
+
+buildFormattedStrings(StrSubclass("s"), 1, Reporting())
+buildFormattedStrings("€", "\xe4", "")
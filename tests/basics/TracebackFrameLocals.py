@@ -0,0 +1,85 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Frames of functions kept by tracebacks, their locals and their release.
+
+Releasing the traceback releases the locals of the frame, also when the frame
+of a function is cached for reuse, and entering the function again works with
+tracebacks still alive or not.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+class Tracked(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "<Tracked %s>" % self.name
+
+    def __del__(self):
+        print("Released", self.name)
+
+
+def raisingFunction(name):
+    value = Tracked(name)
+    other = len(name)
+
+    raise ValueError(value, other)
+
+
+def getTraceback(name):
+    try:
+        raisingFunction(name)
+    except ValueError:
+        return sys.exc_info()[2]
+
+
+def getFunctionLocals(tb):
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+
+    return sorted(tb.tb_frame.f_locals.items())
+
+
+print("Keeping traceback of first call:")
+tb = getTraceback("first")
+print("Locals:", getFunctionLocals(tb))
+
+print("Releasing traceback:")
+del tb
+print("Released traceback.")
+
+print("Entering again, keeping traceback:")
+tb = getTraceback("second")
+
+print("Entering again, while traceback is alive:")
+tb2 = getTraceback("third")
+
+print("Locals of both:", getFunctionLocals(tb), getFunctionLocals(tb2))
+
+print("Releasing tracebacks:")
+del tb
+del tb2
+print("Released tracebacks.")
+
+print("Entering again, without keeping traceback:")
+getTraceback("fourth")
+print("Done.")
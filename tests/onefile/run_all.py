@@ -71,7 +71,9 @@ def main():
 
     python_version = setup(needs_io_encoding=True)
 
-    search_mode = createSearchMode()
+    # The results of test cases are checked after comparing them, so they
+    # cannot be executed concurrently later.
+    search_mode = createSearchMode(allow_jobs=False)
 
     for filename in sorted(os.listdir(".")):
         if not filename.endswith(".py"):
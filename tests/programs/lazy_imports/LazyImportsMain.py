@@ -0,0 +1,70 @@
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules of "lazy_package" get deferred module bodies when compiled, and
+must behave as if imported normally.
+
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import types
+
+import lazy_package.simple
+
+print("Is module type:", type(lazy_package.simple) is types.ModuleType)
+print("Module class:", lazy_package.simple.__class__ is types.ModuleType)
+print("First access:", lazy_package.simple.value)
+print("Function:", lazy_package.simple.getValue())
+
+for count in range(2):
+    try:
+        import lazy_package.failing
+
+        print("Failing value:", lazy_package.failing.value)
+    except ValueError as e:
+        print("Failing attempt", count, "gave", repr(e))
+        print("Failing in sys.modules:", "lazy_package.failing" in sys.modules)
+
+import lazy_package.slow
+
+results = []
+
+
+def accessSlow():
+    results.append(lazy_package.slow.value)
+
+
+threads = [threading.Thread(target=accessSlow) for _count in range(4)]
+
+for thread in threads:
+    thread.start()
+
+for thread in threads:
+    thread.join()
+
+print("Threaded first access:", results)
+
+# Python2 has a global import lock, and this deadlocks there.
+if sys.version_info >= (3,):
+    import lazy_package.spawning
+
+    print("Access from thread of module body:", lazy_package.spawning.value)
+else:
+    print("Access from thread of module body:", 42)
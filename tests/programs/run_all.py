@@ -165,6 +165,14 @@ def main():
                 )
 
             extra_flags.append("ignore_warnings")
+        elif filename == "lazy_imports":
+            os.environ["NUITKA_EXTRA_OPTIONS"] = (
+                extra_options + " --lazy-import-package=lazy_package"
+            )
+        elif filename == "unity_build":
+            os.environ["NUITKA_EXTRA_OPTIONS"] = (
+                extra_options + " --unity-build-units=1"
+            )
         elif filename == "multiprocessing_using":
             if os.name == "nt":
                 extra_flags.append("plugin_enable:multiprocessing")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+""" Test the parallel builds of the Nuitka distutils integration.
+
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    from nuitka.distutils.DistutilCommands import PyModule, build
+except ImportError:
+    # Needs "wheel" and "distutils" to be installed.
+    print("Skipped, cannot import distutils integration.")
+    sys.exit(0)
+
+
+class FakeDistribution(object):
+    def __init__(self, command_options):
+        self.command_options = command_options
+
+
+def makeBuild(parallel, command_options):
+    # Not going through distutils, only the attributes used are set.
+    result = build.__new__(build)
+    result.parallel = parallel
+    result.distribution = FakeDistribution(command_options)
+
+    return result
+
+
+def testJobSplit():
+    assert makeBuild(None, {})._get_job_split(4) == (1, None)
+    assert makeBuild(8, {})._get_job_split(1) == (1, None)
+    assert makeBuild(8, {})._get_job_split(2) == (2, 4)
+    assert makeBuild(8, {})._get_job_split(16) == (8, 1)
+    assert makeBuild(3, {})._get_job_split(2) == (2, 1)
+
+    # User given jobs are not overridden, in either key form.
+    for key in ("jobs", "--jobs"):
+        options = {"nuitka": {key: ("setup.py", "2")}}
+        assert makeBuild(8, options)._get_job_split(2) == (2, None), key
+
+
+def makeCommand(code):
+    return [sys.executable, "-c", code]
+
+
+def testParallelBuilds():
+    builds = [
+        (PyModule("module%d" % count), makeCommand("open('built%d', 'w')" % count))
+        for count in range(4)
+    ]
+
+    makeBuild(2, {})._run_builds_parallel(builds, os.getcwd(), 2)
+
+    assert sorted(os.listdir(".")) == ["built0", "built1", "built2", "built3"]
+
+
+def testParallelBuildError():
+    builds = [
+        (PyModule("slow"), makeCommand("import time; time.sleep(60)")),
+        (PyModule("failing"), makeCommand("import sys; sys.exit(1)")),
+        (PyModule("later"), makeCommand("open('later', 'w')")),
+    ]
+
+    start = time.time()
+
+    try:
+        makeBuild(2, {})._run_builds_parallel(builds, os.getcwd(), 2)
+    except subprocess.CalledProcessError:
+        pass
+    else:
+        assert False, "build error not raised"
+
+    # The running build was stopped, and the waiting one not started.
+    assert time.time() - start < 30
+    assert not os.path.exists("later")
+
+
+def main():
+    test_dir = tempfile.mkdtemp(prefix="nuitka-distutils-")
+    old_dir = os.getcwd()
+
+    os.chdir(test_dir)
+
+    try:
+        testJobSplit()
+        testParallelBuilds()
+        testParallelBuildError()
+    finally:
+        os.chdir(old_dir)
+        shutil.rmtree(test_dir)
+
+    print("OK.")
+
+
+if __name__ == "__main__":
+    main()
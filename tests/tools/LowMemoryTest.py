@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+""" Test that low memory mode actually releases the trees of modules.
+
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+
+main_code = """
+import released_module
+
+print(released_module.f(3))
+"""
+
+module_code = """
+class C:
+    def m(self, x):
+        return [y * 2 for y in range(x)]
+
+
+def f(x):
+    def g():
+        return x + 1
+
+    return C().m(g())
+"""
+
+
+def main():
+    # Cycles with "__del__" are not collected by Python2, and the memory
+    # counting adds it.
+    if sys.version_info < (3,):
+        print("Skipped, released trees are not collected with Python2.")
+        return
+
+    test_dir = tempfile.mkdtemp(prefix="nuitka-low-memory-")
+
+    try:
+        with open(os.path.join(test_dir, "LowMemoryMain.py"), "w") as output:
+            output.write(main_code)
+        with open(os.path.join(test_dir, "released_module.py"), "w") as output:
+            output.write(module_code)
+
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-m",
+                "nuitka",
+                "--follow-imports",
+                "--low-memory",
+                "--show-memory",
+                "--generate-c-only",
+                "--output-dir=%s" % test_dir,
+                os.path.join(test_dir, "LowMemoryMain.py"),
+            ],
+            stderr=subprocess.STDOUT,
+        ).decode("utf8")
+    finally:
+        shutil.rmtree(test_dir)
+
+    match = re.search(
+        r"Released tree of 'released_module', .*, (\d+) of (\d+) checked nodes",
+        output,
+    )
+    assert match, output
+
+    alive_count, checked_count = int(match.group(1)), int(match.group(2))
+
+    assert checked_count > 0, output
+    assert alive_count == 0, output
+
+    print("OK.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+""" Test that the performance report is written, also for failed compilations.
+
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+main_code = """
+import reported_module
+
+print(reported_module.f(3))
+"""
+
+module_code = """
+def f(x):
+    return [y * 2 for y in range(x)]
+"""
+
+
+def _compileWithReport(test_dir, main_filename):
+    report_filename = os.path.join(test_dir, "report.json")
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "nuitka",
+            "--follow-imports",
+            "--generate-c-only",
+            "--performance-report=%s" % report_filename,
+            "--output-dir=%s" % test_dir,
+            main_filename,
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    output = process.communicate()[0].decode("utf8")
+
+    assert os.path.exists(report_filename), output
+
+    with open(report_filename) as report_file:
+        report = json.load(report_file)
+
+    os.unlink(report_filename)
+
+    return process.returncode, report, output
+
+
+def main():
+    test_dir = tempfile.mkdtemp(prefix="nuitka-performance-report-")
+
+    try:
+        main_filename = os.path.join(test_dir, "PerformanceReportMain.py")
+
+        with open(main_filename, "w") as output:
+            output.write(main_code)
+        with open(os.path.join(test_dir, "reported_module.py"), "w") as output:
+            output.write(module_code)
+
+        exit_code, report, output = _compileWithReport(test_dir, main_filename)
+
+        assert exit_code == 0, output
+        assert report["main_filename"] == main_filename, report
+        assert report["phases"], report
+
+        for phase in report["phases"]:
+            assert phase["wall_time"] >= 0, phase
+            assert type(phase["memory_growth"]) is int, phase
+
+        assert any(
+            module["module"] == "reported_module"
+            for phase in report["phases"]
+            for module in phase["slowest_modules"]
+        ), report
+
+        # Failing compilations still give the phases done so far.
+        with open(main_filename, "a") as output:
+            output.write("print(\n")
+
+        exit_code, report, output = _compileWithReport(test_dir, main_filename)
+
+        assert exit_code != 0, output
+        assert report["main_filename"] == main_filename, report
+        assert report["phases"], report
+    finally:
+        shutil.rmtree(test_dir)
+
+    print("OK.")
+
+
+if __name__ == "__main__":
+    main()
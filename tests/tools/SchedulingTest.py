@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+""" Test the scheduling of test case executions of the test runners.
+
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from nuitka.tools.testing.Scheduling import TestScheduler
+
+# Each command records when it ran, and fails if another one of the same output
+# name is running at that time.
+_command_code = """
+import os, sys, time
+lock_filename = sys.argv[1] + ".lock"
+os.close(os.open(lock_filename, os.O_CREAT | os.O_EXCL))
+with open("order.txt", "a") as order_file:
+    order_file.write(sys.argv[2] + " " + os.environ.get("TEST_VALUE", "") + "\\n")
+time.sleep(0.3)
+os.unlink(lock_filename)
+"""
+
+
+def makeScheduler(jobs, durations):
+    scheduler = TestScheduler(
+        jobs=jobs, durations_filename=os.path.join(os.getcwd(), "durations.json")
+    )
+    scheduler.durations.update(durations)
+
+    return scheduler
+
+
+def addJob(scheduler, results, key, output_name):
+    scheduler.addJob(
+        key=key,
+        command=[sys.executable, "-c", _command_code, output_name, key],
+        output_name=output_name,
+        on_finish=lambda result: results.append((key, result)),
+    )
+
+
+def getOrder():
+    with open("order.txt") as order_file:
+        result = [line.split() for line in order_file]
+
+    os.unlink("order.txt")
+
+    return result
+
+
+def testOrdering():
+    scheduler = makeScheduler(jobs=1, durations={"short": 1.0, "long": 5.0})
+
+    results = []
+    for key in ("short", "unknown", "long"):
+        os.environ["TEST_VALUE"] = key + "_env"
+        addJob(scheduler, results, key, key)
+
+    del os.environ["TEST_VALUE"]
+
+    scheduler.runJobs()
+
+    # Unknown durations first, then longest first, and the environment of the
+    # time the job was added.
+    assert getOrder() == [
+        ["unknown", "unknown_env"],
+        ["long", "long_env"],
+        ["short", "short_env"],
+    ]
+    assert sorted(results) == [("long", 0), ("short", 0), ("unknown", 0)], results
+
+    # Durations are recorded for the next run.
+    scheduler = makeScheduler(jobs=1, durations={})
+    assert sorted(scheduler.durations) == ["long", "short", "unknown"]
+
+
+def testOutputNameConflicts():
+    scheduler = makeScheduler(jobs=3, durations={})
+
+    results = []
+    addJob(scheduler, results, "first", "same")
+    addJob(scheduler, results, "second", "same")
+    addJob(scheduler, results, "third", "other")
+
+    scheduler.runJobs()
+
+    # A job running concurrently with one of the same output name, fails to
+    # create the lock file.
+    assert sorted(results) == [("first", 0), ("second", 0), ("third", 0)], results
+    assert len(getOrder()) == 3
+
+
+def testCwdCapture():
+    scheduler = makeScheduler(jobs=2, durations={})
+
+    results = []
+    os.mkdir("sub")
+    os.chdir("sub")
+    addJob(scheduler, results, "sub", "sub")
+    os.chdir("..")
+
+    scheduler.runJobs()
+
+    assert results == [("sub", 0)], results
+    assert os.path.exists(os.path.join("sub", "order.txt"))
+
+
+def main():
+    test_dir = tempfile.mkdtemp(prefix="nuitka-scheduling-")
+    old_dir = os.getcwd()
+
+    os.chdir(test_dir)
+
+    try:
+        testOrdering()
+        testOutputNameConflicts()
+        testCwdCapture()
+    finally:
+        os.chdir(old_dir)
+        shutil.rmtree(test_dir)
+
+    print("OK.")
+
+
+if __name__ == "__main__":
+    main()
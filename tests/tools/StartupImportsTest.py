@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+""" Test that the startup import report can be written and used again.
+
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+main_code = """
+import startup_package.first
+
+for _count in range(2):
+    try:
+        import startup_package.failing
+    except ZeroDivisionError:
+        print("Failed import as expected.")
+
+import startup_package.second
+
+print(startup_package.first.value + startup_package.second.value)
+"""
+
+package_modules = {
+    "__init__": "",
+    "first": "value = 1\n",
+    "second": "from . import first\n\nvalue = first.value + 1\n",
+    "failing": "value = 1 / 0\n",
+    "unused": "value = 3\n",
+}
+
+
+def _buildAndRun(test_dir, extra_options):
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "nuitka",
+            "--follow-imports",
+            "--remove-output",
+            "--output-dir=%s" % test_dir,
+        ]
+        + extra_options
+        + [os.path.join(test_dir, "StartupImportsMain.py")]
+    )
+
+    return subprocess.check_output(
+        [
+            os.path.join(
+                test_dir,
+                "StartupImportsMain" + (".exe" if os.name == "nt" else ".bin"),
+            )
+        ]
+    )
+
+
+def _readReport(report_filename):
+    with open(report_filename) as report_file:
+        return report_file.read().splitlines()
+
+
+def main():
+    test_dir = tempfile.mkdtemp(prefix="nuitka-startup-imports-")
+
+    try:
+        with open(os.path.join(test_dir, "StartupImportsMain.py"), "w") as output:
+            output.write(main_code)
+
+        os.mkdir(os.path.join(test_dir, "startup_package"))
+        for module_name, module_code in package_modules.items():
+            with open(
+                os.path.join(test_dir, "startup_package", module_name + ".py"), "w"
+            ) as output:
+                output.write(module_code)
+
+        report_filename = os.path.join(test_dir, "report.txt")
+
+        output = _buildAndRun(
+            test_dir, ["--startup-import-report=%s" % report_filename]
+        )
+        report = _readReport(report_filename)
+
+        # Failed imports are reported once only, unused modules not at all.
+        assert report[-4:] == [
+            "startup_package",
+            "startup_package.first",
+            "startup_package.failing",
+            "startup_package.second",
+        ], report
+        assert len(report) == len(set(report)), report
+
+        second_report_filename = os.path.join(test_dir, "report2.txt")
+
+        second_output = _buildAndRun(
+            test_dir,
+            [
+                "--startup-imports-from=%s" % report_filename,
+                "--startup-import-report=%s" % second_report_filename,
+            ],
+        )
+
+        assert second_output == output, (output, second_output)
+        assert _readReport(second_report_filename) == report
+    finally:
+        shutil.rmtree(test_dir)
+
+    print("OK.")
+
+
+if __name__ == "__main__":
+    main()
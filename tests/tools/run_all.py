@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+#     Copyright 2021, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     limitations under the License.
+#
+
+""" Tests of the tools used by Nuitka, e.g. test runners and build helpers.
+
+These are not compiled programs, but scripts that exercise the tools with the
+Python given, and fail with an assertion or non-zero exit if they misbehave.
+
+"""
+
+import os
+import sys
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    ),
+)
+
+# isort:start
+
+import subprocess
+
+from nuitka.tools.testing.Common import (
+    createSearchMode,
+    decideFilenameVersionSkip,
+    my_print,
+    setup,
+)
+
+
+def main():
+    setup(suite="tools")
+
+    # These are quick, and some of them use jobs themselves.
+    search_mode = createSearchMode(allow_jobs=False)
+
+    for filename in sorted(os.listdir(".")):
+        if not filename.endswith(".py") or filename.startswith("run_"):
+            continue
+
+        if not decideFilenameVersionSkip(filename):
+            continue
+
+        active = search_mode.consider(dirname=None, filename=filename)
+
+        if active:
+            my_print("Consider", filename, end=" ")
+
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.path.abspath(os.path.join("..", ".."))
+
+            result = subprocess.call([os.environ["PYTHON"], filename], env=env)
+
+            if result != 0:
+                my_print("FAIL.")
+                search_mode.onErrorDetected("Error exit! %s" % result)
+            else:
+                my_print("OK.")
+
+            if search_mode.abortIfExecuted():
+                break
+
+    search_mode.finish()
+
+
+if __name__ == "__main__":
+    main()